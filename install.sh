@@ -19,6 +19,7 @@ sudo apt-get install -y \
     git \
     python3-pip \
     python3-pyqt5 \
+    python3-dbus \
     python3-dev \
     libjpeg-dev \
     zlib1g-dev \
@@ -3,12 +3,15 @@ Konfigurationsmanager für Picture Frame
 """
 import yaml
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any
 
 class ConfigManager:
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = Path(config_path)
+        # UI- und Webinterface-Thread speichern beide; Änderungen und Schreiben serialisieren
+        self._lock = threading.RLock()
         self.config = self._load_config()
         self._ensure_directories()
     
@@ -99,8 +102,12 @@ class ConfigManager:
                 return default
         return value
     
-    def set(self, key_path: str, value: Any):
-        """Setzt einen Wert in der Konfiguration mit Punkt-Notation"""
+    def get_many(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Holt mehrere Werte (Punkt-Notation -> Default) auf einmal, z.B. für das Laden ganzer Einstellungsseiten"""
+        return {key_path: self.get(key_path, default) for key_path, default in defaults.items()}
+    
+    def _set_value(self, key_path: str, value: Any):
+        """Setzt einen Wert mit Punkt-Notation nur im Speicher"""
         keys = key_path.split('.')
         config = self.config
         for key in keys[:-1]:
@@ -108,12 +115,33 @@ class ConfigManager:
                 config[key] = {}
             config = config[key]
         config[keys[-1]] = value
-        self.save()
+    
+    def set(self, key_path: str, value: Any):
+        """Setzt einen Wert in der Konfiguration mit Punkt-Notation"""
+        with self._lock:
+            self._set_value(key_path, value)
+            self.save()
+    
+    def update(self, values: Dict[str, Any]):
+        """Setzt mehrere Werte (Punkt-Notation -> Wert) und speichert die Datei nur einmal"""
+        if not values:
+            return
+        with self._lock:
+            for key_path, value in values.items():
+                self._set_value(key_path, value)
+            self.save()
     
     def save(self):
-        """Speichert die Konfiguration in die YAML-Datei"""
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self.config, f, default_flow_style=False, allow_unicode=True)
+        """Speichert die Konfiguration atomar in die YAML-Datei (temporäre Datei, dann os.replace)"""
+        with self._lock:
+            data = yaml.dump(self.config, default_flow_style=False, allow_unicode=True).encode('utf-8')
+            tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # Ein abgebrochener Schreibvorgang (z.B. Stromausfall) lässt die alte config.yaml unversehrt
+            os.replace(tmp_path, self.config_path)
     
     def get_all(self) -> Dict[str, Any]:
         """Gibt die komplette Konfiguration zurück"""
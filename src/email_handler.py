@@ -11,6 +11,7 @@ import smtplib
 from pathlib import Path
 import logging
 from typing import List, Tuple, Optional
+import socket
 import ssl
 
 logger = logging.getLogger(__name__)
@@ -23,8 +24,19 @@ class EmailHandler:
         self.password = password
         self.client = None
     
+    @classmethod
+    def test_login(cls, server: str, port: int, username: str, password: str) -> bool:
+        """Prüft die Zugangsdaten; die Testverbindung wird danach sofort wieder abgemeldet"""
+        handler = cls(server, port, username, password)
+        try:
+            return handler.connect()
+        finally:
+            handler.disconnect()
+    
     def connect(self) -> bool:
-        """Verbindet zum IMAP-Server"""
+        """Verbindet zum IMAP-Server (eine bestehende, noch gültige Verbindung wird weiterverwendet)"""
+        if self.client is not None and self.ping():
+            return True
         try:
             ssl_context = ssl.create_default_context()
             self.client = imapclient.IMAPClient(self.server, port=self.port, ssl=True, ssl_context=ssl_context)
@@ -36,6 +48,58 @@ class EmailHandler:
             logger.error(f"Fehler beim Verbinden mit Email-Server: {e}")
             return False
     
+    def ping(self) -> bool:
+        """Prüft die bestehende Verbindung per NOOP; bei Fehlern wird sie verworfen"""
+        if not self.client:
+            return False
+        try:
+            self.client.noop()
+            return True
+        except Exception as e:
+            logger.info(f"IMAP-Verbindung nicht mehr gültig: {e}")
+            self.disconnect()
+            return False
+    
+    def supports_idle(self) -> bool:
+        """Prüft, ob der verbundene Server IMAP IDLE unterstützt"""
+        if not self.client:
+            return False
+        try:
+            return self.client.has_capability('IDLE')
+        except Exception:
+            return False
+    
+    def wait_for_new_mail(self, timeout: float) -> bool:
+        """
+        Wartet per IMAP IDLE bis zu timeout Sekunden auf neue Nachrichten
+        
+        Returns:
+            True, wenn der Server neue Nachrichten gemeldet hat
+        """
+        if not self.client:
+            return False
+        try:
+            self.client.idle()
+            try:
+                responses = self.client.idle_check(timeout=timeout)
+            finally:
+                self.client.idle_done()
+        except Exception as e:
+            logger.info(f"IMAP IDLE unterbrochen: {e}")
+            self.disconnect()
+            return False
+        return any(len(response) > 1 and response[1] in (b'EXISTS', b'RECENT') for response in responses)
+    
+    def interrupt(self):
+        """Bricht ein blockierendes IDLE aus einem anderen Thread ab (schließt den Socket)"""
+        client = self.client
+        if client is None:
+            return
+        try:
+            client.socket().shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+    
     def disconnect(self):
         """Trennt die Verbindung zum IMAP-Server"""
         if self.client:
@@ -6,6 +6,9 @@ from PIL import Image
 from pathlib import Path
 import hashlib
 import logging
+import mmap
+import os
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -109,15 +112,101 @@ class ImageProcessor:
         
         return img
     
+    # Bis zu dieser Größe wird die Datei per mmap in einem Stück gehasht, größere blockweise
+    MMAP_HASH_LIMIT = 64 * 1024 * 1024
+    
     def _get_file_hash(self, file_path: Path) -> str:
-        """Erstellt einen Hash-Wert für die Datei"""
+        """Erstellt einen Hash-Wert für die Datei (per mmap ohne Kopien in den User-Space)"""
         hash_md5 = hashlib.md5()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if 0 < size <= self.MMAP_HASH_LIMIT:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    hash_md5.update(mapped)
+            else:
+                with os.fdopen(os.dup(fd), 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        hash_md5.update(chunk)
+        finally:
+            os.close(fd)
         return hash_md5.hexdigest()
     
+    def _get_file_hash_fast(self, file_path: Path, sample_size: int = 128 * 1024) -> str:
+        """
+        Erstellt einen schnellen Stichproben-Hash (nur zur Wiedererkennung, nicht kryptografisch)
+        
+        Liest nur Anfang, Mitte und Ende der Datei und bezieht die Dateigröße mit ein
+        (wie imohash); kleine Dateien werden vollständig gehasht.
+        """
+        size = file_path.stat().st_size
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(str(size).encode('ascii'))
+        with open(file_path, 'rb') as f:
+            if size <= 3 * sample_size:
+                hasher.update(f.read())
+            else:
+                for offset in (0, (size - sample_size) // 2, size - sample_size):
+                    f.seek(offset)
+                    hasher.update(f.read(sample_size))
+        return hasher.hexdigest()
+    
     def is_supported(self, file_path: Path) -> bool:
         """Prüft, ob das Dateiformat unterstützt wird"""
         return file_path.suffix.lower() in self.supported_formats
 
+def walk_files(root: Path):
+    """Liefert rekursiv alle Dateien unter root als os.DirEntry (Typ kommt aus dem Verzeichniseintrag, kein extra stat)"""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Verzeichnis nicht lesbar: {e}")
+
+def find_original_file(original_dir: Path, proxy_hash: str, image_metadata: dict,
+                       image_processor: ImageProcessor) -> Optional[Path]:
+    """
+    Findet die Original-Datei zu einem Proxy
+    
+    Nutzt den beim Import gespeicherten 'original_path' (geprüft über Größe und Stichproben-Hash);
+    nur wenn dieser fehlt oder dort nicht mehr dasselbe Bild liegt, wird das Original-Verzeichnis durchsucht (Kandidaten mit abweichender
+    'orig_size' werden übersprungen, mit 'orig_fast_hash' genügt ein Stichproben-Hash statt MD5).
+    """
+    orig_size = image_metadata.get('orig_size')
+    fast_hash = image_metadata.get('orig_fast_hash')
+    
+    def matches(orig_file: Path, size: int) -> bool:
+        if orig_size is not None and size != orig_size:
+            return False
+        if fast_hash:
+            return image_processor._get_file_hash_fast(orig_file) == fast_hash
+        return image_processor._get_file_hash(orig_file) == proxy_hash
+    
+    # Gespeicherten Pfad nur übernehmen, wenn dort noch dasselbe Bild liegt
+    # (der Name kann nach externem Löschen/Umbenennen neu vergeben worden sein)
+    original_path = image_metadata.get('original_path')
+    if original_path:
+        candidate = Path(original_path)
+        try:
+            if candidate.is_file() and matches(candidate, candidate.stat().st_size):
+                return candidate
+        except OSError as e:
+            logger.warning(f"Fehler beim Prüfen von {candidate}: {e}")
+    
+    if not original_dir.exists():
+        return None
+    for entry in walk_files(original_dir):
+        try:
+            if matches(Path(entry.path), entry.stat(follow_symlinks=False).st_size):
+                return Path(entry.path)
+        except Exception as e:
+            logger.warning(f"Fehler beim Prüfen von {entry.path}: {e}")
+    return None
@@ -9,15 +9,27 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QStackedWidget, QMessageBox, QFileDialog, QDialog,
                              QLineEdit, QSpinBox, QDoubleSpinBox, QCheckBox, QTextEdit, QComboBox,
                              QGridLayout, QScrollArea, QGraphicsOpacityEffect)
-from PyQt5.QtCore import Qt, QTimer, QSize, pyqtSignal, QEvent, QPointF, QRectF, QPropertyAnimation, QEasingCurve, QRect
-from PyQt5.QtGui import QPixmap, QImage, QFont, QPainter, QColor, QPalette, QTouchEvent, QTransform, QPen, QBrush
+from PyQt5.QtCore import Qt, QTimer, QSize, pyqtSignal, QEvent, QPointF, QRectF, QPropertyAnimation, QEasingCurve, QRect, QRunnable, QThreadPool, QObject
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QFont, QPainter, QColor, QPalette, QTouchEvent, QTransform, QPen, QBrush
+try:
+    from PyQt5 import sip
+except ImportError:
+    # Ältere PyQt5-Versionen liefern sip als eigenständiges Modul
+    import sip
 import socket
 import subprocess
-import io
+import math
 import os
+import re
+import struct
+import time
+import threading
 import logging
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import Optional
 from PIL import Image
 from PIL.ExifTags import TAGS
@@ -25,6 +37,8 @@ from PIL.ExifTags import TAGS
 from config_manager import ConfigManager
 from exif_extractor import ExifExtractor
 from playlist_manager import PlaylistManager
+from metadata_cache import MetadataCache
+from wifi_dbus import DBUS_AVAILABLE as WIFI_DBUS_AVAILABLE, connect_wifi, scan_access_points
 
 # Prüfe QR-Code-Library
 try:
@@ -34,12 +48,98 @@ except ImportError:
     QRCODE_AVAILABLE = False
     logging.warning("qrcode library nicht verfügbar. QR-Code wird nicht angezeigt.")
 from slideshow import Slideshow
-from image_processor import ImageProcessor
+from image_processor import ImageProcessor, find_original_file
 from email_handler import EmailHandler
 from file_watcher import FileWatcher
 
 logger = logging.getLogger(__name__)
 
+# Farben des dunklen Hintergrunds, einmalig erstellt (statt QColor("#...") pro Widget)
+_BG_COLOR = QColor(0x1a, 0x1a, 0x2e)  # #1a1a2e
+_FG_COLOR = QColor(0xff, 0xff, 0xff)  # #ffffff
+
+# nmcli -t trennt Felder mit ':' und maskiert ':' und '\' innerhalb von Werten als '\:' bzw. '\\'
+# (ein Feld ist eine Folge aus Escape-Paaren und sonstigen Zeichen außer ':' - auch 'foo\\:' endet korrekt)
+_NMCLI_FIELD = re.compile(r'(?:\\.|[^\\:])*')
+_NMCLI_ESCAPE = re.compile(r'\\(.)')
+_NMCLI_FIELD_BYTES = re.compile(rb'(?:\\.|[^\\:])*')
+_NMCLI_ESCAPE_BYTES = re.compile(rb'\\(.)')
+
+def _nmcli_tokenize(field_re, line, maxsplit: int):
+    """Zerlegt eine nmcli-Zeile an nicht maskierten ':' (Werte bleiben maskiert, wie re.split mit maxsplit)"""
+    fields = []
+    pos = 0
+    while True:
+        if maxsplit and len(fields) == maxsplit:
+            fields.append(line[pos:])
+            return fields
+        end = field_re.match(line, pos).end()
+        fields.append(line[pos:end])
+        if end >= len(line):
+            return fields
+        pos = end + 1  # Trennzeichen ':' überspringen
+
+def _nmcli_split(line: str, maxsplit: int = 0) -> list:
+    """Zerlegt eine nmcli -t Zeile in ihre (noch maskierten) Felder"""
+    return _nmcli_tokenize(_NMCLI_FIELD, line, maxsplit)
+
+def _nmcli_unescape(value: str) -> str:
+    """Entfernt die nmcli-Maskierung ('\\x' -> 'x') in einem Feldwert"""
+    return _NMCLI_ESCAPE.sub(r'\1', value)
+
+def _nmcli_split_bytes(line: bytes, maxsplit: int = 0) -> list:
+    """Wie _nmcli_split, aber für undekodierte nmcli-Ausgabe"""
+    return _nmcli_tokenize(_NMCLI_FIELD_BYTES, line, maxsplit)
+
+def _nmcli_unescape_bytes(value: bytes) -> bytes:
+    """Wie _nmcli_unescape, aber für undekodierte nmcli-Ausgabe"""
+    return _NMCLI_ESCAPE_BYTES.sub(rb'\1', value)
+
+# Uhrzeit HH:MM (wie strptime '%H:%M' auch mit einstelligen Stunden/Minuten)
+_HHMM_RE = re.compile(r'([01]?\d|2[0-3]):[0-5]?\d')
+
+def _xset(*args: str) -> subprocess.CompletedProcess:
+    """Führt xset mit den angegebenen Optionen aus (DISPLAY fällt auf :0 zurück)"""
+    env = os.environ.copy()
+    env['DISPLAY'] = env.get('DISPLAY', ':0')
+    return subprocess.run(['xset', *args], env=env, capture_output=True, text=True, timeout=5)
+
+def _alive(widget) -> bool:
+    """Prüft, ob ein Widget existiert und sein C++-Objekt noch nicht gelöscht wurde (ohne Exception)"""
+    return widget is not None and not sip.isdeleted(widget)
+
+# Stylesheets der Meldungsfenster (einmal als Konstanten statt bei jeder Meldung neu zusammengesetzt)
+_MSGBOX_BASE_QSS = ("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
+                    "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } ")
+_MSGBOX_INFO_QSS = _MSGBOX_BASE_QSS + (
+    "QPushButton { background-color: #3498db; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
+    "QPushButton:hover { background-color: #2980b9; }")
+_MSGBOX_ERROR_QSS = _MSGBOX_BASE_QSS + (
+    "QPushButton { background-color: #e74c3c; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
+    "QPushButton:hover { background-color: #c0392b; }")
+_MSGBOX_WARNING_QSS = _MSGBOX_BASE_QSS + (
+    "QPushButton { background-color: #f39c12; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
+    "QPushButton:hover { background-color: #e67e22; }")
+
+def _line_edit_mouse_press(owner, edit, event):
+    """Gemeinsamer mousePressEvent-Handler der Eingabefelder"""
+    QLineEdit.mousePressEvent(edit, event)
+    QTimer.singleShot(200, lambda: owner.show_system_keyboard(edit) if _alive(edit) else None)
+
+def _install_keyboard_on_click(owner, edit: QLineEdit):
+    """Öffnet die Touch-Tastatur von owner kurz nach einem Klick in das Eingabefeld"""
+    edit.mousePressEvent = partial(_line_edit_mouse_press, owner, edit)
+
+def _styled_msgbox(parent, icon, title: str, text: str, qss: str = _MSGBOX_INFO_QSS) -> QMessageBox:
+    """Erstellt ein Meldungsfenster im dunklen Stil der Anwendung"""
+    msg = QMessageBox(parent)
+    msg.setIcon(icon)
+    msg.setWindowTitle(title)
+    msg.setText(text)
+    msg.setStyleSheet(qss)
+    return msg
+
+
 class SlideshowWidget(QWidget):
     """Haupt-Slideshow-Widget mit Touch-Gesten"""
     previous_requested = pyqtSignal()
@@ -62,10 +162,20 @@ class SlideshowWidget(QWidget):
         
         # Touch-Gesten Variablen
         self.touch_points = {}  # Dictionary für Touch-Punkte
-        self.initial_distance = 0.0
+        self.initial_distance_sq = 0.0
         self.initial_zoom = 1.0
         self.initial_pan = QPointF(0, 0)
         
+        # Neuzeichnen während Touch-Gesten auf max. ~60 Hz bündeln
+        self._redraw_timer = QTimer()
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self.update_displayed_image)
+        
+        # Zuletzt gesetzte Overlay-Geometrien (vermeidet unnötige Relayouts)
+        self._last_info_geom = None
+        self._last_info_bar_geom = None
+        self._last_resize_size: Optional[QSize] = None
+        
         # Pause-Variablen
         self.is_paused = False
         self.info_bar_visible = False
@@ -78,6 +188,13 @@ class SlideshowWidget(QWidget):
         self.is_fading = False
         self.next_pixmap = None  # Nächstes Bild für Fade-Übergang
         
+        # Platzhalter-Pixmap wird einmal erzeugt und wiederverwendet
+        self._placeholder_pixmap: Optional[QPixmap] = None
+        
+        # Fertig komponierte Anzeige-Pixmaps (ohne Zoom/Pan) je Bild und Widget-Größe, LRU mit max. 3 Einträgen
+        self._prepared_pixmaps: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._prepared_pixmaps_max = 3
+        
         # Metadaten-Pfad
         self.metadata_file = Path(self.config.get('paths.proxy_images')) / 'metadata.json'
         
@@ -345,30 +462,39 @@ class SlideshowWidget(QWidget):
         if widget_size.width() <= 0 or widget_size.height() <= 0:
             widget_size = self.size()
         
-        # Skaliertes Pixmap erstellen (ohne Zoom für nächstes Bild)
-        scaled_pixmap = pixmap.scaled(
-            widget_size.width(),
-            widget_size.height(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        # Auf Widget-Größe skaliertes Pixmap (ohne Zoom für nächstes Bild)
+        display_pixmap = self._get_prepared_pixmap(pixmap, widget_size.width(), widget_size.height(), fit=True)
+        self.next_image_label.setPixmap(display_pixmap)
+    
+    def _get_prepared_pixmap(self, pixmap: QPixmap, width: int, height: int, fit: bool) -> QPixmap:
+        """Liefert das zentrierte Anzeige-Pixmap in Widget-Größe (aus dem LRU-Cache, falls vorhanden)"""
+        key = (pixmap.cacheKey(), width, height, fit)
+        cached = self._prepared_pixmaps.get(key)
+        if cached is not None:
+            self._prepared_pixmaps.move_to_end(key)
+            return cached
+        
+        if fit:
+            scaled_pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        else:
+            scaled_pixmap = pixmap
         
         # Pixmap für Anzeige erstellen (Widget-Größe)
-        display_pixmap = QPixmap(widget_size)
+        display_pixmap = QPixmap(width, height)
         display_pixmap.fill(QColor(0, 0, 0))  # Schwarzer Hintergrund
         
+        # Kein SmoothPixmapTransform nötig: das Bild wird unskaliert an Ganzzahl-Koordinaten gezeichnet
         painter = QPainter(display_pixmap)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        
-        # Berechne Position für zentriertes Bild
-        x = (widget_size.width() - scaled_pixmap.width()) / 2
-        y = (widget_size.height() - scaled_pixmap.height()) / 2
-        
-        # Zeichne das skalierte Bild
+        # Zeichne das Bild zentriert
+        x = (width - scaled_pixmap.width()) / 2
+        y = (height - scaled_pixmap.height()) / 2
         painter.drawPixmap(int(x), int(y), scaled_pixmap)
         painter.end()
         
-        self.next_image_label.setPixmap(display_pixmap)
+        self._prepared_pixmaps[key] = display_pixmap
+        if len(self._prepared_pixmaps) > self._prepared_pixmaps_max:
+            self._prepared_pixmaps.popitem(last=False)
+        return display_pixmap
     
     def _on_fade_finished(self):
         """Wird aufgerufen, wenn Fade-Animation abgeschlossen ist"""
@@ -407,16 +533,7 @@ class SlideshowWidget(QWidget):
     
     def get_image_metadata(self, image_hash: str) -> dict:
         """Lädt Metadaten für ein Bild"""
-        if not self.metadata_file.exists():
-            return {}
-        
-        try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-                return metadata.get(image_hash, {})
-        except Exception as e:
-            logger.error(f"Fehler beim Laden der Metadaten: {e}")
-            return {}
+        return MetadataCache.for_file(self.metadata_file).get(image_hash)
     
     def get_exif_date(self, image_path: Path) -> Optional[str]:
         """Extrahiert das Erstellungsdatum aus EXIF-Daten des Originalbilds"""
@@ -426,11 +543,10 @@ class SlideshowWidget(QWidget):
             image_hash = image_path.stem
             
             # Suche nach Originalbild mit gleichem Hash
+            processor = ImageProcessor()
             for orig_file in original_dir.glob('*'):
                 if orig_file.is_file():
                     try:
-                        from image_processor import ImageProcessor
-                        processor = ImageProcessor()
                         orig_hash = processor._get_file_hash(orig_file)
                         if orig_hash == image_hash:
                             # Originalbild gefunden, EXIF-Daten extrahieren
@@ -541,10 +657,7 @@ class SlideshowWidget(QWidget):
                 self.date_label.setText(date_label_text)
             
             # Positioniere Info-Bar unten
-            width = self.width()
-            height = self.height()
-            bar_height = 60
-            self.info_bar.setGeometry(0, height - bar_height, width, bar_height)
+            self._set_info_bar_geometry(self.width(), self.height())
             self.info_bar.show()
             self.info_bar.raise_()
     
@@ -663,46 +776,28 @@ class SlideshowWidget(QWidget):
                 original_dir = Path(self.config.get('paths.original_images'))
                 
                 # Proxy-Datei löschen
-                image_path.unlink()
+                image_path.unlink(missing_ok=True)
                 logger.info(f"Proxy-Datei gelöscht: {image_path.name}")
                 
-                # Original-Datei finden und löschen
+                # Original-Datei finden (über gespeicherten Pfad, sonst Suche) und löschen
+                orig_file = find_original_file(original_dir, proxy_hash, self.get_image_metadata(proxy_hash),
+                                               ImageProcessor())
                 original_found = False
-                if original_dir.exists():
-                    for orig_file in original_dir.rglob("*"):
-                        if orig_file.is_file():
-                            try:
-                                from image_processor import ImageProcessor
-                                image_processor = ImageProcessor()
-                                orig_hash = image_processor._get_file_hash(orig_file)
-                                if orig_hash == proxy_hash:
-                                    orig_file.unlink()
-                                    logger.info(f"Original-Datei gelöscht: {orig_file.name}")
-                                    original_found = True
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Fehler beim Prüfen von {orig_file}: {e}")
-                                continue
+                if orig_file is not None:
+                    orig_file.unlink(missing_ok=True)
+                    logger.info(f"Original-Datei gelöscht: {orig_file.name}")
+                    original_found = True
                 
                 if not original_found:
                     logger.warning(f"Original-Datei für {image_path.name} nicht gefunden (Hash: {proxy_hash})")
                 
                 # Metadaten löschen
                 metadata_file = proxy_dir / 'metadata.json'
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                        if proxy_hash in metadata:
-                            del metadata[proxy_hash]
-                            with open(metadata_file, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                    except Exception as e:
-                        logger.error(f"Fehler beim Löschen der Metadaten: {e}")
+                MetadataCache.for_file(metadata_file).delete(proxy_hash)
                 
                 # Playlists aktualisieren
                 try:
-                    playlist_manager = PlaylistManager(proxy_dir, metadata_file)
+                    playlist_manager = PlaylistManager.for_dir(proxy_dir, metadata_file)
                     playlist_manager.remove_image(proxy_hash)
                 except Exception as e:
                     logger.warning(f"Fehler beim Aktualisieren der Playlists: {e}")
@@ -791,20 +886,31 @@ class SlideshowWidget(QWidget):
         if widget_size.width() <= 0 or widget_size.height() <= 0:
             return
         
-        # Skaliertes Pixmap erstellen
+        if self.zoom_factor == 1.0 and self.pan_offset.isNull():
+            # Ohne Zoom/Pan: vorberechnetes Anzeige-Pixmap wiederverwenden
+            display_pixmap = self._get_prepared_pixmap(
+                self.original_pixmap, widget_size.width(), widget_size.height(), fit=False
+            )
+            self.image_label.setPixmap(display_pixmap)
+            self.image_label.update()
+            return
+        
+        # Skaliertes Pixmap erstellen (während des Verschiebens schnelle Skalierung,
+        # nach dem Loslassen wird einmal in voller Qualität neu gezeichnet)
+        transform = Qt.FastTransformation if self.is_panning else Qt.SmoothTransformation
         scaled_pixmap = self.original_pixmap.scaled(
             int(self.original_pixmap.width() * self.zoom_factor),
             int(self.original_pixmap.height() * self.zoom_factor),
             Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
+            transform
         )
         
         # Pixmap für Anzeige erstellen (Widget-Größe)
         display_pixmap = QPixmap(widget_size)
         display_pixmap.fill(QColor(0, 0, 0))  # Schwarzer Hintergrund
         
+        # Kein SmoothPixmapTransform nötig: scaled_pixmap hat bereits seine Endgröße
         painter = QPainter(display_pixmap)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
         
         # Berechne Position für zentriertes Bild mit Pan-Offset
         x = (widget_size.width() - scaled_pixmap.width()) / 2 + self.pan_offset.x()
@@ -820,20 +926,30 @@ class SlideshowWidget(QWidget):
         self.image_label.update()
         self.image_label.repaint()
     
+    def schedule_displayed_image_update(self):
+        """Plant ein Neuzeichnen im nächsten Frame (bündelt schnelle Touch-Updates)"""
+        # Der Timer zeichnet mit dem dann aktuellen Zoom/Pan-Zustand, der letzte Stand geht also nicht verloren
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start(16)
+    
     def show_placeholder(self):
         """Zeigt einen Platzhalter, wenn keine Bilder vorhanden sind"""
         width = self.config.get('display.width', 1024)
         height = self.config.get('display.height', 600)
-        pixmap = QPixmap(width, height)
-        pixmap.fill(QColor(0, 0, 0))
-        
-        painter = QPainter(pixmap)
-        painter.setPen(QColor(255, 255, 255))
-        font = QFont()
-        font.setPointSize(24)
-        painter.setFont(font)
-        painter.drawText(pixmap.rect(), Qt.AlignCenter, "Keine Bilder vorhanden\n\nBitte Bilder per Email senden")
-        painter.end()
+        pixmap = self._placeholder_pixmap
+        # Nur neu zeichnen, wenn noch kein Platzhalter existiert oder sich die Displaygröße geändert hat
+        if pixmap is None or pixmap.width() != width or pixmap.height() != height:
+            pixmap = QPixmap(width, height)
+            pixmap.fill(QColor(0, 0, 0))
+            
+            painter = QPainter(pixmap)
+            painter.setPen(QColor(255, 255, 255))
+            font = QFont()
+            font.setPointSize(24)
+            painter.setFont(font)
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, "Keine Bilder vorhanden\n\nBitte Bilder per Email senden")
+            painter.end()
+            self._placeholder_pixmap = pixmap
         
         self.image_label.setPixmap(pixmap)
         self.info_label.hide()
@@ -845,16 +961,31 @@ class SlideshowWidget(QWidget):
         if total > 0:
             self.info_label.setText(f"Bild {current} von {total}")
             self.info_label.show()
-            # Position aktualisieren
+            # Position nur aktualisieren, wenn sich die Widget-Größe geändert hat
             width = self.width()
             height = self.height()
             if width > 0 and height > 0:
-                info_width = 200
-                info_height = 40
-                self.info_label.setGeometry(width - info_width - 10, height - info_height - 10, info_width, info_height)
+                self._set_info_label_geometry(width, height)
         else:
             self.info_label.hide()
     
+    def _set_info_label_geometry(self, width: int, height: int):
+        """Positioniert das Info-Label unten rechts (nur bei geänderter Geometrie)"""
+        info_width = 200
+        info_height = 40
+        geom = (width - info_width - 10, height - info_height - 10, info_width, info_height)
+        if geom != self._last_info_geom:
+            self.info_label.setGeometry(*geom)
+            self._last_info_geom = geom
+    
+    def _set_info_bar_geometry(self, width: int, height: int):
+        """Positioniert die Info-Bar unten (nur bei geänderter Geometrie)"""
+        bar_height = 60
+        geom = (0, height - bar_height, width, bar_height)
+        if geom != self._last_info_bar_geom:
+            self.info_bar.setGeometry(*geom)
+            self._last_info_bar_geom = geom
+    
     def on_timer_timeout(self):
         """Wird aufgerufen, wenn der Timer abläuft"""
         try:
@@ -939,7 +1070,7 @@ class SlideshowWidget(QWidget):
         self.is_zoomed = False
         self.is_panning = False
         self.touch_points = {}
-        self.initial_distance = 0.0
+        self.initial_distance_sq = 0.0
     
     def mousePressEvent(self, event):
         """Erkennt Touch/Maus-Klicks für Navigation"""
@@ -967,13 +1098,17 @@ class SlideshowWidget(QWidget):
                 # Lade erstes Bild
                 self.load_current_image(use_fade=True)
                 # Timer neu starten (nur wenn auto_play aktiviert)
-                auto_play = self.config.get('slideshow.auto_play', True)
-                interval = self.config.get('slideshow.interval_seconds', 10) * 1000
-                self.timer.stop()
-                if not self.is_paused and auto_play:
-                    self.timer.start(interval)
+                self._restart_slideshow_timer()
                 logger.info("Zum ersten Bild der Playlist gesprungen (Doppelklick)")
     
+    def _restart_slideshow_timer(self):
+        """Startet den Slideshow-Timer nach manuellem Bildwechsel neu (nur wenn auto_play aktiviert)"""
+        if not self.is_paused and self.config.get('slideshow.auto_play', True):
+            # start() setzt einen laufenden Timer bereits zurück - kein stop() nötig
+            self.timer.start(self.config.get('slideshow.interval_seconds', 10) * 1000)
+        elif self.timer.isActive():
+            self.timer.stop()
+    
     def mouseReleaseEvent(self, event):
         """Erkennt Swipe-Gesten"""
         # Stoppe Long-Press-Timer
@@ -993,22 +1128,14 @@ class SlideshowWidget(QWidget):
                     self.slideshow.previous_image()
                     self.load_current_image(use_fade=True)  # Fade-Übergang bei manuellem Wechsel
                     # Timer mit aktuellem Intervall neu starten (nur wenn auto_play aktiviert)
-                    auto_play = self.config.get('slideshow.auto_play', True)
-                    interval = self.config.get('slideshow.interval_seconds', 10) * 1000
-                    self.timer.stop()
-                    if not self.is_paused and auto_play:
-                        self.timer.start(interval)
+                    self._restart_slideshow_timer()
                     self.previous_requested.emit()
                 else:
                     # Swipe nach links = nächstes Bild
                     self.slideshow.next_image()
                     self.load_current_image(use_fade=True)  # Fade-Übergang bei manuellem Wechsel
                     # Timer mit aktuellem Intervall neu starten (nur wenn auto_play aktiviert)
-                    auto_play = self.config.get('slideshow.auto_play', True)
-                    interval = self.config.get('slideshow.interval_seconds', 10) * 1000
-                    self.timer.stop()
-                    if not self.is_paused and auto_play:
-                        self.timer.start(interval)
+                    self._restart_slideshow_timer()
                     self.next_requested.emit()
             # Wenn kein Swipe, wird Tap-Timer auslösen (falls nicht bereits abgelaufen)
             
@@ -1044,9 +1171,10 @@ class SlideshowWidget(QWidget):
             
             # Wenn 2 Finger: Initialisiere Zoom
             if len(self.touch_points) == 2:
-                points = list(self.touch_points.values())
-                self.initial_distance = self._distance(points[0], points[1])
-                if self.initial_distance > 0:
+                # Entpacken statt list(): keine Listen-Allokation pro Event
+                p1, p2 = self.touch_points.values()
+                self.initial_distance_sq = self._distance_sq(p1, p2)
+                if self.initial_distance_sq > 0:
                     self.initial_zoom = self.zoom_factor
                     self.initial_pan = QPointF(self.pan_offset)
                     self.is_zoomed = True
@@ -1059,18 +1187,18 @@ class SlideshowWidget(QWidget):
             
             # Wenn 2 Finger: Berechne Zoom
             if len(self.touch_points) == 2:
-                points = list(self.touch_points.values())
-                current_distance = self._distance(points[0], points[1])
+                p1, p2 = self.touch_points.values()
+                current_distance_sq = self._distance_sq(p1, p2)
                 
-                if self.initial_distance > 0:
-                    # Berechne Zoom-Faktor
-                    scale = current_distance / self.initial_distance
+                if self.initial_distance_sq > 0:
+                    # Berechne Zoom-Faktor (eine Wurzel aus dem Verhältnis der Quadrate)
+                    scale = math.sqrt(current_distance_sq / self.initial_distance_sq)
                     self.zoom_factor = max(1.0, min(5.0, self.initial_zoom * scale))  # Limit: 1x bis 5x
                     
                     # Berechne Mittelpunkt für Zoom
                     center = QPointF(
-                        (points[0].x() + points[1].x()) / 2,
-                        (points[0].y() + points[1].y()) / 2
+                        (p1.x() + p2.x()) / 2,
+                        (p1.y() + p2.y()) / 2
                     )
                     
                     # Aktualisiere Pan-Offset basierend auf Zoom-Zentrum
@@ -1078,19 +1206,19 @@ class SlideshowWidget(QWidget):
                     offset = center - widget_center
                     self.pan_offset = self.initial_pan + offset * (1 - 1/scale)
                     
-                    self.update_displayed_image()
+                    self.schedule_displayed_image_update()
             
             # Wenn 1 Finger: Pan (Verschieben) - nur wenn bereits gezoomt
             elif len(self.touch_points) == 1 and self.is_zoomed:
-                points = list(self.touch_points.values())
+                (point,) = self.touch_points.values()
                 if not self.is_panning:
                     self.is_panning = True
-                    self.pan_start = points[0]
+                    self.pan_start = point
                 else:
-                    delta = points[0] - self.pan_start
+                    delta = point - self.pan_start
                     self.pan_offset += delta
-                    self.pan_start = points[0]
-                    self.update_displayed_image()
+                    self.pan_start = point
+                    self.schedule_displayed_image_update()
         
         elif event.type() == QEvent.TouchEnd:
             # Entferne beendete Touch-Punkte
@@ -1099,18 +1227,23 @@ class SlideshowWidget(QWidget):
                     if touch_point.id() in self.touch_points:
                         del self.touch_points[touch_point.id()]
             
+            was_panning = self.is_panning
             self.is_panning = False
+            # Letzten Frame in voller Qualität zeichnen (während des Verschiebens: FastTransformation)
+            if was_panning:
+                self._redraw_timer.stop()
+                self.update_displayed_image()
             
             # Wenn keine Touch-Punkte mehr: Zoom bleibt bestehen (wird beim Fortsetzen zurückgesetzt)
             # (Zoom wird beim Fortsetzen der Slideshow zurückgesetzt)
         
         return True
     
-    def _distance(self, p1: QPointF, p2: QPointF) -> float:
-        """Berechnet die Distanz zwischen zwei Punkten"""
+    def _distance_sq(self, p1: QPointF, p2: QPointF) -> float:
+        """Berechnet die quadrierte Distanz zwischen zwei Punkten (ohne Wurzel)"""
         dx = p2.x() - p1.x()
         dy = p2.y() - p1.y()
-        return (dx * dx + dy * dy) ** 0.5
+        return dx * dx + dy * dy
     
     def on_long_press(self):
         """Wird aufgerufen bei langem Drücken (3 Sekunden)"""
@@ -1143,19 +1276,21 @@ class SlideshowWidget(QWidget):
     def resizeEvent(self, event):
         """Wird aufgerufen wenn Widget-Größe sich ändert"""
         super().resizeEvent(event)
-        width = event.size().width()
-        height = event.size().height()
+        # Qt meldet auch Resizes ohne echte Größenänderung (z.B. bei show/hide) - dann nichts tun
+        new_size = event.size()
+        if self._last_resize_size is not None and new_size == self._last_resize_size:
+            return
+        self._last_resize_size = QSize(new_size)
+        width = new_size.width()
+        height = new_size.height()
         
         # Info-Label positionieren (unten rechts)
         if self.info_label.isVisible():
-            info_width = 200
-            info_height = 40
-            self.info_label.setGeometry(width - info_width - 10, height - info_height - 10, info_width, info_height)
+            self._set_info_label_geometry(width, height)
         
         # Info-Bar positionieren (unten)
         if self.info_bar.isVisible():
-            bar_height = 60
-            self.info_bar.setGeometry(0, height - bar_height, width, bar_height)
+            self._set_info_bar_geometry(width, height)
         
         # Nächstes Bild-Label positionieren (absolut über aktuelles Bild)
         if self.image_container:
@@ -1268,15 +1403,7 @@ class ImageManagementWidget(QWidget):
         """Löscht das ausgewählte Bild"""
         current_item = self.image_list.currentItem()
         if not current_item:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Warning)
-            msg.setWindowTitle("Keine Auswahl")
-            msg.setText("Bitte wählen Sie ein Bild aus.")
-            msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                             "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                             "QPushButton { background-color: #f39c12; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                             "QPushButton:hover { background-color: #e67e22; }")
-            msg.exec_()
+            _styled_msgbox(self, QMessageBox.Warning, "Keine Auswahl", "Bitte wählen Sie ein Bild aus.", _MSGBOX_WARNING_QSS).exec_()
             return
         
         reply = QMessageBox.question(
@@ -1289,60 +1416,148 @@ class ImageManagementWidget(QWidget):
             proxy_path = Path(current_item.data(Qt.UserRole))
             try:
                 proxy_hash = proxy_path.stem
-                proxy_path.unlink()
+                proxy_path.unlink(missing_ok=True)
+                proxy_dir = Path(self.config.get('paths.proxy_images'))
+                metadata_file = proxy_dir / 'metadata.json'
+                metadata_cache = MetadataCache.for_file(metadata_file)
                 # Original auch löschen, falls gefunden
                 original_dir = Path(self.config.get('paths.original_images'))
-                for orig_file in original_dir.rglob("*"):
-                    if orig_file.is_file() and self.image_processor._get_file_hash(orig_file) == proxy_hash:
-                        orig_file.unlink()
-                        break
+                orig_file = find_original_file(original_dir, proxy_hash, metadata_cache.get(proxy_hash),
+                                               self.image_processor)
+                if orig_file is not None:
+                    orig_file.unlink(missing_ok=True)
                 
                 # Metadaten löschen
-                proxy_dir = Path(self.config.get('paths.proxy_images'))
-                metadata_file = proxy_dir / 'metadata.json'
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                        if proxy_hash in metadata:
-                            del metadata[proxy_hash]
-                            with open(metadata_file, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                    except Exception as e:
-                        logger.error(f"Fehler beim Löschen der Metadaten: {e}")
+                metadata_cache.delete(proxy_hash)
                 
                 # Playlists aktualisieren
                 try:
-                    playlist_manager = PlaylistManager(proxy_dir, metadata_file)
+                    playlist_manager = PlaylistManager.for_dir(proxy_dir, metadata_file)
                     playlist_manager.remove_image(proxy_hash)
                 except Exception as e:
                     logger.warning(f"Fehler beim Aktualisieren der Playlists: {e}")
                 
                 self.refresh_list()
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Information)
-                msg.setWindowTitle("Erfolg")
-                msg.setText("Bild wurde gelöscht.")
-                msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                                 "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                                 "QPushButton { background-color: #3498db; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                                 "QPushButton:hover { background-color: #2980b9; }")
-                msg.exec_()
+                _styled_msgbox(self, QMessageBox.Information, "Erfolg", "Bild wurde gelöscht.").exec_()
             except Exception as e:
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Critical)
-                msg.setWindowTitle("Fehler")
-                msg.setText(f"Fehler beim Löschen: {e}")
-                msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                                 "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                                 "QPushButton { background-color: #e74c3c; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                                 "QPushButton:hover { background-color: #c0392b; }")
-                msg.exec_()
+                _styled_msgbox(self, QMessageBox.Critical, "Fehler", f"Fehler beim Löschen: {e}", _MSGBOX_ERROR_QSS).exec_()
     
     def go_back(self):
         """Signalisiert, zurück zur Slideshow zu gehen"""
         self.parent().setCurrentIndex(0)
 
+@lru_cache(maxsize=1)
+def _list_known_wifi_connections(version: int) -> frozenset:
+    """Liest die Namen der gespeicherten WLAN-Verbindungen (gecacht bis sich version ändert)"""
+    result = subprocess.run(['nmcli', '-t', '-f', 'NAME,TYPE', 'connection', 'show'],
+                            capture_output=True, text=True, timeout=10)
+    if result.returncode != 0:
+        # Fehler nicht cachen - beim nächsten Scan erneut versuchen
+        raise RuntimeError(result.stderr.strip() or f"nmcli returncode {result.returncode}")
+    known = set()
+    for line in result.stdout.strip().split('\n'):
+        if ':802-11-wireless' in line or ':wifi' in line:
+            known.add(_nmcli_unescape(_nmcli_split(line, 1)[0]))
+    return frozenset(known)
+
+# Feste Teile von 'nmcli connection add' für WLAN-Profile; pro Verbindung kommen nur SSID/Passwort/ifname dazu
+# connection.autoconnect=yes sorgt für automatische Verbindung nach Reboot
+# connection.autoconnect-priority=10 gibt höhere Priorität (wird zuerst verbunden)
+# wifi.powersave=2 deaktiviert Power-Management (verhindert Verbindungsabbrüche)
+_NMCLI_ADD_OPEN_CMD = ('sudo', '-n', 'nmcli', 'connection', 'add', 'type', 'wifi',
+                       'connection.autoconnect', 'yes',
+                       'connection.autoconnect-priority', '10',
+                       'wifi.powersave', '2')
+_NMCLI_ADD_SECURED_CMD = _NMCLI_ADD_OPEN_CMD + ('wifi-sec.key-mgmt', 'wpa-psk')
+
+@lru_cache(maxsize=1)
+def _find_wifi_device() -> str:
+    """Ermittelt das WLAN-Interface einmalig (ändert sich zur Laufzeit nicht)"""
+    result = subprocess.run(['nmcli', '-t', '-f', 'DEVICE,TYPE', 'device', 'status'],
+                            capture_output=True, text=True, timeout=5)
+    if result.returncode == 0:
+        for line in result.stdout.strip().split('\n'):
+            fields = _nmcli_split(line)
+            if len(fields) >= 2 and fields[1] == 'wifi':
+                return _nmcli_unescape(fields[0])
+    # Nicht gefunden nicht cachen - beim nächsten Verbinden erneut versuchen
+    raise RuntimeError("Kein WLAN-Interface gefunden")
+
+def _probe_ssid() -> str:
+    """Ermittelt die SSID des verbundenen WLANs (iwgetid, sonst nmcli)"""
+    ssid = "Nicht verbunden"
+    try:
+        # Versuche SSID über iwgetid oder nmcli zu bekommen
+        result = subprocess.run(['iwgetid', '-r'], capture_output=True, text=True, timeout=2)
+        if result.returncode == 0 and result.stdout.strip():
+            ssid = result.stdout.strip()
+        else:
+            # Fallback: nmcli (Format: "yes:SSID" oder "nein:")
+            result = subprocess.run(['nmcli', '-t', '-f', 'active,ssid', 'dev', 'wifi'], 
+                                  capture_output=True, text=True, timeout=2)
+            if result.returncode == 0:
+                lines = result.stdout.strip().split('\n')
+                ssid = "Nicht verbunden"
+                for line in lines:
+                    # Prüfe auf "yes:" (aktiv) oder "ja:" (deutsch)
+                    if line.startswith('yes:') or line.startswith('ja:'):
+                        parts = line.split(':', 1)
+                        if len(parts) > 1 and parts[1]:
+                            ssid = parts[1]
+                            break
+    except Exception as e:
+        # SSID konnte nicht abgerufen werden
+        ssid = "Nicht verbunden"
+    return ssid
+
+# ioctl-Request für die IPv4-Adresse einer Schnittstelle (Linux)
+_SIOCGIFADDR = 0x8915
+
+def _local_ipv4() -> Optional[str]:
+    """Liest die erste IPv4-Adresse einer Nicht-Loopback-Schnittstelle lokal per ioctl (ohne Prozess und Netzwerkzugriff)"""
+    try:
+        import fcntl
+    except ImportError:
+        return None
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for _, name in socket.if_nameindex():
+                if name == 'lo':
+                    continue
+                try:
+                    ifreq = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, struct.pack('256s', name.encode()[:15]))
+                except OSError:
+                    # Schnittstelle hat keine IPv4-Adresse (z.B. WLAN nicht verbunden)
+                    continue
+                return socket.inet_ntoa(ifreq[20:24])
+    except OSError as e:
+        logger.debug(f"Schnittstellen konnten nicht gelesen werden: {e}")
+    return None
+
+def _probe_ip() -> str:
+    """Ermittelt die erste IP-Adresse des Geräts"""
+    ip_text = _local_ipv4()
+    if ip_text:
+        return ip_text
+    try:
+        # Fallback: hostname -I listet alle Adressen
+        result = subprocess.run(['hostname', '-I'], capture_output=True, text=True, timeout=2)
+        ip_addresses = result.stdout.strip().split()
+        if ip_addresses:
+            return ip_addresses[0]  # Erste IP verwenden
+    except Exception:
+        pass
+    return "Nicht verbunden"
+
+class _TaskRunnable(QRunnable):
+    """Führt eine Aufgabe im globalen Thread-Pool aus (Ergebnisse gehen per Signal an die UI)"""
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+    
+    def run(self):
+        self.task()
+
 class WifiSettingsWidget(QWidget):
     """WLAN-Einstellungs-Widget mit Netzwerkliste"""
     # Signal für UI-Updates aus Threads
@@ -1350,6 +1565,74 @@ class WifiSettingsWidget(QWidget):
     scan_error = pyqtSignal(str)
     connection_success = pyqtSignal()
     connection_error = pyqtSignal(str)
+    scan_finished = pyqtSignal(int)  # Scan-Generation
+    
+    # Stylesheets einmalig als Klassenkonstanten (nicht pro Zeile neu aufbauen)
+    _KNOWN_BTN_QSS = """
+        QPushButton[kind="known"] {
+            font-size: 18px;
+            font-weight: bold;
+            padding: 15px;
+            background: #27ae60;
+            color: #ffffff;
+            border: 2px solid #2ecc71;
+            border-radius: 10px;
+            text-align: left;
+        }
+        QPushButton[kind="known"]:hover {
+            background: #2ecc71;
+            border-color: #27ae60;
+        }
+    """
+    _UNKNOWN_BTN_QSS = """
+        QPushButton[kind="unknown"] {
+            font-size: 18px;
+            font-weight: bold;
+            padding: 15px;
+            background: #2c3e50;
+            color: #ecf0f1;
+            border: 2px solid #34495e;
+            border-radius: 10px;
+            text-align: left;
+        }
+        QPushButton[kind="unknown"]:hover {
+            background: #34495e;
+            border-color: #3498db;
+        }
+    """
+    _DELETE_BTN_QSS = """
+        QPushButton[kind="delete"] {
+            font-size: 20px;
+            font-weight: bold;
+            padding: 15px 20px;
+            background: #e74c3c;
+            color: #ffffff;
+            border: 2px solid #c0392b;
+            border-radius: 10px;
+            min-width: 60px;
+        }
+        QPushButton[kind="delete"]:hover {
+            background: #c0392b;
+            border-color: #e74c3c;
+        }
+    """
+    # Alle Zeilen-Regeln einmal im Stylesheet des Listen-Containers; Buttons wählen per Property "kind"
+    _ROW_QSS = _KNOWN_BTN_QSS + _UNKNOWN_BTN_QSS + _DELETE_BTN_QSS
+    # Letztes Scan-Ergebnis auf der Platte (für sofortige Anzeige nach Neustart)
+    _SCAN_CACHE_FILE = Path.home() / '.cache' / 'pictureframe' / 'wifi_scan.json'
+    _SCAN_CACHE_VERSION = 2
+    
+    # Anzahl Netzwerk-Zeilen, die pro Portion erzeugt werden (ca. eine Bildschirmhöhe)
+    _ROWS_PER_BATCH = 12
+    
+    # Scan-Ergebnis wird klassenweit gecacht, da das Widget bei jedem Öffnen neu erstellt wird
+    _scan_cache: Optional[list] = None
+    _scan_cache_ts = 0.0
+    _scan_ttl = 30.0  # Sekunden
+    # Version der gespeicherten WLAN-Verbindungen (wird bei Änderungen erhöht, siehe _list_known_wifi_connections)
+    _known_version = 0
+    # SSIDs, deren Verbindungsprofil bereits stabil konfiguriert wurde
+    _configured_ssids = set()
     
     def __init__(self, config: ConfigManager, main_window):
         super().__init__()
@@ -1358,24 +1641,41 @@ class WifiSettingsWidget(QWidget):
         self.current_input = None
         self.selected_ssid = None
         self.password_dialog = None
-        self.connecting_label = None
+        # Wiederverwendbare Netzwerk-Zeilen (werden bei Aktualisierung nicht neu erstellt)
+        self._row_pool = []
+        # Noch nicht angezeigte Einträge der Netzwerkliste (werden beim Scrollen nachgeladen)
+        self._pending_entries = []
+        self._pending_pos = 0
+        self._rendered_rows = 0
+        # Zähler der gestarteten Scans (Ergebnisse veralteter Scans werden verworfen)
+        self._scan_generation = 0
+        # Debounce für wiederholte Scan-Anfragen und Merker für laufenden Scan
+        self._scan_in_flight = False
+        self._scan_debounce = QTimer(self)
+        self._scan_debounce.setSingleShot(True)
         # Verbinde Signale
         self.networks_found.connect(self.display_networks)
         self.scan_error.connect(self.show_scan_error)
+        self.scan_finished.connect(self._on_scan_finished)
         self.connection_success.connect(self.show_connection_success)
         self.connection_error.connect(self.show_connection_error)
         self.setup_ui()
-        self.scan_networks()
+        
+        # Beim ersten Öffnen nach dem Start: letzte Netzwerkliste von der Platte sofort anzeigen
+        # und im Hintergrund neu scannen
+        disk_networks = None if WifiSettingsWidget._scan_cache else self._load_scan_cache_file()
+        if disk_networks:
+            self.display_networks(disk_networks)
+            self._do_scan()
+        else:
+            self.scan_networks()
     
     def setup_ui(self):
         """Erstellt die UI mit Netzwerkliste"""
         # Hintergrund ZUERST setzen, bevor Layout erstellt wird
+        # (WA_StyledBackground lässt das Stylesheet den Hintergrund malen - kein extra Palette/AutoFill nötig)
+        self.setAttribute(Qt.WA_StyledBackground, True)
         self.setStyleSheet("background-color: #1a1a2e;")
-        self.setAutoFillBackground(True)
-        palette = self.palette()
-        palette.setColor(self.backgroundRole(), QColor("#1a1a2e"))
-        palette.setColor(self.foregroundRole(), QColor("#ffffff"))
-        self.setPalette(palette)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 10, 15, 10)
@@ -1402,9 +1702,17 @@ class WifiSettingsWidget(QWidget):
         # Aktualisieren-Button
         refresh_btn = QPushButton("Aktualisieren")
         refresh_btn.setStyleSheet("font-size: 18px; font-weight: bold; padding: 12px; background: #3498db; color: white; border: none; border-radius: 10px;")
-        refresh_btn.clicked.connect(self.scan_networks)
+        refresh_btn.clicked.connect(lambda: self.scan_networks(force=True))
         layout.addWidget(refresh_btn)
         
+        # Verbindungsanzeige (einmal erstellt, wird beim Verbinden nur ein-/ausgeblendet)
+        self.connecting_banner = QLabel()
+        self.connecting_banner.setStyleSheet("font-size: 18px; color: #3498db; padding: 20px; text-align: center;")
+        self.connecting_banner.setAlignment(Qt.AlignCenter)
+        self.connecting_banner.setWordWrap(True)
+        self.connecting_banner.hide()
+        layout.addWidget(self.connecting_banner)
+        
         # Netzwerkliste (ScrollArea)
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1413,29 +1721,45 @@ class WifiSettingsWidget(QWidget):
                             "QScrollBar::handle:vertical { background: #34495e; border-radius: 6px; min-height: 25px; } "
                             "QScrollBar::handle:vertical:hover { background: #3498db; }")
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: #1a1a2e;")
-        scroll_content.setAutoFillBackground(True)
-        palette = scroll_content.palette()
-        palette.setColor(scroll_content.backgroundRole(), QColor("#1a1a2e"))
-        scroll_content.setPalette(palette)
+        scroll_content.setStyleSheet("* { background-color: #1a1a2e; }" + WifiSettingsWidget._ROW_QSS)
         self.network_layout = QVBoxLayout()
         self.network_layout.setSpacing(8)
         scroll_content.setLayout(self.network_layout)
         scroll.setWidget(scroll_content)
         layout.addWidget(scroll)
+        # Weitere Zeilen erst erzeugen, wenn das Listenende sichtbar wird
+        # (rangeChanged deckt auch den Fall ab, dass die erste Portion den Bereich nicht füllt)
+        self.network_scroll = scroll
+        scroll.verticalScrollBar().valueChanged.connect(self._on_network_scroll)
+        scroll.verticalScrollBar().rangeChanged.connect(self._on_network_scroll)
         
         self.setLayout(layout)
         
         # Touch-Tastatur-Widget
         self.keyboard_widget = None
     
-    def scan_networks(self):
+    def scan_networks(self, force: bool = False):
         """Scannt nach verfügbaren WLAN-Netzwerken und lädt bekannte Netzwerke"""
+        # Während ein Scan läuft, weitere Anfragen verwerfen
+        if self._scan_in_flight:
+            logger.debug("WLAN-Scan läuft bereits, Anfrage ignoriert")
+            return
+        
+        # Aktuelles Scan-Ergebnis wiederverwenden (Rescan nur bei Bedarf oder auf Anforderung)
+        cache = WifiSettingsWidget._scan_cache
+        if not force and cache and time.monotonic() - WifiSettingsWidget._scan_cache_ts < WifiSettingsWidget._scan_ttl:
+            logger.info(f"Verwende gecachte WLAN-Netzwerkliste ({len(cache)} Netzwerke)")
+            self.networks_found.emit(cache)
+            return
+        
+        # Erste Anfrage sofort scannen, weitere Anfragen innerhalb von 500 ms verwerfen
+        if self._scan_debounce.isActive():
+            logger.debug("WLAN-Scan gerade gestartet, Anfrage ignoriert")
+            return
+        self._scan_debounce.start(500)
+        
         # Lösche alte Netzwerke
-        while self.network_layout.count():
-            child = self.network_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self._clear_network_layout()
         
         # Zeige Ladeanzeige
         loading_label = QLabel("Suche nach Netzwerken...")
@@ -1444,146 +1768,302 @@ class WifiSettingsWidget(QWidget):
         self.network_layout.addWidget(loading_label)
         self.loading_label = loading_label
         
-        # Aktualisiere UI sofort
-        QApplication.processEvents()
+        # Kein processEvents(): der Scan läuft ohnehin im Hintergrund, die Ladeanzeige
+        # wird von der normalen Event-Loop gezeichnet (verhindert reentrante Klicks)
+        self._do_scan()
+    
+    def _do_scan(self):
+        """Startet den eigentlichen WLAN-Scan im Hintergrund"""
+        self._scan_in_flight = True
+        self._scan_generation += 1
+        generation = self._scan_generation
         
         # Scanne Netzwerke in separatem Thread (um UI nicht zu blockieren)
         def scan():
             try:
                 logger.info("Starte WLAN-Scan...")
                 
-                # Lade bekannte Netzwerke (bereits konfigurierte)
-                known_networks = set()
+                # Bekannte Netzwerke (bereits konfigurierte); nmcli läuft nur, wenn sich seit dem
+                # letzten Scan Verbindungen geändert haben
                 try:
-                    logger.info("Lade bekannte Netzwerke...")
-                    result = subprocess.run(['nmcli', '-t', '-f', 'NAME,TYPE', 'connection', 'show'], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        for line in result.stdout.strip().split('\n'):
-                            if ':802-11-wireless' in line or ':wifi' in line:
-                                parts = line.split(':')
-                                if len(parts) > 0:
-                                    conn_name = parts[0]
-                                    known_networks.add(conn_name)
-                        logger.info(f"Bekannte Netzwerke gefunden: {len(known_networks)}")
+                    known_networks = _list_known_wifi_connections(WifiSettingsWidget._known_version)
+                    logger.info(f"Bekannte Netzwerke: {len(known_networks)}")
                 except Exception as e:
                     logger.warning(f"Fehler beim Laden bekannter Netzwerke: {e}")
+                    known_networks = frozenset()
                 
-                # Starte einen aktiven Scan (rescan) um alle verfügbaren Netzwerke zu finden
-                logger.info("Starte aktiven WLAN-Rescan...")
-                import time
-                scan_success = False
-                
-                # Methode 1: Versuche sudo nmcli rescan (funktioniert ohne Passwort)
-                try:
-                    rescan_result = subprocess.run(['sudo', '-n', 'nmcli', 'dev', 'wifi', 'rescan'], 
-                                                  capture_output=True, text=True, timeout=5)
-                    if rescan_result.returncode == 0:
-                        logger.info("Rescan erfolgreich (sudo)")
-                        scan_success = True
-                        time.sleep(3)  # Warte auf Scan-Abschluss
-                    else:
-                        # Rescan fehlgeschlagen, fortfahren ohne sudo
-                        pass
-                except Exception:
-                    # Rescan fehlgeschlagen, fortfahren
-                    pass
-                
-                # Methode 2: Versuche nmcli scan (ohne sudo, kann funktionieren)
-                if not scan_success:
-                    try:
-                        scan_result = subprocess.run(['nmcli', 'dev', 'wifi', 'scan'], 
-                                                    capture_output=True, text=True, timeout=5)
-                        if scan_result.returncode == 0:
-                            logger.info("Scan erfolgreich (ohne sudo)")
-                            scan_success = True
-                            time.sleep(2)
-                        else:
-                            # Scan-Befehl fehlgeschlagen
-                            pass
-                    except Exception:
-                        # Scan-Befehl fehlgeschlagen, fortfahren
-                        pass
-                
-                if not scan_success:
-                    logger.warning("Aktiver Scan nicht möglich, verwende gecachte Netzwerkliste")
-                
-                # Scanne nach WLAN-Netzwerken
-                logger.info("Führe nmcli wifi list aus...")
-                result = subprocess.run(['nmcli', '-t', '-f', 'SSID,SIGNAL,SECURITY', 'dev', 'wifi', 'list'], 
-                                      capture_output=True, text=True, timeout=15)
-                
-                logger.info(f"nmcli returncode: {result.returncode}")
-                logger.info(f"nmcli stdout: {result.stdout[:200]}")
-                if result.stderr:
-                    logger.warning(f"nmcli stderr: {result.stderr[:200]}")
-                
-                networks = []
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    logger.info(f"Gefundene Zeilen: {len(lines)}")
-                    for line in lines:
-                        if line.strip():
-                            parts = line.split(':')
-                            if len(parts) >= 2:
-                                ssid = parts[0] if parts[0] else "Verstecktes Netzwerk"
-                                signal = parts[1] if len(parts) > 1 else "0"
-                                security = parts[2] if len(parts) > 2 else ""
-                                if ssid and ssid != "--":  # Ignoriere leere SSIDs und "--"
-                                    try:
-                                        signal_int = int(signal) if signal.isdigit() else 0
-                                        # Prüfe ob Netzwerk bekannt ist
-                                        is_known = ssid in known_networks
-                                        networks.append({
-                                            'ssid': ssid,
-                                            'signal': signal,
-                                            'security': security,
-                                            'known': is_known
-                                        })
-                                    except:
-                                        pass
+                # Access Points bevorzugt direkt über D-Bus von NetworkManager lesen, sonst über nmcli
+                scanned = scan_access_points() if WIFI_DBUS_AVAILABLE else None
+                if scanned is None:
+                    scanned = self._scan_networks_nmcli()
                 
+                # Bekannte Netzwerke markieren
+                networks = [dict(net, known=net['ssid'] in known_networks) for net in scanned]
                 logger.info(f"Gefundene Netzwerke: {len(networks)}")
                 
-                # Sortiere: Bekannte zuerst, dann nach Signalstärke
-                networks.sort(key=lambda x: (
-                    not x['known'],  # Bekannte zuerst (False < True)
-                    -int(x['signal']) if x['signal'].isdigit() else 0  # Dann nach Signalstärke
-                ))
-                
-                # Entferne Duplikate (behalte nur die beste Signalstärke)
-                seen = set()
-                unique_networks = []
+                # Entferne Duplikate in einem Durchlauf (behalte je SSID nur die beste Signalstärke)
+                best = {}
                 for net in networks:
-                    if net['ssid'] not in seen:
-                        seen.add(net['ssid'])
-                        unique_networks.append(net)
+                    prev = best.get(net['ssid'])
+                    if prev is None or net['signal'] > prev['signal']:
+                        best[net['ssid']] = net
+                
+                # Sortiere: Bekannte zuerst (False < True), dann nach Signalstärke
+                unique_networks = sorted(best.values(), key=lambda n: (not n['known'], -n['signal']))
+                
+                # Anzeigetext mit Signalstärke und Sicherheit schon hier (außerhalb des UI-Threads) erzeugen
+                for net in unique_networks:
+                    signal_text = f"{net['signal']}%" if net['signal'] > 0 else "?"
+                    security_icon = "🔒" if net['security'] else "🔓"
+                    known_mark = "✓ " if net['known'] else ""
+                    net['display'] = f"{known_mark}{security_icon} {net['ssid']} ({signal_text})"
                 
                 logger.info(f"Eindeutige Netzwerke: {len(unique_networks)} (davon {sum(1 for n in unique_networks if n['known'])} bekannt)")
                 
-                # Aktualisiere UI über Signal (thread-safe)
+                # Ergebnis für weitere Aufrufe innerhalb der TTL merken
+                WifiSettingsWidget._scan_cache = unique_networks
+                WifiSettingsWidget._scan_cache_ts = time.monotonic()
+                self._save_scan_cache_file(unique_networks)
+                
+                # Aktualisiere UI über Signal (thread-safe), sofern inzwischen kein neuerer Scan gestartet wurde
+                if generation != self._scan_generation:
+                    logger.debug("WLAN-Scan-Ergebnis veraltet, wird verworfen")
+                    return
                 self.networks_found.emit(unique_networks)
             except subprocess.TimeoutExpired:
                 logger.error("WLAN-Scan Timeout")
-                self.scan_error.emit("Scan-Timeout. Bitte erneut versuchen.")
+                if generation == self._scan_generation:
+                    self.scan_error.emit("Scan-Timeout. Bitte erneut versuchen.")
             except Exception as e:
                 logger.error(f"Fehler beim Scannen der Netzwerke: {e}", exc_info=True)
-                self.scan_error.emit(f"Fehler: {str(e)}")
+                if generation == self._scan_generation:
+                    self.scan_error.emit(f"Fehler: {str(e)}")
+            finally:
+                # Auch bei verworfenem Ergebnis melden, sonst bliebe _scan_in_flight gesetzt
+                self.scan_finished.emit(generation)
+        
+        # Starte Scan im Thread-Pool
+        try:
+            QThreadPool.globalInstance().start(_TaskRunnable(scan))
+        except Exception as e:
+            logger.error(f"WLAN-Scan konnte nicht gestartet werden: {e}")
+            self._scan_in_flight = False
+    
+    def _on_scan_finished(self, generation: int):
+        """Gibt neue Scans frei, sobald der zuletzt gestartete Scan beendet ist"""
+        if generation == self._scan_generation:
+            self._scan_in_flight = False
+    
+    def _load_scan_cache_file(self) -> Optional[list]:
+        """Lädt die zuletzt gespeicherte Netzwerkliste von der Platte"""
+        try:
+            if not self._SCAN_CACHE_FILE.exists():
+                return None
+            with open(self._SCAN_CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('v') != self._SCAN_CACHE_VERSION:
+                return None
+            return data.get('networks') or None
+        except Exception as e:
+            logger.warning(f"Fehler beim Laden der gespeicherten Netzwerkliste: {e}")
+            return None
+    
+    def _save_scan_cache_file(self, networks: list):
+        """Speichert die Netzwerkliste für die sofortige Anzeige nach einem Neustart"""
+        try:
+            self._SCAN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # Atomar schreiben (eigene temporäre Datei pro Thread, dann os.replace): ein Absturz oder
+            # ein gleichzeitiger Scan hinterlässt nie eine halb geschriebene Datei
+            tmp_file = self._SCAN_CACHE_FILE.with_name(f"{self._SCAN_CACHE_FILE.name}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'v': self._SCAN_CACHE_VERSION, 'networks': networks}, f, ensure_ascii=False)
+            os.replace(tmp_file, self._SCAN_CACHE_FILE)
+        except Exception as e:
+            logger.warning(f"Fehler beim Speichern der Netzwerkliste: {e}")
+    
+    def _nmcli_last_scan(self) -> Optional[str]:
+        """Liest den Zeitstempel des letzten WLAN-Scans aus nmcli (None, falls nicht verfügbar)"""
+        try:
+            result = subprocess.run(['nmcli', '-g', 'GENERAL.LAST-SCAN', 'device', 'show'],
+                                    capture_output=True, text=True, timeout=2)
+        except Exception:
+            return None
+        value = result.stdout.strip()
+        return value if result.returncode == 0 and value else None
+    
+    def _wait_for_nmcli_scan(self, last_scan_before: Optional[str], max_wait: float):
+        """Wartet bis nmcli einen neuen Scan meldet, höchstens max_wait Sekunden"""
+        if last_scan_before is None:
+            # nmcli kennt LAST-SCAN nicht: feste Wartezeit wie bisher
+            time.sleep(max_wait)
+            return
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
+            time.sleep(0.2)
+            current = self._nmcli_last_scan()
+            if current is None:
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                return
+            if current != last_scan_before and current != '-1':
+                logger.info("WLAN-Scan abgeschlossen")
+                return
+    
+    def _scan_networks_nmcli(self) -> list:
+        """Startet einen Rescan über nmcli und liest die Netzwerkliste (Fallback ohne D-Bus)"""
+        # Starte einen aktiven Scan (rescan) um alle verfügbaren Netzwerke zu finden
+        logger.info("Starte aktiven WLAN-Rescan...")
+        scan_success = False
+        last_scan_before = self._nmcli_last_scan()
+        
+        # Methode 1: Versuche sudo nmcli rescan (funktioniert ohne Passwort)
+        try:
+            rescan_result = subprocess.run(['sudo', '-n', 'nmcli', 'dev', 'wifi', 'rescan'], 
+                                          capture_output=True, text=True, timeout=5)
+            if rescan_result.returncode == 0:
+                logger.info("Rescan erfolgreich (sudo)")
+                scan_success = True
+                self._wait_for_nmcli_scan(last_scan_before, 3.0)  # Warte auf Scan-Abschluss
+            else:
+                # Rescan fehlgeschlagen, fortfahren ohne sudo
+                pass
+        except Exception:
+            # Rescan fehlgeschlagen, fortfahren
+            pass
         
-        # Starte Scan in separatem Thread
-        import threading
-        scan_thread = threading.Thread(target=scan, daemon=True)
-        scan_thread.start()
+        # Methode 2: Versuche nmcli scan (ohne sudo, kann funktionieren)
+        if not scan_success:
+            try:
+                scan_result = subprocess.run(['nmcli', 'dev', 'wifi', 'scan'], 
+                                            capture_output=True, text=True, timeout=5)
+                if scan_result.returncode == 0:
+                    logger.info("Scan erfolgreich (ohne sudo)")
+                    scan_success = True
+                    self._wait_for_nmcli_scan(last_scan_before, 2.0)
+                else:
+                    # Scan-Befehl fehlgeschlagen
+                    pass
+            except Exception:
+                # Scan-Befehl fehlgeschlagen, fortfahren
+                pass
+        
+        if not scan_success:
+            logger.warning("Aktiver Scan nicht möglich, verwende gecachte Netzwerkliste")
+        
+        # Scanne nach WLAN-Netzwerken
+        logger.info("Führe nmcli wifi list aus...")
+        # Ausgabe als bytes lesen: dekodiert werden nur die Felder, die tatsächlich übernommen werden
+        result = subprocess.run(['nmcli', '-t', '-e', 'yes', '-f', 'SSID,SIGNAL,SECURITY', 'dev', 'wifi', 'list'], 
+                              capture_output=True, timeout=15)
+        
+        logger.info(f"nmcli returncode: {result.returncode}")
+        logger.info(f"nmcli stdout: {result.stdout[:200].decode('utf-8', 'replace')}")
+        if result.stderr:
+            logger.warning(f"nmcli stderr: {result.stderr[:200].decode('utf-8', 'replace')}")
+        
+        networks = []
+        if result.returncode == 0:
+            lines = result.stdout.splitlines()
+            logger.info(f"Gefundene Zeilen: {len(lines)}")
+            for line in lines:
+                if not line.strip():
+                    continue
+                # Ein Split pro Zeile; maskierte ':' in der SSID bleiben erhalten
+                parts = _nmcli_split_bytes(line, 2)
+                if len(parts) < 2 or parts[0] == b"--":  # Ignoriere "--"
+                    continue
+                ssid = _nmcli_unescape_bytes(parts[0]).decode('utf-8', 'replace') or "Verstecktes Netzwerk"
+                signal = int(parts[1]) if parts[1].isdigit() else 0  # Signalstärke einmalig als int
+                security = _nmcli_unescape_bytes(parts[2]).decode('utf-8', 'replace') if len(parts) > 2 else ""
+                networks.append({
+                    'ssid': ssid,
+                    'signal': signal,
+                    'security': security
+                })
+        return networks
+    
+    def _clear_network_layout(self):
+        """Leert die Netzwerkliste; Zeilen aus dem Pool werden nur versteckt und wiederverwendet"""
+        self._pending_entries = []
+        self._pending_pos = 0
+        while self.network_layout.count():
+            child = self.network_layout.takeAt(0)
+            widget = child.widget()
+            if widget is None:
+                continue
+            if widget in self._row_pool:
+                widget.hide()
+            else:
+                widget.deleteLater()
+    
+    def _make_network_row(self) -> QWidget:
+        """Erstellt eine wiederverwendbare Netzwerk-Zeile (Netzwerk-Button + Löschen-Button)"""
+        row = QWidget()
+        row_layout = QHBoxLayout()
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.setSpacing(10)
+        
+        row.network = None
+        row.is_known = None
+        
+        row.network_btn = QPushButton()
+        # Verbindung einmalig herstellen; die Zeile kennt ihr aktuelles Netzwerk
+        row.network_btn.clicked.connect(partial(self._on_network_row_clicked, row))
+        row_layout.addWidget(row.network_btn, stretch=1)
+        
+        # Löschen-Button für bekanntes Netzwerk
+        row.delete_btn = QPushButton("🗑️")
+        row.delete_btn.setProperty("kind", "delete")
+        row.delete_btn.clicked.connect(partial(self._on_network_row_delete, row))
+        row_layout.addWidget(row.delete_btn)
+        
+        row.setLayout(row_layout)
+        return row
+    
+    def _get_network_row(self, index: int, network: dict) -> QWidget:
+        """Liefert eine Zeile aus dem Pool (oder erstellt eine neue) und befüllt sie mit dem Netzwerk"""
+        if index < len(self._row_pool):
+            row = self._row_pool[index]
+        else:
+            row = self._make_network_row()
+            self._row_pool.append(row)
+        
+        known = network.get('known', False)
+        row.network = network
+        
+        # Stil nur bei Wechsel zwischen bekannt/unbekannt über die Property "kind" umschalten
+        if row.is_known != known:
+            row.is_known = known
+            btn = row.network_btn
+            btn.setProperty("kind", "known" if known else "unknown")
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+            row.delete_btn.setVisible(known)
+        
+        # Anzeigetext wurde bereits im Scan-Thread erzeugt
+        row.network_btn.setText(network['display'])
+        if known:
+            row.delete_btn.setToolTip(f"Netzwerk {network['ssid']} löschen")
+        return row
+    
+    def _on_network_row_clicked(self, row: QWidget, checked: bool = False):
+        """Verbindet mit dem Netzwerk der angeklickten Zeile"""
+        network = row.network
+        if network:
+            # Bekannte Netzwerke direkt verbinden, unbekannte mit Passwort-Dialog
+            self.connect_to_network(network['ssid'], network['security'], network.get('known', False))
+    
+    def _on_network_row_delete(self, row: QWidget, checked: bool = False):
+        """Löscht das gespeicherte Netzwerk der Zeile"""
+        if row.network:
+            self.delete_network(row.network['ssid'])
     
     def display_networks(self, networks):
         """Zeigt die gefundenen Netzwerke an mit Unterscheidung zwischen bekannten und unbekannten"""
         logger.info(f"display_networks aufgerufen mit {len(networks)} Netzwerken")
+        self._scan_in_flight = False
         
         # Lösche Ladeanzeige
-        while self.network_layout.count():
-            child = self.network_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self._clear_network_layout()
         
         if not networks:
             no_networks = QLabel("Keine Netzwerke gefunden.\nBitte 'Aktualisieren' drücken.")
@@ -1593,130 +2073,57 @@ class WifiSettingsWidget(QWidget):
             self.network_layout.addWidget(no_networks)
             return
         
-        # Trenne bekannte und unbekannte Netzwerke
-        known_networks = [n for n in networks if n.get('known', False)]
-        unknown_networks = [n for n in networks if not n.get('known', False)]
+        # Trenne bekannte und unbekannte Netzwerke (ein Durchlauf)
+        known_networks = []
+        unknown_networks = []
+        for network in networks:
+            (known_networks if network.get('known', False) else unknown_networks).append(network)
         
-        # Zeige bekannte Netzwerke zuerst
+        # Anzeige-Einträge vorbereiten; Zeilen-Widgets werden erst beim Scrollen erzeugt
+        entries = []
         if known_networks:
-            known_label = QLabel("Bekannte Netzwerke:")
-            known_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #2ecc71; padding: 15px 0 5px 0;")
-            self.network_layout.addWidget(known_label)
-            
-            for network in known_networks:
-                ssid = network['ssid']
-                signal = network['signal']
-                security = network['security']
-                
-                # Container für Netzwerk-Button und Löschen-Button
-                network_container = QHBoxLayout()
-                network_container.setSpacing(10)
-                
-                # Erstelle Netzwerk-Button für bekanntes Netzwerk
-                network_btn = QPushButton()
-                network_btn.setStyleSheet("""
-                    QPushButton {
-                        font-size: 18px; 
-                        font-weight: bold; 
-                        padding: 15px; 
-                        background: #27ae60; 
-                        color: #ffffff; 
-                        border: 2px solid #2ecc71; 
-                        border-radius: 10px;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background: #2ecc71;
-                        border-color: #27ae60;
-                    }
-                """)
-                
-                # Text mit Signalstärke und Sicherheit
-                signal_text = f"{signal}%" if signal.isdigit() else "?"
-                security_icon = "🔒" if security else "🔓"
-                network_btn.setText(f"✓ {security_icon} {ssid} ({signal_text})")
-                # Bei bekannten Netzwerken direkt verbinden (ohne Passwort-Dialog)
-                network_btn.clicked.connect(lambda checked, s=ssid, sec=security, known=True: self.connect_to_network(s, sec, known))
-                network_container.addWidget(network_btn, stretch=1)
-                
-                # Löschen-Button für bekanntes Netzwerk
-                delete_btn = QPushButton("🗑️")
-                delete_btn.setStyleSheet("""
-                    QPushButton {
-                        font-size: 20px; 
-                        font-weight: bold; 
-                        padding: 15px 20px; 
-                        background: #e74c3c; 
-                        color: #ffffff; 
-                        border: 2px solid #c0392b; 
-                        border-radius: 10px;
-                        min-width: 60px;
-                    }
-                    QPushButton:hover {
-                        background: #c0392b;
-                        border-color: #e74c3c;
-                    }
-                """)
-                delete_btn.setToolTip(f"Netzwerk {ssid} löschen")
-                delete_btn.clicked.connect(lambda checked, s=ssid: self.delete_network(s))
-                network_container.addWidget(delete_btn)
-                
-                # Container-Widget erstellen
-                container_widget = QWidget()
-                container_widget.setLayout(network_container)
-                self.network_layout.addWidget(container_widget)
-        
-        # Zeige unbekannte Netzwerke
+            entries.append(('label', "Bekannte Netzwerke:", "font-size: 20px; font-weight: bold; color: #2ecc71; padding: 15px 0 5px 0;"))
+            entries.extend(('network', network, None) for network in known_networks)
         if unknown_networks:
             if known_networks:
-                separator = QLabel("")
-                separator.setStyleSheet("height: 10px;")
-                self.network_layout.addWidget(separator)
-            
-            unknown_label = QLabel("Verfügbare Netzwerke:")
-            unknown_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #ecf0f1; padding: 15px 0 5px 0;")
-            self.network_layout.addWidget(unknown_label)
-            
-            for network in unknown_networks:
-                ssid = network['ssid']
-                signal = network['signal']
-                security = network['security']
-                
-                # Erstelle Netzwerk-Button für unbekanntes Netzwerk
-                network_btn = QPushButton()
-                network_btn.setStyleSheet("""
-                    QPushButton {
-                        font-size: 18px; 
-                        font-weight: bold; 
-                        padding: 15px; 
-                        background: #2c3e50; 
-                        color: #ecf0f1; 
-                        border: 2px solid #34495e; 
-                        border-radius: 10px;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background: #34495e;
-                        border-color: #3498db;
-                    }
-                """)
-                
-                # Text mit Signalstärke und Sicherheit
-                signal_text = f"{signal}%" if signal.isdigit() else "?"
-                security_icon = "🔒" if security else "🔓"
-                network_btn.setText(f"{security_icon} {ssid} ({signal_text})")
-                # Bei unbekannten Netzwerken Passwort-Dialog zeigen
-                network_btn.clicked.connect(lambda checked, s=ssid, sec=security, known=False: self.connect_to_network(s, sec, known))
-                self.network_layout.addWidget(network_btn)
+                entries.append(('label', "", "height: 10px;"))  # Trenner
+            entries.append(('label', "Verfügbare Netzwerke:", "font-size: 20px; font-weight: bold; color: #ecf0f1; padding: 15px 0 5px 0;"))
+            entries.extend(('network', network, None) for network in unknown_networks)
         
+        self._pending_entries = entries
+        self._pending_pos = 0
+        self._rendered_rows = 0
         self.network_layout.addStretch()
+        self._render_more_networks()
+    
+    def _render_more_networks(self):
+        """Fügt die nächsten Einträge der Netzwerkliste vor dem Stretch ein"""
+        rows_added = 0
+        while self._pending_pos < len(self._pending_entries) and rows_added < self._ROWS_PER_BATCH:
+            kind, value, style = self._pending_entries[self._pending_pos]
+            self._pending_pos += 1
+            if kind == 'label':
+                widget = QLabel(value)
+                widget.setStyleSheet(style)
+            else:
+                widget = self._get_network_row(self._rendered_rows, value)
+                self._rendered_rows += 1
+                rows_added += 1
+            self.network_layout.insertWidget(self.network_layout.count() - 1, widget)
+            widget.show()
+    
+    def _on_network_scroll(self, *args):
+        """Lädt weitere Netzwerk-Zeilen nach, sobald das Ende der Liste in Sicht kommt"""
+        if self._pending_pos >= len(self._pending_entries):
+            return
+        bar = self.network_scroll.verticalScrollBar()
+        if bar.value() >= bar.maximum() - 100:
+            self._render_more_networks()
     
     def show_scan_error(self, error):
         """Zeigt Fehler beim Scannen"""
-        while self.network_layout.count():
-            child = self.network_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self._scan_in_flight = False
+        self._clear_network_layout()
         
         error_label = QLabel(f"Fehler beim Scannen:\n{error}")
         error_label.setStyleSheet("font-size: 16px; color: #e74c3c; padding: 20px; text-align: center;")
@@ -1848,16 +2255,9 @@ class WifiSettingsWidget(QWidget):
     
     def connect_known_network(self, ssid):
         """Verbindet mit einem bereits bekannten Netzwerk (ohne Passwort-Eingabe)"""
-        # Zeige Verbindungsanzeige
-        connecting_label = QLabel(f"Verbinde mit {ssid}...")
-        connecting_label.setStyleSheet("font-size: 18px; color: #3498db; padding: 20px; text-align: center;")
-        connecting_label.setAlignment(Qt.AlignCenter)
-        connecting_label.setWordWrap(True)
-        self.network_layout.insertWidget(0, connecting_label)
-        self.connecting_label = connecting_label
-        
-        # Aktualisiere UI sofort
-        QApplication.processEvents()
+        # Zeige Verbindungsanzeige (wird beim nächsten Durchlauf der Event-Loop gezeichnet)
+        self.connecting_banner.setText(f"Verbinde mit {ssid}...")
+        self.connecting_banner.show()
         
         def connect():
             try:
@@ -1875,20 +2275,21 @@ class WifiSettingsWidget(QWidget):
                 
                 if result.returncode == 0:
                     logger.info(f"Erfolgreich verbunden mit {ssid}")
-                    # Stelle sicher, dass Verbindung stabil konfiguriert ist
-                    try:
-                        # Autoconnect aktivieren mit hoher Priorität
-                        subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'modify', ssid, 
-                                      'connection.autoconnect', 'yes',
-                                      'connection.autoconnect-priority', '10'], 
-                                     capture_output=True, text=True, timeout=5)
-                        # Power-Management deaktivieren (verhindert Verbindungsabbrüche)
-                        subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'modify', ssid, 
-                                      'wifi.powersave', '2'], 
-                                     capture_output=True, text=True, timeout=5)
-                        logger.info(f"Verbindung {ssid} stabil konfiguriert (autoconnect=yes, priority=10, powersave=off)")
-                    except Exception as e:
-                        logger.warning(f"Konnte Verbindungs-Einstellungen nicht setzen: {e}")
+                    # Stelle sicher, dass Verbindung stabil konfiguriert ist (einmal pro SSID und Programmlauf)
+                    if ssid not in WifiSettingsWidget._configured_ssids:
+                        try:
+                            # Autoconnect mit hoher Priorität und Power-Management aus (verhindert Verbindungsabbrüche)
+                            # in einem einzigen nmcli-Aufruf
+                            modify_result = subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'modify', ssid,
+                                                            'connection.autoconnect', 'yes',
+                                                            'connection.autoconnect-priority', '10',
+                                                            'wifi.powersave', '2'],
+                                                           capture_output=True, text=True, timeout=5)
+                            if modify_result.returncode == 0:
+                                WifiSettingsWidget._configured_ssids.add(ssid)
+                                logger.info(f"Verbindung {ssid} stabil konfiguriert (autoconnect=yes, priority=10, powersave=off)")
+                        except Exception as e:
+                            logger.warning(f"Konnte Verbindungs-Einstellungen nicht setzen: {e}")
                     
                     # Erfolg über Signal (thread-safe)
                     self.connection_success.emit()
@@ -1900,10 +2301,8 @@ class WifiSettingsWidget(QWidget):
                 logger.error(f"Fehler beim Verbinden: {e}", exc_info=True)
                 self.connection_error.emit(f"Fehler: {str(e)}")
         
-        # Starte Verbindung in separatem Thread
-        import threading
-        connect_thread = threading.Thread(target=connect, daemon=True)
-        connect_thread.start()
+        # Starte Verbindung im Thread-Pool
+        QThreadPool.globalInstance().start(_TaskRunnable(connect))
     
     def show_system_keyboard(self, input_field):
         """Zeigt die eigene Touch-Tastatur"""
@@ -1918,11 +2317,7 @@ class WifiSettingsWidget(QWidget):
             self.keyboard_widget.set_input_field(input_field)
         
         # Aktualisiere Position der Tastatur (falls Parent-Größe sich geändert hat)
-        parent_height = self.height() if self else 600
-        parent_width = self.width() if self else 1024
-        keyboard_height = 250  # Weiter reduziert auf 250px
-        # Tastatur 40 Pixel nach oben verschoben
-        self.keyboard_widget.setGeometry(0, parent_height - keyboard_height - 40, parent_width, keyboard_height)
+        self.keyboard_widget.update_position()
         
         self.keyboard_widget.show()
         self.keyboard_widget.raise_()
@@ -1941,53 +2336,53 @@ class WifiSettingsWidget(QWidget):
             logger.error("Kein SSID ausgewählt")
             return
         
-        # Zeige Verbindungsanzeige
-        connecting_label = QLabel(f"Verbinde mit {self.selected_ssid}...")
-        connecting_label.setStyleSheet("font-size: 18px; color: #3498db; padding: 20px; text-align: center;")
-        connecting_label.setAlignment(Qt.AlignCenter)
-        connecting_label.setWordWrap(True)
-        self.network_layout.insertWidget(0, connecting_label)
-        self.connecting_label = connecting_label
-        
-        # Aktualisiere UI sofort
-        QApplication.processEvents()
+        # Zeige Verbindungsanzeige (wird beim nächsten Durchlauf der Event-Loop gezeichnet)
+        self.connecting_banner.setText(f"Verbinde mit {self.selected_ssid}...")
+        self.connecting_banner.show()
         
         def connect():
             try:
                 logger.info(f"Starte Verbindung zu {self.selected_ssid} (Passwort vorhanden: {bool(password)})")
                 
-                # Lösche eventuell vorhandene Verbindung mit gleichem Namen
-                logger.info("Lösche eventuell vorhandene Verbindung...")
-                subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'delete', self.selected_ssid], 
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+                # Bevorzugt direkt über die D-Bus-API von NetworkManager (ein Aufruf statt mehrerer nmcli-Prozesse)
+                dbus_result = connect_wifi(self.selected_ssid, password) if WIFI_DBUS_AVAILABLE else None
+                if dbus_result is not None:
+                    success, error_msg = dbus_result
+                    if success:
+                        logger.info(f"Verbindung erfolgreich zu {self.selected_ssid} (D-Bus)")
+                        self.connection_success.emit()
+                    else:
+                        logger.error(f"Verbindung fehlgeschlagen (D-Bus): {error_msg}")
+                        self.connection_error.emit(error_msg)
+                    return
+                
+                # Lösche vorhandene Verbindung mit gleichem Namen (nur wenn laut gecachter Liste vorhanden)
+                try:
+                    exists = self.selected_ssid in _list_known_wifi_connections(WifiSettingsWidget._known_version)
+                except Exception as e:
+                    logger.warning(f"Gespeicherte Verbindungen nicht lesbar, lösche vorsorglich: {e}")
+                    exists = True
+                if exists:
+                    logger.info("Lösche vorhandene Verbindung...")
+                    subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'delete', self.selected_ssid], 
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 
                 if password and password.strip():
                     # Netzwerk mit Passwort - verwende manuelle Verbindungserstellung
                     logger.info("Erstelle WLAN-Verbindung mit Passwort...")
                     
-                    # Finde verfügbares WLAN-Interface
-                    result = subprocess.run(['nmcli', '-t', '-f', 'DEVICE,TYPE', 'device', 'status'], 
-                                          capture_output=True, text=True, timeout=5)
-                    wifi_device = None
-                    if result.returncode == 0:
-                        for line in result.stdout.strip().split('\n'):
-                            if ':wifi' in line:
-                                wifi_device = line.split(':')[0]
-                                break
+                    # Finde verfügbares WLAN-Interface (gecacht)
+                    try:
+                        wifi_device = _find_wifi_device()
+                    except Exception as e:
+                        logger.warning(f"WLAN-Interface nicht ermittelt, verbinde ohne ifname: {e}")
+                        wifi_device = None
                     
                     # Erstelle Verbindung mit expliziten Parametern für stabile Verbindung
-                    # connection.autoconnect=yes sorgt für automatische Verbindung nach Reboot
-                    # connection.autoconnect-priority=10 gibt höhere Priorität (wird zuerst verbunden)
-                    # wifi.powersave=2 deaktiviert Power-Management (verhindert Verbindungsabbrüche)
-                    cmd = ['sudo', '-n', 'nmcli', 'connection', 'add', 
-                           'type', 'wifi',
+                    cmd = [*_NMCLI_ADD_SECURED_CMD,
                            'con-name', self.selected_ssid,
                            'ssid', self.selected_ssid,
-                           'wifi-sec.key-mgmt', 'wpa-psk',
-                           'wifi-sec.psk', password,
-                           'connection.autoconnect', 'yes',
-                           'connection.autoconnect-priority', '10',
-                           'wifi.powersave', '2']
+                           'wifi-sec.psk', password]
                     
                     if wifi_device:
                         cmd.extend(['ifname', wifi_device])
@@ -2002,16 +2397,7 @@ class WifiSettingsWidget(QWidget):
                         logger.warning(f"connection add stderr: {result.stderr[:200]}")
                     
                     if result.returncode == 0:
-                        # Stelle sicher, dass Verbindung stabil konfiguriert ist
-                        try:
-                            subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'modify', self.selected_ssid, 
-                                          'wifi.powersave', '2',
-                                          'connection.autoconnect-priority', '10'], 
-                                         capture_output=True, text=True, timeout=5)
-                        except Exception as e:
-                            logger.warning(f"Konnte Verbindungs-Einstellungen nicht optimieren: {e}")
-                        
-                        # Aktiviere die Verbindung
+                        # Aktiviere die Verbindung (powersave/priority wurden bereits beim add gesetzt)
                         logger.info(f"Aktiviere Verbindung: {self.selected_ssid}")
                         cmd = ['sudo', '-n', 'nmcli', 'connection', 'up', self.selected_ssid]
                         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
@@ -2021,28 +2407,6 @@ class WifiSettingsWidget(QWidget):
                             logger.info(f"connection up stdout: {result.stdout[:200]}")
                         if result.stderr:
                             logger.warning(f"connection up stderr: {result.stderr[:200]}")
-                        
-                        # Stelle sicher, dass die Verbindung stabil konfiguriert ist
-                        try:
-                            # Power-Management deaktivieren (verhindert Verbindungsabbrüche)
-                            subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'modify', self.selected_ssid, 
-                                          'wifi.powersave', '2'], 
-                                         capture_output=True, text=True, timeout=5)
-                            # Priorität erhöhen (wird bevorzugt verbunden)
-                            subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'modify', self.selected_ssid, 
-                                          'connection.autoconnect-priority', '10'], 
-                                         capture_output=True, text=True, timeout=5)
-                            logger.info(f"Verbindung {self.selected_ssid} stabil konfiguriert (powersave=off, priority=10)")
-                        except Exception as e:
-                            logger.warning(f"Konnte Verbindungs-Einstellungen nicht optimieren: {e}")
-                        
-                        # Prüfe ob die Verbindung existiert
-                        check_cmd = ['nmcli', 'connection', 'show', self.selected_ssid]
-                        check_result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=5)
-                        if check_result.returncode == 0:
-                            logger.info(f"Verbindung {self.selected_ssid} wurde persistent gespeichert")
-                        else:
-                            logger.warning(f"Verbindung {self.selected_ssid} konnte nicht verifiziert werden")
                     else:
                         # Fallback: Versuche direkte Verbindung
                         logger.info("Fallback: Versuche direkte Verbindung...")
@@ -2051,19 +2415,11 @@ class WifiSettingsWidget(QWidget):
                 else:
                     # Offenes Netzwerk ohne Passwort - auch persistent speichern
                     logger.info("Erstelle Verbindung zu offenem Netzwerk...")
-                    # Lösche eventuell vorhandene Verbindung
-                    subprocess.run(['sudo', '-n', 'nmcli', 'connection', 'delete', self.selected_ssid], 
-                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                     
                     # Erstelle Verbindung für offenes Netzwerk (ohne Passwort)
-                    # wifi.powersave=2 deaktiviert Power-Management (verhindert Verbindungsabbrüche)
-                    cmd = ['sudo', '-n', 'nmcli', 'connection', 'add',
-                           'type', 'wifi',
+                    cmd = [*_NMCLI_ADD_OPEN_CMD,
                            'con-name', self.selected_ssid,
-                           'ssid', self.selected_ssid,
-                           'connection.autoconnect', 'yes',
-                           'connection.autoconnect-priority', '10',
-                           'wifi.powersave', '2']
+                           'ssid', self.selected_ssid]
                     
                     result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
                     
@@ -2080,10 +2436,8 @@ class WifiSettingsWidget(QWidget):
                     logger.warning(f"Finaler stderr: {result.stderr[:200]}")
                 
                 if result.returncode == 0:
+                    # 'nmcli connection up' kehrt erst nach vollständiger Aktivierung zurück - kein zusätzliches Warten nötig
                     logger.info(f"Verbindung erfolgreich zu {self.selected_ssid}")
-                    # Warte kurz, damit die Verbindung stabilisiert wird
-                    import time
-                    time.sleep(2)
                     self.connection_success.emit()
                 else:
                     error_msg = result.stderr.strip() or result.stdout.strip() or "Verbindung fehlgeschlagen"
@@ -2096,49 +2450,30 @@ class WifiSettingsWidget(QWidget):
                 logger.error(f"Fehler beim Verbinden: {e}", exc_info=True)
                 self.connection_error.emit(f"Fehler: {str(e)}")
         
-        # Starte Verbindung in separatem Thread
-        import threading
-        connect_thread = threading.Thread(target=connect, daemon=True)
-        connect_thread.start()
+        # Starte Verbindung im Thread-Pool
+        QThreadPool.globalInstance().start(_TaskRunnable(connect))
     
     def show_connection_success(self):
         """Zeigt Erfolgsmeldung"""
-        # Entferne Verbindungsanzeige
-        if self.connecting_label:
-            self.network_layout.removeWidget(self.connecting_label)
-            self.connecting_label.deleteLater()
-            self.connecting_label = None
-        
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Information)
-        msg.setWindowTitle("Erfolg")
-        msg.setText(f"Verbunden mit {self.selected_ssid}")
-        msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                         "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                         "QPushButton { background-color: #3498db; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                         "QPushButton:hover { background-color: #2980b9; }")
-        msg.exec_()
+        # Gespeicherte Verbindungen haben sich geändert
+        WifiSettingsWidget._known_version += 1
+        # Verstecke Verbindungsanzeige
+        self.connecting_banner.hide()
+        
+        _styled_msgbox(self, QMessageBox.Information, "Erfolg", f"Verbunden mit {self.selected_ssid}").exec_()
         
-        # Aktualisiere Netzwerkliste nach kurzer Verzögerung
-        QTimer.singleShot(1000, self.scan_networks)
+        # Aktualisiere Netzwerkliste nach kurzer Verzögerung (bekannte Netzwerke haben sich geändert)
+        QTimer.singleShot(1000, lambda: self.scan_networks(force=True))
     
     def show_connection_error(self, error):
         """Zeigt Fehlermeldung"""
-        # Entferne Verbindungsanzeige
-        if self.connecting_label:
-            self.network_layout.removeWidget(self.connecting_label)
-            self.connecting_label.deleteLater()
-            self.connecting_label = None
-        
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Critical)
-        msg.setWindowTitle("Fehler")
-        msg.setText(f"Verbindung fehlgeschlagen:\n{error}")
-        msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                         "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                         "QPushButton { background-color: #e74c3c; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                         "QPushButton:hover { background-color: #c0392b; }")
-        msg.exec_()
+        # Ein fehlgeschlagener Verbindungsversuch kann ein altes Profil bereits gelöscht haben
+        WifiSettingsWidget._known_version += 1
+        # Verstecke Verbindungsanzeige
+        self.connecting_banner.hide()
+        
+        _styled_msgbox(self, QMessageBox.Critical, "Fehler", f"Verbindung fehlgeschlagen:\n{error}",
+                       _MSGBOX_ERROR_QSS).exec_()
     
     def go_back(self):
         """Geht zurück zum Menü und aktualisiert WLAN-Informationen"""
@@ -2154,14 +2489,12 @@ class WifiSettingsWidget(QWidget):
             
             # Zeige Menü wieder an und aktualisiere WLAN-Info (prüfe ob Widget noch existiert)
             if hasattr(self.main_window, 'current_menu') and self.main_window.current_menu:
-                try:
-                    # Prüfe ob Widget noch existiert (durch Zugriff auf eine Eigenschaft)
-                    _ = self.main_window.current_menu.isVisible()
+                if _alive(self.main_window.current_menu):
                     # Aktualisiere WLAN-Info-Widget im Menü
                     self.main_window.update_wifi_info_in_menu()
                     self.main_window.current_menu.show()
                     self.main_window.menu_visible = True
-                except RuntimeError:
+                else:
                     # Widget wurde bereits gelöscht, erstelle neues Menü
                     logger.debug("Menü-Widget wurde gelöscht, erstelle neues Menü")
                     self.main_window.current_menu = None
@@ -2172,16 +2505,66 @@ class WifiSettingsWidget(QWidget):
 
 class TouchKeyboard(QWidget):
     """Vollständige QWERTZ-Touch-Tastatur mit Groß-/Kleinschreibung und Sonderzeichen"""
+    # Ein Stylesheet für die ganze Tastatur (einmal geparst); Tasten wählen ihre Regel per Property "kind"
+    _KEYBOARD_QSS = """
+        * {
+            background: #2c3e50; border-radius: 12px; border: 2px solid #34495e;
+        }
+        QPushButton[kind="key"] {
+            font-size: 15px; font-weight: bold; padding: 6px;
+            background: #ecf0f1; color: #2c3e50;
+            border: 2px solid #bdc3c7; border-radius: 5px;
+            min-width: 38px; min-height: 35px;
+        }
+        QPushButton[kind="key"]:pressed {
+            background: #bdc3c7;
+        }
+        QPushButton[kind="shift"], QPushButton[kind="special"] {
+            font-size: 13px; font-weight: bold; padding: 8px 12px;
+            background: #95a5a6; color: white; border: 2px solid #7f8c8d;
+            border-radius: 5px; min-width: 55px; min-height: 35px;
+        }
+        QPushButton[kind="shift"]:checked {
+            background: #3498db; border-color: #2980b9;
+        }
+        QPushButton[kind="special"]:checked {
+            background: #9b59b6; border-color: #8e44ad;
+        }
+        QPushButton[kind="space"] {
+            font-size: 15px; font-weight: bold; padding: 8px 70px;
+            background: #ecf0f1; color: #2c3e50; border: 2px solid #bdc3c7;
+            border-radius: 5px; min-height: 35px;
+        }
+        QPushButton[kind="backspace"], QPushButton[kind="done"] {
+            font-size: 15px; font-weight: bold; padding: 8px 18px;
+            color: white; border: none; border-radius: 5px;
+            min-width: 65px; min-height: 35px;
+        }
+        QPushButton[kind="backspace"] {
+            background: #e74c3c;
+        }
+        QPushButton[kind="done"] {
+            background: #2ecc71;
+        }
+    """
+    
     def __init__(self, parent, input_field):
         super().__init__(parent)
         self.input_field = input_field
+        self._bind_input_field()
         self.shift_pressed = False
         self.special_mode = False
+        # Zeichen-Tasten und Shift-Taste merken (statt bei jedem Tastendruck findChildren zu durchsuchen)
+        self._key_buttons = []
+        self._shift_btn = None
+        # Parent-Größe, für die die Tastatur zuletzt positioniert wurde
+        self._placed_for = None
         self.setup_keyboard()
     
     def set_input_field(self, input_field):
         """Setzt das aktuelle Eingabefeld"""
         self.input_field = input_field
+        self._bind_input_field()
     
     def setup_keyboard(self):
         """Erstellt die vollständige Touch-Tastatur - kompakt für 1024x600 Bildschirm"""
@@ -2241,18 +2624,10 @@ class TouchKeyboard(QWidget):
         # Shift-Taste
         shift_btn = QPushButton("SHIFT")
         shift_btn.setCheckable(True)
-        shift_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 13px; font-weight: bold; padding: 8px 12px;
-                background: #95a5a6; color: white; border: 2px solid #7f8c8d;
-                border-radius: 5px; min-width: 55px; min-height: 35px;
-            }
-            QPushButton:checked {
-                background: #3498db; border-color: #2980b9;
-            }
-        """)
+        shift_btn.setProperty("kind", "shift")
         shift_btn.clicked.connect(self.toggle_shift)
         row4.addWidget(shift_btn)
+        self._shift_btn = shift_btn
         
         for char in "yxcvbnm":
             btn = self.create_key_button(char, char.upper())
@@ -2276,61 +2651,48 @@ class TouchKeyboard(QWidget):
         # Sonderzeichen-Modus (vorerst deaktiviert)
         special_btn = QPushButton("123")
         special_btn.setCheckable(True)
-        special_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 13px; font-weight: bold; padding: 8px 12px;
-                background: #95a5a6; color: white; border: 2px solid #7f8c8d;
-                border-radius: 5px; min-width: 55px; min-height: 35px;
-            }
-            QPushButton:checked {
-                background: #9b59b6; border-color: #8e44ad;
-            }
-        """)
+        special_btn.setProperty("kind", "special")
         special_btn.clicked.connect(self.toggle_special)
         row5.addWidget(special_btn)
         
         # Leertaste
         space_btn = QPushButton("Leertaste")
-        space_btn.setStyleSheet("font-size: 15px; font-weight: bold; padding: 8px 70px; background: #ecf0f1; color: #2c3e50; border: 2px solid #bdc3c7; border-radius: 5px; min-height: 35px;")
+        space_btn.setProperty("kind", "space")
         space_btn.clicked.connect(lambda: self.add_char(" "))
         row5.addWidget(space_btn)
         
         # Backspace
         backspace_btn = QPushButton("Zurueck")
-        backspace_btn.setStyleSheet("font-size: 15px; font-weight: bold; padding: 8px 18px; background: #e74c3c; color: white; border: none; border-radius: 5px; min-width: 65px; min-height: 35px;")
+        backspace_btn.setProperty("kind", "backspace")
         backspace_btn.clicked.connect(self.backspace)
         row5.addWidget(backspace_btn)
         
         # Fertig
         done_btn = QPushButton("Fertig")
-        done_btn.setStyleSheet("font-size: 15px; font-weight: bold; padding: 8px 18px; background: #2ecc71; color: white; border: none; border-radius: 5px; min-width: 65px; min-height: 35px;")
+        done_btn.setProperty("kind", "done")
         done_btn.clicked.connect(self.hide)
         row5.addWidget(done_btn)
         main_layout.addLayout(row5)
         
         self.setLayout(main_layout)
-        self.setStyleSheet("background: #2c3e50; border-radius: 12px; border: 2px solid #34495e;")
+        self.setStyleSheet(TouchKeyboard._KEYBOARD_QSS)
         # Positioniere Tastatur am unteren Rand - kompakt für 1024x600 Bildschirm
-        parent_height = self.parent().height() if self.parent() else 600
-        parent_width = self.parent().width() if self.parent() else 1024
+        self.update_position()
+    
+    def update_position(self):
+        """Positioniert die Tastatur am unteren Rand des Parents (nur wenn sich dessen Größe geändert hat)"""
+        parent_size = self.parent().size() if self.parent() else QSize(1024, 600)
+        if parent_size == self._placed_for:
+            return
+        self._placed_for = QSize(parent_size)
         keyboard_height = 250  # Weiter reduziert auf 250px, damit alle Buttons sichtbar sind
         # Tastatur am unteren Rand, aber 40 Pixel nach oben verschoben
-        self.setGeometry(0, parent_height - keyboard_height - 40, parent_width, keyboard_height)
+        self.setGeometry(0, parent_size.height() - keyboard_height - 40, parent_size.width(), keyboard_height)
     
     def create_key_button(self, normal_char, shift_char):
         """Erstellt einen Tasten-Button mit normaler und Shift-Variante - kompakt"""
         btn = QPushButton()
-        btn.setStyleSheet("""
-            QPushButton {
-                font-size: 15px; font-weight: bold; padding: 6px;
-                background: #ecf0f1; color: #2c3e50;
-                border: 2px solid #bdc3c7; border-radius: 5px;
-                min-width: 38px; min-height: 35px;
-            }
-            QPushButton:pressed {
-                background: #bdc3c7;
-            }
-        """)
+        btn.setProperty("kind", "key")
         
         # Speichere beide Zeichen
         btn.normal_char = normal_char
@@ -2340,6 +2702,7 @@ class TouchKeyboard(QWidget):
         self.update_button_text(btn)
         
         btn.clicked.connect(lambda checked, b=btn: self.add_char_from_button(b))
+        self._key_buttons.append(btn)
         return btn
     
     def update_button_text(self, btn):
@@ -2349,13 +2712,21 @@ class TouchKeyboard(QWidget):
         else:
             btn.setText(btn.normal_char)
     
+    def update_all_button_texts(self):
+        """Aktualisiert alle Tasten-Buttons mit einem einzigen Repaint"""
+        self.setUpdatesEnabled(False)
+        try:
+            for btn in self._key_buttons:
+                self.update_button_text(btn)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+    
     def toggle_shift(self):
         """Wechselt zwischen Groß- und Kleinschreibung"""
         self.shift_pressed = not self.shift_pressed
         # Aktualisiere alle Tasten-Buttons (aber nicht Shift-Button selbst)
-        for widget in self.findChildren(QPushButton):
-            if hasattr(widget, 'normal_char'):
-                self.update_button_text(widget)
+        self.update_all_button_texts()
     
     def toggle_special(self):
         """Wechselt zu Sonderzeichen-Modus (noch nicht implementiert)"""
@@ -2368,92 +2739,198 @@ class TouchKeyboard(QWidget):
             # Nach Eingabe Shift automatisch zurücksetzen
             self.shift_pressed = False
             # Aktualisiere Shift-Button
-            shift_btn = None
-            for widget in self.findChildren(QPushButton):
-                if widget.isCheckable() and widget.text() == "SHIFT":
-                    shift_btn = widget
-                    break
-            if shift_btn:
-                shift_btn.setChecked(False)
+            if self._shift_btn:
+                self._shift_btn.setChecked(False)
             # Aktualisiere alle Tasten-Buttons
-            for widget in self.findChildren(QPushButton):
-                if hasattr(widget, 'normal_char'):
-                    self.update_button_text(widget)
+            self.update_all_button_texts()
         else:
             char = btn.normal_char
         self.add_char(char)
     
     def add_char(self, char):
         """Fügt ein Zeichen zum Eingabefeld hinzu"""
-        if self.input_field:
-            # Unterstütze sowohl QLineEdit als auch QTextEdit und QSpinBox
-            if isinstance(self.input_field, QLineEdit):
-                current_text = self.input_field.text()
-                cursor_pos = self.input_field.cursorPosition()
-                new_text = current_text[:cursor_pos] + char + current_text[cursor_pos:]
-                self.input_field.setText(new_text)
-                self.input_field.setCursorPosition(cursor_pos + 1)
-            elif isinstance(self.input_field, QTextEdit):
-                current_text = self.input_field.toPlainText()
-                cursor = self.input_field.textCursor()
-                cursor_pos = cursor.position()
-                cursor.insertText(char)
-            elif isinstance(self.input_field, QSpinBox):
-                # Für SpinBox: Konvertiere zu Text, füge Zeichen hinzu, konvertiere zurück
-                current_value = self.input_field.value()
-                current_text = str(current_value)
-                # Füge Zeichen hinzu und versuche zu konvertieren
-                try:
-                    new_value = int(current_text + char)
-                    if self.input_field.minimum() <= new_value <= self.input_field.maximum():
-                        self.input_field.setValue(new_value)
-                except ValueError:
-                    pass  # Ignoriere ungültige Eingaben
+        if self._insert_char:
+            self._insert_char(char)
     
     def backspace(self):
         """Löscht das letzte Zeichen"""
-        if self.input_field:
-            if isinstance(self.input_field, QLineEdit):
-                current_text = self.input_field.text()
-                cursor_pos = self.input_field.cursorPosition()
-                if cursor_pos > 0:
-                    new_text = current_text[:cursor_pos-1] + current_text[cursor_pos:]
-                    self.input_field.setText(new_text)
-                    self.input_field.setCursorPosition(cursor_pos - 1)
-            elif isinstance(self.input_field, QTextEdit):
-                cursor = self.input_field.textCursor()
-                if cursor.hasSelection():
-                    cursor.removeSelectedText()
-                elif cursor.position() > 0:
-                    cursor.deletePreviousChar()
-            elif isinstance(self.input_field, QSpinBox):
-                # Für SpinBox: Reduziere Wert um 1 oder setze auf Minimum
-                current_value = self.input_field.value()
-                if current_value > self.input_field.minimum():
-                    self.input_field.setValue(current_value - 1)
-                else:
-                    self.input_field.setValue(self.input_field.minimum())
+        if self._delete_char:
+            self._delete_char()
+    
+    def _bind_input_field(self):
+        """Wählt die Einfüge-/Lösch-Funktionen einmalig passend zum Typ des Eingabefelds"""
+        field = self.input_field
+        # Unterstütze sowohl QLineEdit als auch QTextEdit und QSpinBox
+        if isinstance(field, QLineEdit):
+            # Native Funktionen arbeiten direkt an der Cursor-Position (kein Neuaufbau des Texts)
+            self._insert_char = field.insert
+            self._delete_char = field.backspace
+        elif isinstance(field, QTextEdit):
+            self._insert_char = field.insertPlainText
+            self._delete_char = self._text_edit_backspace
+        elif isinstance(field, QSpinBox):
+            self._insert_char = self._spin_box_add_char
+            self._delete_char = self._spin_box_backspace
+        else:
+            self._insert_char = None
+            self._delete_char = None
+    
+    def _text_edit_backspace(self):
+        """Backspace für QTextEdit"""
+        cursor = self.input_field.textCursor()
+        if cursor.hasSelection():
+            cursor.removeSelectedText()
+        elif cursor.position() > 0:
+            cursor.deletePreviousChar()
+    
+    def _spin_box_add_char(self, char):
+        """Für SpinBox: Ziffer rechts an den aktuellen Wert anhängen (nur Ziffern, andere Zeichen ignorieren)"""
+        if not ('0' <= char <= '9'):
+            return
+        current_value = self.input_field.value()
+        # Ziffer anhängen wie bei der Texteingabe (auch bei negativen Werten)
+        digit = ord(char) - 48
+        new_value = current_value * 10 + (digit if current_value >= 0 else -digit)
+        if self.input_field.minimum() <= new_value <= self.input_field.maximum():
+            self.input_field.setValue(new_value)
+    
+    def _spin_box_backspace(self):
+        """Für SpinBox: Reduziere Wert um 1 oder setze auf Minimum"""
+        current_value = self.input_field.value()
+        if current_value > self.input_field.minimum():
+            self.input_field.setValue(current_value - 1)
+        else:
+            self.input_field.setValue(self.input_field.minimum())
 
-class MenuImageManagementWidget(QWidget):
-    """Bildverwaltungs-Widget für das Menü (Grid-Ansicht wie Webinterface)"""
-    def __init__(self, config: ConfigManager, image_processor: ImageProcessor, main_window, parent_menu):
+@lru_cache(maxsize=1)
+def _dark_background_palette() -> QPalette:
+    """Gemeinsame Palette für den dunklen Hintergrund (wird nur einmal erstellt)"""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, _BG_COLOR)
+    palette.setColor(QPalette.WindowText, _FG_COLOR)
+    return palette
+
+@lru_cache(maxsize=8)
+def _qr_pixmap_for(data: str) -> QPixmap:
+    """Erzeugt den QR-Code für das Menü (gecacht - das Menü wird bei jedem Öffnen neu aufgebaut)"""
+    qr = qrcode.QRCode(version=1, box_size=4, border=2)
+    qr.add_data(data)
+    qr.make(fit=True)
+    # Modul-Matrix (inkl. Rand) direkt in ein QImage schreiben statt über PIL und PNG zu gehen
+    matrix = qr.get_matrix()
+    n = len(matrix)
+    fg = QColor(0xec, 0xf0, 0xf1).rgb()  # #ecf0f1
+    bg = QColor(0x2c, 0x3e, 0x50).rgb()  # #2c3e50
+    qimage = QImage(n, n, QImage.Format_RGB32)
+    for y, row in enumerate(matrix):
+        for x, dark in enumerate(row):
+            qimage.setPixel(x, y, fg if dark else bg)
+    # Ganzzahlige Modulgröße (wie box_size=4, höchstens 120px), damit die Module scharf bleiben
+    size = n * max(1, min(4, 120 // n))
+    return QPixmap.fromImage(qimage.scaled(size, size, Qt.IgnoreAspectRatio, Qt.FastTransformation))
+
+class _ThumbnailLoader(QRunnable):
+    """Lädt und skaliert ein Vorschaubild im Thread-Pool (QImage ist im Gegensatz zu QPixmap thread-sicher)"""
+    def __init__(self, path: str, thumb_dir: Path, callback):
         super().__init__()
-        self.config = config
+        self.path = path
+        self.thumb_dir = thumb_dir
+        self.callback = callback
+    
+    def run(self):
+        image = QImage()
+        thumb_path = None
+        try:
+            # Vorschaubild auf der Platte ist an die mtime des Proxys gebunden (veraltete werden nicht gefunden)
+            proxy = Path(self.path)
+            thumb_path = self.thumb_dir / f"{proxy.stem}_{proxy.stat().st_mtime_ns}_200x150.jpg"
+            if thumb_path.exists():
+                image = QImage(str(thumb_path))
+        except OSError:
+            pass
+        if image.isNull():
+            # Direkt in Vorschaugröße dekodieren (libjpeg skaliert beim Dekodieren) statt volles Bild zu laden
+            reader = QImageReader(self.path)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(200, 150, Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                if thumb_path is not None:
+                    try:
+                        self.thumb_dir.mkdir(parents=True, exist_ok=True)
+                        image.save(str(thumb_path), "JPEG", 85)
+                    except OSError as e:
+                        logger.warning(f"Konnte Vorschaubild nicht speichern: {e}")
+        try:
+            self.callback(self.path, image)
+        except RuntimeError:
+            # Widget wurde inzwischen geschlossen
+            pass
+
+class MenuImageManagementWidget(QWidget):
+    """Bildverwaltungs-Widget für das Menü (Grid-Ansicht wie Webinterface)"""
+    # Signal für fertig geladene Vorschaubilder aus dem Thread-Pool
+    thumbnail_loaded = pyqtSignal(str, QImage)
+    # Signal nach dem Löschen im Thread-Pool (Erfolgstext, Fehlermeldung oder "")
+    delete_finished = pyqtSignal(str, str)
+    # Unterverzeichnis der Proxys für die skalierten Vorschaubilder (200x150)
+    _THUMB_DIR_NAME = 'thumbs'
+    # Sucht und löscht Originale parallel zu Proxy-, Metadaten- und Playlist-Updates (Thread entsteht erst bei Bedarf;
+    # nur einer, da parallele Verzeichnissuchen auf derselben SD-Karte sich gegenseitig ausbremsen)
+    _ORIGINALS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='originals')
+    # Kachel-Stylesheet einmal am Grid-Container; Kacheln wählen ihre Regel per Property "kind"
+    # (Label und Button übernehmen margin/border des Containers wie zuvor bei den Einzel-Stylesheets)
+    _GRID_QSS = """
+        * { background-color: #1a1a2e; }
+        QWidget[kind="tile"] {
+            background: #2c3e50; border-radius: 15px; padding: 15px; margin: 10px; border: 2px solid #34495e;
+        }
+        QLabel[kind="tile-image"] {
+            background: #1a1a2e; border-radius: 10px; padding: 5px; margin: 10px; border: 2px solid #34495e;
+        }
+        QPushButton[kind="tile-delete"] {
+            font-size: 18px; font-weight: bold; padding: 12px; margin: 10px;
+            background: #e74c3c; color: white; border: none; border-radius: 8px;
+        }
+        QCheckBox[kind="tile-select"] {
+            font-size: 18px; color: #ecf0f1; padding: 5px; margin: 10px; border: none;
+        }
+        QCheckBox[kind="tile-select"]::indicator {
+            width: 32px; height: 32px;
+        }
+        QLabel[kind="empty"] {
+            font-size: 24px; color: #bdc3c7; padding: 30px; background: #2c3e50; border-radius: 15px; border: 2px solid #34495e;
+        }
+    """
+    
+    def __init__(self, config: ConfigManager, image_processor: ImageProcessor, main_window, parent_menu):
+        super().__init__()
+        self.config = config
         self.image_processor = image_processor
         self.main_window = main_window
         self.parent_menu = parent_menu
+        # Kacheln der aktuellen Liste (Pfad -> (Container, Bild-Label)), werden bei refresh_list abgeglichen
+        self._tiles = {}
+        self._tile_order = []
+        self._empty_label = None
+        # Zum gemeinsamen Löschen ausgewählte Bilder (Pfade)
+        self._selected = set()
+        # Läuft gerade ein Löschvorgang im Hintergrund?
+        self._deleting = False
+        # Ergebnis-Meldungen werden beim ersten Gebrauch erstellt und danach wiederverwendet
+        self._info_msg = None
+        self._err_msg = None
+        self.thumbnail_loaded.connect(self._on_thumbnail_loaded)
+        self.delete_finished.connect(self._on_delete_finished)
         self.setup_ui()
         self.refresh_list()
     
     def setup_ui(self):
         """Erstellt die UI mit Grid-Ansicht"""
-        # Hintergrund ZUERST setzen, bevor Layout erstellt wird
-        self.setStyleSheet("background-color: #1a1a2e;")
+        # Hintergrund ZUERST setzen, bevor Layout erstellt wird (gemeinsame Palette statt zusätzlichem Stylesheet)
         self.setAutoFillBackground(True)
-        palette = self.palette()
-        palette.setColor(self.backgroundRole(), QColor("#1a1a2e"))
-        palette.setColor(self.foregroundRole(), QColor("#ffffff"))
-        self.setPalette(palette)
+        self.setPalette(_dark_background_palette())
         
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
@@ -2465,6 +2942,12 @@ class MenuImageManagementWidget(QWidget):
         title.setStyleSheet("font-size: 32px; font-weight: bold; color: #ffffff; padding: 10px;")
         header_layout.addWidget(title)
         header_layout.addStretch()
+        # Löschen aller ausgewählten Bilder in einem Durchgang (nur sichtbar, wenn etwas ausgewählt ist)
+        self.bulk_delete_btn = QPushButton()
+        self.bulk_delete_btn.setStyleSheet("font-size: 18px; font-weight: bold; padding: 12px 20px; background: #e74c3c; color: white; border: none; border-radius: 8px;")
+        self.bulk_delete_btn.clicked.connect(self.delete_selected_images)
+        self.bulk_delete_btn.hide()
+        header_layout.addWidget(self.bulk_delete_btn)
         back_btn = QPushButton("X")
         back_btn.setStyleSheet("font-size: 20px; font-weight: bold; color: white; background: #e74c3c; border: none; border-radius: 20px; min-width: 50px; min-height: 50px;")
         back_btn.clicked.connect(self.go_back)
@@ -2479,11 +2962,9 @@ class MenuImageManagementWidget(QWidget):
                             "QScrollBar::handle:vertical { background: #34495e; border-radius: 7px; min-height: 30px; } "
                             "QScrollBar::handle:vertical:hover { background: #3498db; }")
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: #1a1a2e;")
+        scroll_content.setStyleSheet(MenuImageManagementWidget._GRID_QSS)
         scroll_content.setAutoFillBackground(True)
-        palette = scroll_content.palette()
-        palette.setColor(scroll_content.backgroundRole(), QColor("#1a1a2e"))
-        scroll_content.setPalette(palette)
+        scroll_content.setPalette(_dark_background_palette())
         self.grid_layout = QGridLayout()
         self.grid_layout.setSpacing(15)
         scroll_content.setLayout(self.grid_layout)
@@ -2493,57 +2974,130 @@ class MenuImageManagementWidget(QWidget):
         self.setLayout(layout)
     
     def refresh_list(self):
-        """Aktualisiert die Bildliste"""
-        # Lösche alte Widgets
-        while self.grid_layout.count():
-            child = self.grid_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
+        """Aktualisiert die Bildliste (nur geänderte Kacheln werden neu erstellt bzw. entfernt)"""
         proxy_dir = Path(self.config.get('paths.proxy_images'))
-        images = sorted(proxy_dir.glob("*.jpg"))
+        thumb_dir = proxy_dir / MenuImageManagementWidget._THUMB_DIR_NAME
+        # os.scandir statt glob: keine Path-Objekte/Stats pro Eintrag, nur für neue Kacheln wird ein Path erstellt
+        try:
+            with os.scandir(proxy_dir) as it:
+                entries = [(entry.name, entry.path) for entry in it if entry.name.endswith('.jpg')]
+        except FileNotFoundError:
+            entries = []
+        entries.sort()
+        paths = [path for _, path in entries]
         
-        if not images:
+        # Unverändert - Grid bleibt wie es ist
+        if paths == self._tile_order and (paths or self._empty_label is not None):
+            return
+        
+        # Alle Kachel-Änderungen gesammelt anwenden: ein Repaint statt einem pro Kachel
+        grid_widget = self.grid_layout.parentWidget()
+        grid_widget.setUpdatesEnabled(False)
+        try:
+            self._apply_tiles(paths, thumb_dir)
+        finally:
+            grid_widget.setUpdatesEnabled(True)
+    
+    def _apply_tiles(self, paths, thumb_dir):
+        """Gleicht die Kacheln im Grid mit der Liste der Proxy-Pfade ab"""
+        # Entfernte Bilder: nur deren Kacheln löschen
+        current = set(paths)
+        for path in [p for p in self._tiles if p not in current]:
+            container, _ = self._tiles.pop(path)
+            self.grid_layout.removeWidget(container)
+            container.deleteLater()
+            self._selected.discard(path)
+        self._update_bulk_delete_btn()
+        
+        if self._empty_label is not None:
+            self.grid_layout.removeWidget(self._empty_label)
+            self._empty_label.deleteLater()
+            self._empty_label = None
+        self._tile_order = paths
+        
+        if not paths:
             no_images_label = QLabel("Keine Bilder vorhanden")
-            no_images_label.setStyleSheet("font-size: 24px; color: #bdc3c7; padding: 30px; background: #2c3e50; border-radius: 15px; border: 2px solid #34495e;")
+            no_images_label.setProperty("kind", "empty")
             no_images_label.setAlignment(Qt.AlignCenter)
             self.grid_layout.addWidget(no_images_label, 0, 0)
+            self._empty_label = no_images_label
             return
         
+        # Bestehende Kacheln aus dem Layout nehmen (ohne sie zu zerstören), damit sie neu positioniert werden können
+        for container, _ in self._tiles.values():
+            self.grid_layout.removeWidget(container)
+        
         # Erstelle Grid (3 Spalten)
         cols = 3
-        for idx, proxy_file in enumerate(images):
+        for idx, path in enumerate(paths):
             row = idx // cols
             col = idx % cols
             
-            # Bild-Container (wie im Menü - einfacher)
-            container = QWidget()
-            container.setStyleSheet("background: #2c3e50; border-radius: 15px; padding: 15px; margin: 10px; border: 2px solid #34495e;")
-            container_layout = QVBoxLayout()
-            container_layout.setContentsMargins(8, 8, 8, 8)
-            container_layout.setSpacing(10)
-            
-            # Bild
-            image_label = QLabel()
-            pixmap = QPixmap(str(proxy_file))
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(200, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                image_label.setPixmap(scaled_pixmap)
-            image_label.setAlignment(Qt.AlignCenter)
-            image_label.setStyleSheet("background: #1a1a2e; border-radius: 10px; padding: 5px;")
-            container_layout.addWidget(image_label)
-            
-            # Löschen-Button
-            delete_btn = QPushButton("Löschen")
-            delete_btn.setStyleSheet("font-size: 18px; font-weight: bold; padding: 12px; background: #e74c3c; color: white; border: none; border-radius: 8px;")
-            delete_btn.clicked.connect(lambda checked, f=proxy_file: self.delete_image(f))
-            container_layout.addWidget(delete_btn)
-            
-            container.setLayout(container_layout)
-            self.grid_layout.addWidget(container, row, col)
+            tile = self._tiles.get(path)
+            if tile is None:
+                tile = self._create_tile(Path(path))
+                self._tiles[path] = tile
+                QThreadPool.globalInstance().start(_ThumbnailLoader(path, thumb_dir, self.thumbnail_loaded.emit))
+            self.grid_layout.addWidget(tile[0], row, col)
+    
+    def _create_tile(self, proxy_file):
+        """Erstellt die Kachel (Container, Bild-Label) für ein Bild"""
+        # Bild-Container (wie im Menü - einfacher)
+        container = QWidget()
+        container.setProperty("kind", "tile")
+        container_layout = QVBoxLayout()
+        container_layout.setContentsMargins(8, 8, 8, 8)
+        container_layout.setSpacing(10)
+        
+        # Bild (Platzhalter, Vorschaubild wird im Thread-Pool geladen)
+        image_label = QLabel()
+        image_label.setMinimumSize(200, 150)
+        image_label.setAlignment(Qt.AlignCenter)
+        image_label.setProperty("kind", "tile-image")
+        container_layout.addWidget(image_label)
+        
+        # Auswahl für gemeinsames Löschen
+        select_box = QCheckBox("Auswählen")
+        select_box.setProperty("kind", "tile-select")
+        select_box.toggled.connect(lambda checked, p=str(proxy_file): self._on_tile_selected(p, checked))
+        container_layout.addWidget(select_box)
+        
+        # Löschen-Button
+        delete_btn = QPushButton("Löschen")
+        delete_btn.setProperty("kind", "tile-delete")
+        delete_btn.clicked.connect(lambda checked, f=proxy_file: self.delete_image(f))
+        container_layout.addWidget(delete_btn)
+        
+        container.setLayout(container_layout)
+        return container, image_label
+    
+    def _on_thumbnail_loaded(self, path, image):
+        """Setzt ein im Hintergrund geladenes Vorschaubild (im GUI-Thread)"""
+        tile = self._tiles.get(path)
+        if tile is None or image.isNull():
+            # Bild wurde inzwischen entfernt oder ist nicht lesbar
+            return
+        tile[1].setPixmap(QPixmap.fromImage(image))
+    
+    def _on_tile_selected(self, path, checked):
+        """Merkt die Auswahl einer Kachel"""
+        if checked:
+            self._selected.add(path)
+        else:
+            self._selected.discard(path)
+        self._update_bulk_delete_btn()
+    
+    def _update_bulk_delete_btn(self):
+        """Zeigt den Sammel-Löschen-Button mit der Anzahl ausgewählter Bilder"""
+        count = len(self._selected)
+        self.bulk_delete_btn.setText(f"Löschen ({count})")
+        self.bulk_delete_btn.setVisible(count > 0)
+        self.bulk_delete_btn.setEnabled(not self._deleting)
     
     def delete_image(self, proxy_file):
         """Löscht ein Bild"""
+        if self._deleting:
+            return
         reply = QMessageBox.question(
             self, "Bild löschen",
             f"Möchten Sie dieses Bild wirklich löschen?",
@@ -2551,59 +3105,115 @@ class MenuImageManagementWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
+            self._delete_and_report([proxy_file], "Bild wurde gelöscht.")
+    
+    def delete_selected_images(self):
+        """Löscht alle ausgewählten Bilder"""
+        self.delete_images([Path(path) for path in self._tile_order if path in self._selected])
+    
+    def delete_images(self, proxy_files):
+        """Löscht mehrere Bilder auf einmal (ein Metadaten-Schreibvorgang, ein Playlist-Update, ein refresh_list)"""
+        if not proxy_files or self._deleting:
+            return
+        reply = QMessageBox.question(
+            self, "Bilder löschen",
+            f"Möchten Sie {len(proxy_files)} Bilder wirklich löschen?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            self._delete_and_report(proxy_files, f"{len(proxy_files)} Bilder wurden gelöscht.")
+    
+    def _delete_and_report(self, proxy_files, success_text):
+        """Löscht die Bilder im Thread-Pool; Liste und Meldung folgen in _on_delete_finished"""
+        self._deleting = True
+        self._update_bulk_delete_btn()
+        
+        def delete():
+            try:
+                self._delete_files(proxy_files)
+                error = ""
+            except Exception as e:
+                logger.error(f"Fehler beim Löschen: {e}", exc_info=True)
+                error = str(e)
             try:
+                self.delete_finished.emit(success_text, error)
+            except RuntimeError:
+                # Widget wurde inzwischen geschlossen
+                pass
+        
+        QThreadPool.globalInstance().start(_TaskRunnable(delete))
+    
+    def _on_delete_finished(self, success_text, error):
+        """Aktualisiert die Liste und zeigt das Ergebnis des Löschens an (im GUI-Thread)"""
+        self._deleting = False
+        # Auch bei Fehlern: bereits gelöschte Bilder aus der Liste entfernen
+        self.refresh_list()
+        self._update_bulk_delete_btn()
+        if not error:
+            msg = self._result_message_box(False)
+            msg.setText(success_text)
+        else:
+            msg = self._result_message_box(True)
+            msg.setText(f"Fehler beim Löschen: {error}")
+        msg.exec_()
+    
+    def _result_message_box(self, error: bool) -> QMessageBox:
+        """Gibt die Erfolgs- bzw. Fehlermeldung zurück; Stylesheet wird nur einmal geparst"""
+        msg = self._err_msg if error else self._info_msg
+        if msg is not None:
+            return msg
+        if not error:
+            msg = _styled_msgbox(self, QMessageBox.Information, "Erfolg", "")
+            self._info_msg = msg
+        else:
+            msg = _styled_msgbox(self, QMessageBox.Critical, "Fehler", "", _MSGBOX_ERROR_QSS)
+            self._err_msg = msg
+        return msg
+    
+    def _delete_files(self, proxy_files):
+        """Löscht Proxys, Vorschaubilder und Originale; Metadaten und Playlists werden einmal für alle aktualisiert"""
+        proxy_dir = Path(self.config.get('paths.proxy_images'))
+        metadata_file = proxy_dir / 'metadata.json'
+        metadata_cache = MetadataCache.for_file(metadata_file)
+        original_dir = Path(self.config.get('paths.original_images'))
+        deleted_hashes = []
+        original_futures = []
+        try:
+            for proxy_file in proxy_files:
                 proxy_hash = proxy_file.stem
-                proxy_file.unlink()
-                # Original auch löschen
-                original_dir = Path(self.config.get('paths.original_images'))
-                for orig_file in original_dir.rglob("*"):
-                    if orig_file.is_file():
-                        orig_hash = self.image_processor._get_file_hash(orig_file)
-                        if orig_hash == proxy_hash:
-                            orig_file.unlink()
-                            break
-                
-                # Metadaten löschen
-                proxy_dir = Path(self.config.get('paths.proxy_images'))
-                metadata_file = proxy_dir / 'metadata.json'
-                if metadata_file.exists():
+                # Original parallel suchen und löschen (Metadaten jetzt lesen, sie werden unten entfernt)
+                original_futures.append(MenuImageManagementWidget._ORIGINALS_EXECUTOR.submit(
+                    self._delete_original, original_dir, proxy_hash, metadata_cache.get(proxy_hash)))
+                proxy_file.unlink(missing_ok=True)
+                deleted_hashes.append(proxy_hash)
+                # Zugehörige Vorschaubilder löschen
+                for thumb_file in (proxy_file.parent / MenuImageManagementWidget._THUMB_DIR_NAME).glob(f"{proxy_hash}_*.jpg"):
                     try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                        if proxy_hash in metadata:
-                            del metadata[proxy_hash]
-                            with open(metadata_file, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                    except Exception as e:
-                        logger.error(f"Fehler beim Löschen der Metadaten: {e}")
-                
-                # Playlists aktualisieren
+                        thumb_file.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+        finally:
+            # Metadaten und Playlists für alle gelöschten Proxys in einem Durchgang aktualisieren
+            if deleted_hashes:
+                metadata_cache.delete_many(deleted_hashes)
                 try:
-                    playlist_manager = PlaylistManager(proxy_dir, metadata_file)
-                    playlist_manager.remove_image(proxy_hash)
+                    playlist_manager = PlaylistManager.for_dir(proxy_dir, metadata_file)
+                    playlist_manager.remove_images(deleted_hashes)
                 except Exception as e:
                     logger.warning(f"Fehler beim Aktualisieren der Playlists: {e}")
-                
-                self.refresh_list()
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Information)
-                msg.setWindowTitle("Erfolg")
-                msg.setText("Bild wurde gelöscht.")
-                msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                                 "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                                 "QPushButton { background-color: #3498db; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                                 "QPushButton:hover { background-color: #2980b9; }")
-                msg.exec_()
-            except Exception as e:
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Critical)
-                msg.setWindowTitle("Fehler")
-                msg.setText(f"Fehler beim Löschen: {e}")
-                msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                                 "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                                 "QPushButton { background-color: #e74c3c; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                                 "QPushButton:hover { background-color: #c0392b; }")
-                msg.exec_()
+            # Auf die Original-Löschungen warten
+            original_errors = [error for error in (future.exception() for future in original_futures) if error]
+            for error in original_errors:
+                logger.error(f"Fehler beim Löschen eines Originals: {error}")
+        if original_errors:
+            raise original_errors[0]
+    
+    def _delete_original(self, original_dir, proxy_hash, image_metadata):
+        """Löscht das Original zu einem Proxy (über gespeicherten Pfad statt alle Originale zu hashen)"""
+        orig_file = find_original_file(original_dir, proxy_hash, image_metadata, self.image_processor)
+        if orig_file is not None:
+            orig_file.unlink(missing_ok=True)
     
     def go_back(self):
         """Geht zurück zum Menü"""
@@ -2615,12 +3225,10 @@ class MenuImageManagementWidget(QWidget):
                 self.main_window.slideshow_widget.show()
             # Zeige Menü wieder an (prüfe ob Widget noch existiert)
             if hasattr(self.main_window, 'current_menu') and self.main_window.current_menu:
-                try:
-                    # Prüfe ob Widget noch existiert (durch Zugriff auf eine Eigenschaft)
-                    _ = self.main_window.current_menu.isVisible()
+                if _alive(self.main_window.current_menu):
                     self.main_window.current_menu.show()
                     self.main_window.menu_visible = True
-                except RuntimeError:
+                else:
                     # Widget wurde bereits gelöscht, erstelle neues Menü
                     logger.debug("Menü-Widget wurde gelöscht, erstelle neues Menü")
                     self.main_window.current_menu = None
@@ -2629,6 +3237,41 @@ class MenuImageManagementWidget(QWidget):
         except Exception as e:
             logger.error(f"Fehler beim Zurückkehren zum Menü: {e}", exc_info=True)
 
+# Gemeinsames Stylesheet der Einstellungs-Widgets; Kind-Widgets wählen ihre Regel über die Property "kind"
+_SETTINGS_QSS = """
+    * { background-color: #1a1a2e; }
+    QLabel[kind="title"] { font-size: 28px; font-weight: bold; color: #ffffff; padding: 5px; }
+    QLabel[kind="section-top"], QLabel[kind="section"] {
+        font-size: 24px; font-weight: bold; color: #ecf0f1; padding: 10px 0; border-bottom: 2px solid #34495e;
+    }
+    QLabel[kind="section"] { padding: 20px 0 10px 0; }
+    QLabel[kind="field-label"], QCheckBox[kind="field-label"] { font-size: 20px; color: #ecf0f1; padding: 10px 0; }
+    QLineEdit[kind="field"], QAbstractSpinBox[kind="field"] {
+        font-size: 20px; padding: 15px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 10px;
+    }
+    QAbstractSpinBox[kind="value"] {
+        font-size: 28px; font-weight: bold; padding: 20px; background: #2c3e50; color: #ecf0f1;
+        border: 2px solid #34495e; border-radius: 12px;
+    }
+    QAbstractSpinBox[kind="field"] QLineEdit, QAbstractSpinBox[kind="value"] QLineEdit { background: #2c3e50; }
+    QPushButton[kind="minus"], QPushButton[kind="plus"] {
+        font-size: 32px; font-weight: bold; padding: 20px 30px; background: #e74c3c; color: white;
+        border: none; border-radius: 12px; min-width: 80px; min-height: 60px;
+    }
+    QPushButton[kind="plus"] { background: #2ecc71; }
+    QPushButton[kind="keyboard"] {
+        font-size: 16px; font-weight: bold; padding: 10px 15px; background: #3498db; color: white;
+        border: none; border-radius: 8px; min-width: 100px;
+    }
+    QPushButton[kind="save"] {
+        font-size: 22px; font-weight: bold; padding: 20px; background: #2ecc71; color: white; border: none; border-radius: 12px;
+    }
+    QPushButton[kind="close"] {
+        font-size: 18px; font-weight: bold; color: white; background: #e74c3c; border: none;
+        border-radius: 18px; min-width: 45px; min-height: 45px;
+    }
+"""
+
 class SettingsWidget(QWidget):
     """Einstellungs-Widget"""
     # Signal für thread-sichere Email-Test-Updates
@@ -2641,6 +3284,8 @@ class SettingsWidget(QWidget):
         self.current_input = None
         self.keyboard_widget = None
         self._initialized = False
+        # Email-Abschnitt wird erst beim ersten Anzeigen gebaut (Widget liegt ab Start im StackedWidget)
+        self._email_built = False
         # Verbinde Signal mit Slot
         self.email_test_result.connect(self._on_email_test_result)
         self.setup_ui()
@@ -2652,16 +3297,17 @@ class SettingsWidget(QWidget):
         super().showEvent(event)
         if not self._initialized:
             self._initialized = True
+            self._build_email_section()
             self.load_settings()
     
     def setup_ui(self):
         """Erstellt die UI-Elemente"""
         # Hintergrund ZUERST setzen, bevor Layout erstellt wird
-        self.setStyleSheet("background-color: #1a1a2e;")
+        self.setStyleSheet(_SETTINGS_QSS)
         self.setAutoFillBackground(True)
         palette = self.palette()
-        palette.setColor(self.backgroundRole(), QColor("#1a1a2e"))
-        palette.setColor(self.foregroundRole(), QColor("#ffffff"))
+        palette.setColor(self.backgroundRole(), _BG_COLOR)
+        palette.setColor(self.foregroundRole(), _FG_COLOR)
         self.setPalette(palette)
         
         layout = QVBoxLayout()
@@ -2672,11 +3318,11 @@ class SettingsWidget(QWidget):
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(0, 0, 0, 0)
         title = QLabel("Einstellungen")
-        title.setStyleSheet("font-size: 28px; font-weight: bold; color: #ffffff; padding: 5px;")
+        title.setProperty("kind", "title")
         header_layout.addWidget(title)
         header_layout.addStretch()
         back_btn = QPushButton("X")
-        back_btn.setStyleSheet("font-size: 18px; font-weight: bold; color: white; background: #e74c3c; border: none; border-radius: 18px; min-width: 45px; min-height: 45px;")
+        back_btn.setProperty("kind", "close")
         back_btn.clicked.connect(self.go_back)
         header_layout.addWidget(back_btn)
         layout.addLayout(header_layout)
@@ -2689,10 +3335,9 @@ class SettingsWidget(QWidget):
                             "QScrollBar::handle:vertical { background: #34495e; border-radius: 7px; min-height: 30px; } "
                             "QScrollBar::handle:vertical:hover { background: #3498db; }")
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: #1a1a2e;")
         scroll_content.setAutoFillBackground(True)
         palette = scroll_content.palette()
-        palette.setColor(scroll_content.backgroundRole(), QColor("#1a1a2e"))
+        palette.setColor(scroll_content.backgroundRole(), _BG_COLOR)
         scroll_content.setPalette(palette)
         scroll_layout = QVBoxLayout()
         scroll_layout.setContentsMargins(10, 10, 10, 10)
@@ -2700,7 +3345,7 @@ class SettingsWidget(QWidget):
         
         # Slideshow-Einstellungen (vereinfacht, Touch-optimiert)
         slideshow_group = QLabel("Slideshow")
-        slideshow_group.setStyleSheet("font-size: 24px; font-weight: bold; color: #ecf0f1; padding: 10px 0; border-bottom: 2px solid #34495e;")
+        slideshow_group.setProperty("kind", "section-top")
         scroll_layout.addWidget(slideshow_group)
         
         # Automatische Slideshow
@@ -2723,43 +3368,43 @@ class SettingsWidget(QWidget):
         
         # Intervall (Touch-optimiert mit +/- Buttons)
         interval_label = QLabel("Wechsel alle (Sekunden):")
-        interval_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
+        interval_label.setProperty("kind", "field-label")
         scroll_layout.addWidget(interval_label)
         interval_container = QHBoxLayout()
         interval_container.setSpacing(15)
         
         # Minus-Button
         interval_minus_btn = QPushButton("−")
-        interval_minus_btn.setStyleSheet("font-size: 32px; font-weight: bold; padding: 20px 30px; background: #e74c3c; color: white; border: none; border-radius: 12px; min-width: 80px; min-height: 60px;")
-        interval_minus_btn.clicked.connect(lambda: self.interval_spin.setValue(max(1, self.interval_spin.value() - 1)))
+        interval_minus_btn.setProperty("kind", "minus")
+        interval_minus_btn.clicked.connect(lambda: self.interval_spin.stepBy(-1))
         interval_container.addWidget(interval_minus_btn)
         
         # Wert-Anzeige (groß, Touch-freundlich)
         self.interval_spin = QSpinBox()
         self.interval_spin.setRange(1, 300)
-        self.interval_spin.setStyleSheet("font-size: 28px; font-weight: bold; padding: 20px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 12px; text-align: center;")
+        self.interval_spin.setProperty("kind", "value")
         self.interval_spin.setButtonSymbols(QSpinBox.NoButtons)  # Keine Standard-Buttons
         interval_container.addWidget(self.interval_spin, stretch=1)
         
         # Plus-Button
         interval_plus_btn = QPushButton("+")
-        interval_plus_btn.setStyleSheet("font-size: 32px; font-weight: bold; padding: 20px 30px; background: #2ecc71; color: white; border: none; border-radius: 12px; min-width: 80px; min-height: 60px;")
-        interval_plus_btn.clicked.connect(lambda: self.interval_spin.setValue(min(300, self.interval_spin.value() + 1)))
+        interval_plus_btn.setProperty("kind", "plus")
+        interval_plus_btn.clicked.connect(lambda: self.interval_spin.stepBy(1))
         interval_container.addWidget(interval_plus_btn)
         
         scroll_layout.addLayout(interval_container)
         
         # Fade-Übergang Dauer (Touch-optimiert mit +/- Buttons)
         fade_label = QLabel("Fade-Übergang Dauer (Sekunden, 0 = deaktiviert):")
-        fade_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
+        fade_label.setProperty("kind", "field-label")
         scroll_layout.addWidget(fade_label)
         fade_container = QHBoxLayout()
         fade_container.setSpacing(15)
         
         # Minus-Button
         fade_minus_btn = QPushButton("−")
-        fade_minus_btn.setStyleSheet("font-size: 32px; font-weight: bold; padding: 20px 30px; background: #e74c3c; color: white; border: none; border-radius: 12px; min-width: 80px; min-height: 60px;")
-        fade_minus_btn.clicked.connect(lambda: self.fade_duration_spin.setValue(max(0.0, round(self.fade_duration_spin.value() - 0.1, 1))))
+        fade_minus_btn.setProperty("kind", "minus")
+        fade_minus_btn.clicked.connect(lambda: self.fade_duration_spin.stepBy(-1))
         fade_container.addWidget(fade_minus_btn)
         
         # Wert-Anzeige
@@ -2768,27 +3413,29 @@ class SettingsWidget(QWidget):
         self.fade_duration_spin.setSuffix(" s")
         self.fade_duration_spin.setSingleStep(0.1)
         self.fade_duration_spin.setDecimals(1)
-        self.fade_duration_spin.setStyleSheet("font-size: 28px; font-weight: bold; padding: 20px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 12px; text-align: center;")
+        self.fade_duration_spin.setProperty("kind", "value")
         self.fade_duration_spin.setButtonSymbols(QDoubleSpinBox.NoButtons)  # Keine Standard-Buttons
         fade_container.addWidget(self.fade_duration_spin, stretch=1)
         
         # Plus-Button
         fade_plus_btn = QPushButton("+")
-        fade_plus_btn.setStyleSheet("font-size: 32px; font-weight: bold; padding: 20px 30px; background: #2ecc71; color: white; border: none; border-radius: 12px; min-width: 80px; min-height: 60px;")
-        fade_plus_btn.clicked.connect(lambda: self.fade_duration_spin.setValue(min(10.0, round(self.fade_duration_spin.value() + 0.1, 1))))
+        fade_plus_btn.setProperty("kind", "plus")
+        fade_plus_btn.clicked.connect(lambda: self.fade_duration_spin.stepBy(1))
         fade_container.addWidget(fade_plus_btn)
         
         scroll_layout.addLayout(fade_container)
         
         # Sortierung (Dropdown)
         sort_label = QLabel("Sortierung:")
-        sort_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
+        sort_label.setProperty("kind", "field-label")
         scroll_layout.addWidget(sort_label)
         
         self.sort_combo = QComboBox()
         self.sort_combo.addItem("Nach Übertragungszeit", "transfer_time")
         self.sort_combo.addItem("Nach Erstellungszeit (EXIF)", "creation_time")
         self.sort_combo.addItem("Zufällig", "random")
+        # Sortier-Schlüssel -> Combo-Index (einmal aufgebaut statt findData bei jedem Laden)
+        self._sort_index = {self.sort_combo.itemData(i): i for i in range(self.sort_combo.count())}
         self.sort_combo.setStyleSheet("""
             QComboBox {
                 font-size: 22px; color: #ecf0f1; padding: 15px;
@@ -2833,139 +3480,110 @@ class SettingsWidget(QWidget):
         self.shuffle_check.setVisible(False)  # Versteckt, aber vorhanden für Kompatibilität
         scroll_layout.addWidget(self.shuffle_check)
         
+        # Platzhalter für den Email-Abschnitt (siehe _build_email_section)
+        self._email_layout = QVBoxLayout()
+        self._email_layout.setContentsMargins(0, 0, 0, 0)
+        self._email_layout.setSpacing(20)
+        scroll_layout.addLayout(self._email_layout)
+        
+        scroll_layout.addStretch()
+        scroll_content.setLayout(scroll_layout)
+        scroll.setWidget(scroll_content)
+        layout.addWidget(scroll)
+        
+        # Button-Leiste
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(15)
+        
+        # Speichern-Button
+        save_btn = QPushButton("Einstellungen speichern")
+        save_btn.setProperty("kind", "save")
+        save_btn.clicked.connect(self.save_settings)
+        button_layout.addWidget(save_btn)
+        
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+    
+    def _build_email_section(self):
+        """Erstellt die Email-Einstellungen (einmalig, beim ersten Anzeigen)"""
+        if self._email_built:
+            return
+        self._email_built = True
+        email_layout = self._email_layout
+        
         # Email-Einstellungen (einfach, ohne Container)
         email_group = QLabel("Email")
-        email_group.setStyleSheet("font-size: 24px; font-weight: bold; color: #ecf0f1; padding: 20px 0 10px 0; border-bottom: 2px solid #34495e;")
-        scroll_layout.addWidget(email_group)
+        email_group.setProperty("kind", "section")
+        email_layout.addWidget(email_group)
         
         # IMAP Server
         imap_label = QLabel("IMAP Server:")
-        imap_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
-        scroll_layout.addWidget(imap_label)
+        imap_label.setProperty("kind", "field-label")
+        email_layout.addWidget(imap_label)
         imap_container = QHBoxLayout()
         imap_container.setSpacing(10)
         self.imap_server_edit = QLineEdit()
-        self.imap_server_edit.setStyleSheet("font-size: 20px; padding: 15px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 10px;")
+        self.imap_server_edit.setProperty("kind", "field")
         
-        # Sichere mousePressEvent-Behandlung
-        def imap_mouse_press(event):
-            try:
-                QLineEdit.mousePressEvent(self.imap_server_edit, event)
-                # Sichere Lambda-Funktion mit Prüfung
-                def safe_show_keyboard():
-                    try:
-                        if self.imap_server_edit and hasattr(self, 'show_system_keyboard'):
-                            self.show_system_keyboard(self.imap_server_edit)
-                    except Exception as e:
-                        logger.error(f"Fehler beim Anzeigen der Tastatur (IMAP): {e}", exc_info=True)
-                QTimer.singleShot(200, safe_show_keyboard)
-            except Exception as e:
-                logger.error(f"Fehler in imap_mouse_press: {e}", exc_info=True)
-        self.imap_server_edit.mousePressEvent = imap_mouse_press
+        _install_keyboard_on_click(self, self.imap_server_edit)
         imap_container.addWidget(self.imap_server_edit)
         imap_keyboard_btn = QPushButton("⌨ Tastatur")
-        imap_keyboard_btn.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px 15px; background: #3498db; color: white; border: none; border-radius: 8px; min-width: 100px;")
+        imap_keyboard_btn.setProperty("kind", "keyboard")
         imap_keyboard_btn.clicked.connect(lambda checked=False: self.show_system_keyboard(self.imap_server_edit))
         imap_container.addWidget(imap_keyboard_btn)
-        scroll_layout.addLayout(imap_container)
+        email_layout.addLayout(imap_container)
         
         # Benutzername
         username_label = QLabel("Benutzername:")
-        username_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
-        scroll_layout.addWidget(username_label)
+        username_label.setProperty("kind", "field-label")
+        email_layout.addWidget(username_label)
         username_container = QHBoxLayout()
         username_container.setSpacing(10)
         self.username_edit = QLineEdit()
-        self.username_edit.setStyleSheet("font-size: 20px; padding: 15px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 10px;")
+        self.username_edit.setProperty("kind", "field")
         
-        # Sichere mousePressEvent-Behandlung
-        def username_mouse_press(event):
-            try:
-                QLineEdit.mousePressEvent(self.username_edit, event)
-                # Sichere Lambda-Funktion mit Prüfung
-                def safe_show_keyboard():
-                    try:
-                        if self.username_edit and hasattr(self, 'show_system_keyboard'):
-                            self.show_system_keyboard(self.username_edit)
-                    except Exception as e:
-                        logger.error(f"Fehler beim Anzeigen der Tastatur (Username): {e}", exc_info=True)
-                QTimer.singleShot(200, safe_show_keyboard)
-            except Exception as e:
-                logger.error(f"Fehler in username_mouse_press: {e}", exc_info=True)
-        self.username_edit.mousePressEvent = username_mouse_press
+        _install_keyboard_on_click(self, self.username_edit)
         username_container.addWidget(self.username_edit)
         username_keyboard_btn = QPushButton("⌨ Tastatur")
-        username_keyboard_btn.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px 15px; background: #3498db; color: white; border: none; border-radius: 8px; min-width: 100px;")
+        username_keyboard_btn.setProperty("kind", "keyboard")
         username_keyboard_btn.clicked.connect(lambda checked=False: self.show_system_keyboard(self.username_edit))
         username_container.addWidget(username_keyboard_btn)
-        scroll_layout.addLayout(username_container)
+        email_layout.addLayout(username_container)
         
         # Passwort
         password_label = QLabel("Passwort:")
-        password_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
-        scroll_layout.addWidget(password_label)
+        password_label.setProperty("kind", "field-label")
+        email_layout.addWidget(password_label)
         password_container = QHBoxLayout()
         password_container.setSpacing(10)
         self.password_edit = QLineEdit()
         self.password_edit.setEchoMode(QLineEdit.Password)
-        self.password_edit.setStyleSheet("font-size: 20px; padding: 15px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 10px;")
+        self.password_edit.setProperty("kind", "field")
         
-        # Sichere mousePressEvent-Behandlung
-        def password_mouse_press(event):
-            try:
-                QLineEdit.mousePressEvent(self.password_edit, event)
-                # Sichere Lambda-Funktion mit Prüfung
-                def safe_show_keyboard():
-                    try:
-                        if self.password_edit and hasattr(self, 'show_system_keyboard'):
-                            self.show_system_keyboard(self.password_edit)
-                    except Exception as e:
-                        logger.error(f"Fehler beim Anzeigen der Tastatur (Password): {e}", exc_info=True)
-                QTimer.singleShot(200, safe_show_keyboard)
-            except Exception as e:
-                logger.error(f"Fehler in password_mouse_press: {e}", exc_info=True)
-        self.password_edit.mousePressEvent = password_mouse_press
+        _install_keyboard_on_click(self, self.password_edit)
         password_container.addWidget(self.password_edit)
         password_keyboard_btn = QPushButton("⌨ Tastatur")
-        password_keyboard_btn.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px 15px; background: #3498db; color: white; border: none; border-radius: 8px; min-width: 100px;")
+        password_keyboard_btn.setProperty("kind", "keyboard")
         password_keyboard_btn.clicked.connect(lambda: self.show_system_keyboard(self.password_edit))
         password_container.addWidget(password_keyboard_btn)
-        scroll_layout.addLayout(password_container)
+        email_layout.addLayout(password_container)
         
         # Auto-Reply
         self.auto_reply_check = QCheckBox("Automatische Antwort senden")
-        self.auto_reply_check.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
-        scroll_layout.addWidget(self.auto_reply_check)
+        self.auto_reply_check.setProperty("kind", "field-label")
+        email_layout.addWidget(self.auto_reply_check)
         
         # Email Account testen Button
         email_test_btn = QPushButton("Email Account testen")
         email_test_btn.setStyleSheet("font-size: 20px; font-weight: bold; padding: 15px; background: #3498db; color: white; border: none; border-radius: 10px; margin-top: 10px;")
         email_test_btn.clicked.connect(self.test_email_connection)
-        scroll_layout.addWidget(email_test_btn)
+        email_layout.addWidget(email_test_btn)
         
         # Status-Label für Email-Test
         self.email_test_status = QLabel("")
         self.email_test_status.setStyleSheet("font-size: 18px; padding: 10px; margin-top: 10px;")
         self.email_test_status.setWordWrap(True)
-        scroll_layout.addWidget(self.email_test_status)
-        
-        scroll_layout.addStretch()
-        scroll_content.setLayout(scroll_layout)
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
-        
-        # Button-Leiste
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(15)
-        
-        # Speichern-Button
-        save_btn = QPushButton("Einstellungen speichern")
-        save_btn.setStyleSheet("font-size: 22px; font-weight: bold; padding: 20px; background: #2ecc71; color: white; border: none; border-radius: 12px;")
-        save_btn.clicked.connect(self.save_settings)
-        button_layout.addWidget(save_btn)
-        
-        layout.addLayout(button_layout)
-        self.setLayout(layout)
+        email_layout.addWidget(self.email_test_status)
     
     def show_system_keyboard(self, input_field):
         """Zeigt die eigene Touch-Tastatur"""
@@ -2973,20 +3591,14 @@ class SettingsWidget(QWidget):
             logger.info("=== Touch-Tastatur wird angezeigt (Einstellungen) ===")
             
             # Prüfe ob input_field noch existiert und gültig ist
-            try:
-                if not input_field:
-                    logger.warning("Ungültiges Eingabefeld für Tastatur: None")
-                    return
-                # Prüfe ob Widget noch existiert durch Zugriff auf eine Eigenschaft
-                _ = input_field.isVisible()
-                if not hasattr(input_field, 'setFocus'):
-                    logger.warning("Eingabefeld hat keine setFocus-Methode")
-                    return
-            except RuntimeError:
+            if not input_field:
+                logger.warning("Ungültiges Eingabefeld für Tastatur: None")
+                return
+            if not _alive(input_field):
                 logger.warning("Eingabefeld wurde gelöscht")
                 return
-            except Exception as e:
-                logger.warning(f"Fehler beim Prüfen des Eingabefelds: {e}")
+            if not hasattr(input_field, 'setFocus'):
+                logger.warning("Eingabefeld hat keine setFocus-Methode")
                 return
             
             self.current_input = input_field
@@ -2998,52 +3610,29 @@ class SettingsWidget(QWidget):
                 logger.warning(f"Fehler beim Setzen des Focus: {e}")
             
             # Prüfe ob self noch existiert
-            try:
-                _ = self.isVisible()
-            except RuntimeError:
+            if not _alive(self):
                 logger.warning("SettingsWidget wurde gelöscht")
                 return
             
             # Erstelle oder aktualisiere Tastatur-Widget
-            if not self.keyboard_widget:
+            if _alive(self.keyboard_widget):
+                self.keyboard_widget.set_input_field(input_field)
+            else:
+                if self.keyboard_widget is not None:
+                    # Widget wurde gelöscht, erstelle neues
+                    logger.warning("Tastatur-Widget wurde gelöscht, erstelle neues")
                 try:
                     self.keyboard_widget = TouchKeyboard(self, input_field)
                 except Exception as e:
                     logger.error(f"Fehler beim Erstellen der Tastatur: {e}", exc_info=True)
+                    self.keyboard_widget = None
                     return
-            else:
-                # Prüfe ob keyboard_widget noch existiert
-                try:
-                    _ = self.keyboard_widget.isVisible()
-                    self.keyboard_widget.set_input_field(input_field)
-                except RuntimeError:
-                    # Widget wurde gelöscht, erstelle neues
-                    logger.warning("Tastatur-Widget wurde gelöscht, erstelle neues")
-                    try:
-                        self.keyboard_widget = TouchKeyboard(self, input_field)
-                    except Exception as e:
-                        logger.error(f"Fehler beim Neuerstellen der Tastatur: {e}", exc_info=True)
-                        return
             
-            # Aktualisiere Position der Tastatur
+            # Aktualisiere Position der Tastatur (falls Parent-Größe sich geändert hat)
             try:
-                parent_height = self.height() if hasattr(self, 'height') else 600
-                parent_width = self.width() if hasattr(self, 'width') else 1024
-            except Exception:
-                parent_height = 600
-                parent_width = 1024
-            
-            keyboard_height = 250
-            
-            # Prüfe ob keyboard_widget noch existiert vor setGeometry
-            try:
-                _ = self.keyboard_widget.isVisible()
-                self.keyboard_widget.setGeometry(0, parent_height - keyboard_height - 40, parent_width, keyboard_height)
+                self.keyboard_widget.update_position()
                 self.keyboard_widget.show()
                 self.keyboard_widget.raise_()
-            except RuntimeError:
-                logger.warning("Tastatur-Widget wurde während Positionierung gelöscht")
-                self.keyboard_widget = None
             except Exception as e:
                 logger.error(f"Fehler beim Positionieren der Tastatur: {e}", exc_info=True)
         except Exception as e:
@@ -3062,74 +3651,76 @@ class SettingsWidget(QWidget):
         except Exception as e:
             logger.warning(f"Konnte Config nicht neu laden: {e}")
         
-        # Lade Werte aus Config
-        self.auto_play_check.setChecked(self.config.get('slideshow.auto_play', True))
-        self.interval_spin.setValue(self.config.get('slideshow.interval_seconds', 10))
-        self.fade_duration_spin.setValue(self.config.get('slideshow.transition_duration', 1.0))
+        # Lade alle Werte der Seite auf einmal aus der Config
+        cfg = self.config.get_many({
+            'slideshow.auto_play': True,
+            'slideshow.interval_seconds': 10,
+            'slideshow.transition_duration': 1.0,
+            'slideshow.sort_by': None,
+            'slideshow.shuffle': False,
+            'email.imap_server': '',
+            'email.username': '',
+            'email.password': '',
+            'email.auto_reply': True,
+        })
+        self.auto_play_check.setChecked(cfg['slideshow.auto_play'])
+        self.interval_spin.setValue(cfg['slideshow.interval_seconds'])
+        self.fade_duration_spin.setValue(cfg['slideshow.transition_duration'])
         
         # Sortierung laden (mit Fallback auf shuffle für alte Configs)
-        sort_by = self.config.get('slideshow.sort_by', None)
+        sort_by = cfg['slideshow.sort_by']
         if sort_by is None:
             # Fallback: Verwende shuffle-Einstellung
-            if self.config.get('slideshow.shuffle', False):
+            if cfg['slideshow.shuffle']:
                 sort_by = "random"
             else:
                 sort_by = "transfer_time"
         
         # Setze ComboBox auf richtigen Wert
-        index = self.sort_combo.findData(sort_by)
-        if index >= 0:
-            self.sort_combo.setCurrentIndex(index)
-        else:
-            self.sort_combo.setCurrentIndex(0)  # Fallback auf transfer_time
+        self.sort_combo.setCurrentIndex(self._sort_index.get(sort_by, 0))  # Fallback auf transfer_time
         
-        self.shuffle_check.setChecked(self.config.get('slideshow.shuffle', False))
-        self.imap_server_edit.setText(self.config.get('email.imap_server', ''))
-        self.username_edit.setText(self.config.get('email.username', ''))
-        self.password_edit.setText(self.config.get('email.password', ''))
-        self.auto_reply_check.setChecked(self.config.get('email.auto_reply', True))
+        self.shuffle_check.setChecked(cfg['slideshow.shuffle'])
+        if not self._email_built:
+            logger.debug("Einstellungen aus Config geladen (Email-Abschnitt noch nicht erstellt)")
+            return
+        self.imap_server_edit.setText(cfg['email.imap_server'] or '')
+        self.username_edit.setText(cfg['email.username'] or '')
+        self.password_edit.setText(cfg['email.password'] or '')
+        self.auto_reply_check.setChecked(cfg['email.auto_reply'])
         logger.debug("Einstellungen aus Config geladen")
     
     def save_settings(self):
         """Speichert die Einstellungen und wendet sie sofort an"""
-        old_interval = self.config.get('slideshow.interval_seconds', 10)
-        old_shuffle = self.config.get('slideshow.shuffle', False)
-        old_auto_play = self.config.get('slideshow.auto_play', True)
-        old_sort_by = self.config.get('slideshow.sort_by', 'transfer_time')
-        
-        self.config.set('slideshow.auto_play', self.auto_play_check.isChecked())
-        self.config.set('slideshow.interval_seconds', self.interval_spin.value())
-        self.config.set('slideshow.transition_duration', self.fade_duration_spin.value())
+        updates = {
+            'slideshow.auto_play': self.auto_play_check.isChecked(),
+            'slideshow.interval_seconds': self.interval_spin.value(),
+            'slideshow.transition_duration': self.fade_duration_spin.value(),
+        }
         
         # Neue Sortierung speichern
         new_sort_by = self.sort_combo.currentData()
         if new_sort_by:
-            self.config.set('slideshow.sort_by', new_sort_by)
+            updates['slideshow.sort_by'] = new_sort_by
             # Für Kompatibilität: shuffle entsprechend setzen
-            self.config.set('slideshow.shuffle', (new_sort_by == "random"))
+            updates['slideshow.shuffle'] = (new_sort_by == "random")
         else:
             # Fallback: Verwende shuffle-Checkbox
             shuffle_enabled = self.shuffle_check.isChecked()
-            self.config.set('slideshow.shuffle', shuffle_enabled)
-            self.config.set('slideshow.sort_by', "random" if shuffle_enabled else "transfer_time")
-        self.config.set('email.imap_server', self.imap_server_edit.text())
-        self.config.set('email.username', self.username_edit.text())
-        self.config.set('email.password', self.password_edit.text())
-        self.config.set('email.auto_reply', self.auto_reply_check.isChecked())
+            updates['slideshow.shuffle'] = shuffle_enabled
+            updates['slideshow.sort_by'] = "random" if shuffle_enabled else "transfer_time"
+        if self._email_built:
+            updates['email.imap_server'] = self.imap_server_edit.text()
+            updates['email.username'] = self.username_edit.text()
+            updates['email.password'] = self.password_edit.text()
+            updates['email.auto_reply'] = self.auto_reply_check.isChecked()
+        # Alle Werte mit einem Schreibvorgang speichern
+        self.config.update(updates)
         
         # Einstellungen sofort anwenden
         if self.main_window:
             self.main_window.apply_settings()
         
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Information)
-        msg.setWindowTitle("Erfolg")
-        msg.setText("Einstellungen wurden gespeichert und sofort angewendet.")
-        msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                         "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                         "QPushButton { background-color: #3498db; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                         "QPushButton:hover { background-color: #2980b9; }")
-        msg.exec_()
+        _styled_msgbox(self, QMessageBox.Information, "Erfolg", "Einstellungen wurden gespeichert und sofort angewendet.").exec_()
     
     def test_email_connection(self):
         """Testet die Email-Verbindung"""
@@ -3145,16 +3736,11 @@ class SettingsWidget(QWidget):
         self.email_test_status.setText("Teste Email-Verbindung...")
         self.email_test_status.setStyleSheet("font-size: 18px; padding: 10px; margin-top: 10px; color: #3498db;")
         
-        # Teste Email-Verbindung in einem Thread, damit die GUI nicht blockiert
-        from threading import Thread
-        
+        # Teste Email-Verbindung im Thread-Pool, damit die GUI nicht blockiert
         def test_connection():
             try:
                 from email_handler import EmailHandler
-                email_handler = EmailHandler(server=imap_server, port=993, username=username, password=password)
-                
-                if email_handler.connect():
-                    email_handler.disconnect()
+                if EmailHandler.test_login(imap_server, 993, username, password):
                     # Verwende Signal für thread-sichere GUI-Updates
                     self.email_test_result.emit(True, "Email-Verbindung erfolgreich!")
                 else:
@@ -3166,8 +3752,7 @@ class SettingsWidget(QWidget):
                 # Verwende Signal für thread-sichere GUI-Updates
                 self.email_test_result.emit(False, error_msg)
         
-        thread = Thread(target=test_connection, daemon=True)
-        thread.start()
+        QThreadPool.globalInstance().start(_TaskRunnable(test_connection))
     
     def _on_email_test_result(self, success: bool, message: str):
         """Wird aufgerufen wenn Email-Test abgeschlossen ist (thread-sicher über Signal)"""
@@ -3187,6 +3772,18 @@ class SettingsWidget(QWidget):
 
 class DisplaySettingsWidget(QWidget):
     """Bildschirm-Einstellungs-Widget"""
+    # Angezeigte Einstellungen mit Standardwerten
+    _DEFAULTS = {
+        'display.dpms_enabled': False,
+        'display.dpms_standby_minutes': 0,
+        'display.schedule_enabled': False,
+        'display.schedule_on_time': '08:00',
+        'display.schedule_off_time': '22:00',
+    }
+    # apply_dpms_settings hängt auch davon ab, ob die Zeitsteuerung aktiv ist
+    _DPMS_KEYS = frozenset({'display.dpms_enabled', 'display.dpms_standby_minutes', 'display.schedule_enabled'})
+    _SCHEDULE_KEYS = frozenset({'display.schedule_enabled', 'display.schedule_on_time', 'display.schedule_off_time'})
+    
     def __init__(self, config: ConfigManager, main_window=None, parent_menu=None):
         super().__init__()
         self.config = config
@@ -3200,11 +3797,11 @@ class DisplaySettingsWidget(QWidget):
     def setup_ui(self):
         """Erstellt die UI-Elemente"""
         # Hintergrund ZUERST setzen
-        self.setStyleSheet("background-color: #1a1a2e;")
+        self.setStyleSheet(_SETTINGS_QSS)
         self.setAutoFillBackground(True)
         palette = self.palette()
-        palette.setColor(self.backgroundRole(), QColor("#1a1a2e"))
-        palette.setColor(self.foregroundRole(), QColor("#ffffff"))
+        palette.setColor(self.backgroundRole(), _BG_COLOR)
+        palette.setColor(self.foregroundRole(), _FG_COLOR)
         self.setPalette(palette)
         
         layout = QVBoxLayout()
@@ -3215,11 +3812,11 @@ class DisplaySettingsWidget(QWidget):
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(0, 0, 0, 0)
         title = QLabel("Bildschirm-Einstellungen")
-        title.setStyleSheet("font-size: 28px; font-weight: bold; color: #ffffff; padding: 5px;")
+        title.setProperty("kind", "title")
         header_layout.addWidget(title)
         header_layout.addStretch()
         back_btn = QPushButton("X")
-        back_btn.setStyleSheet("font-size: 18px; font-weight: bold; color: white; background: #e74c3c; border: none; border-radius: 18px; min-width: 45px; min-height: 45px;")
+        back_btn.setProperty("kind", "close")
         back_btn.clicked.connect(self.go_back)
         header_layout.addWidget(back_btn)
         layout.addLayout(header_layout)
@@ -3232,10 +3829,9 @@ class DisplaySettingsWidget(QWidget):
                             "QScrollBar::handle:vertical { background: #34495e; border-radius: 7px; min-height: 30px; } "
                             "QScrollBar::handle:vertical:hover { background: #3498db; }")
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: #1a1a2e;")
         scroll_content.setAutoFillBackground(True)
         palette = scroll_content.palette()
-        palette.setColor(scroll_content.backgroundRole(), QColor("#1a1a2e"))
+        palette.setColor(scroll_content.backgroundRole(), _BG_COLOR)
         scroll_content.setPalette(palette)
         scroll_layout = QVBoxLayout()
         scroll_layout.setContentsMargins(10, 10, 10, 10)
@@ -3243,72 +3839,72 @@ class DisplaySettingsWidget(QWidget):
         
         # Automatisches Ausschalten
         dpms_group = QLabel("Automatisches Ausschalten")
-        dpms_group.setStyleSheet("font-size: 24px; font-weight: bold; color: #ecf0f1; padding: 10px 0; border-bottom: 2px solid #34495e;")
+        dpms_group.setProperty("kind", "section-top")
         scroll_layout.addWidget(dpms_group)
         
         # DPMS aktivieren/deaktivieren
         self.dpms_enabled_check = QCheckBox("Bildschirm automatisch ausschalten")
-        self.dpms_enabled_check.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
+        self.dpms_enabled_check.setProperty("kind", "field-label")
         scroll_layout.addWidget(self.dpms_enabled_check)
         
         # DPMS Standby-Zeit
         dpms_label = QLabel("Bildschirm ausschalten nach (Minuten, 0 = deaktiviert):")
-        dpms_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
+        dpms_label.setProperty("kind", "field-label")
         scroll_layout.addWidget(dpms_label)
         dpms_container = QHBoxLayout()
         dpms_container.setSpacing(10)
         self.dpms_standby_spin = QSpinBox()
         self.dpms_standby_spin.setRange(0, 1440)  # 0-24 Stunden
         self.dpms_standby_spin.setSuffix(" Min")
-        self.dpms_standby_spin.setStyleSheet("font-size: 20px; padding: 15px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 10px;")
+        self.dpms_standby_spin.setProperty("kind", "field")
         dpms_container.addWidget(self.dpms_standby_spin)
         dpms_keyboard_btn = QPushButton("⌨ Tastatur")
-        dpms_keyboard_btn.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px 15px; background: #3498db; color: white; border: none; border-radius: 8px; min-width: 100px;")
-        dpms_keyboard_btn.clicked.connect(lambda: self.show_system_keyboard(self.dpms_standby_spin))
+        dpms_keyboard_btn.setProperty("kind", "keyboard")
+        dpms_keyboard_btn.clicked.connect(partial(self._on_keyboard_btn_clicked, self.dpms_standby_spin))
         dpms_container.addWidget(dpms_keyboard_btn)
         scroll_layout.addLayout(dpms_container)
         
         # Zeitgesteuerte Ein/Ausschaltung
         schedule_group = QLabel("Zeitgesteuerte Ein/Ausschaltung")
-        schedule_group.setStyleSheet("font-size: 24px; font-weight: bold; color: #ecf0f1; padding: 20px 0 10px 0; border-bottom: 2px solid #34495e;")
+        schedule_group.setProperty("kind", "section")
         scroll_layout.addWidget(schedule_group)
         
         # Zeitsteuerung aktivieren/deaktivieren
         self.schedule_enabled_check = QCheckBox("Zeitsteuerung aktivieren")
-        self.schedule_enabled_check.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
+        self.schedule_enabled_check.setProperty("kind", "field-label")
         scroll_layout.addWidget(self.schedule_enabled_check)
         
         # Einschaltzeit
         on_time_label = QLabel("Bildschirm einschalten um (HH:MM):")
-        on_time_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
+        on_time_label.setProperty("kind", "field-label")
         scroll_layout.addWidget(on_time_label)
         on_time_container = QHBoxLayout()
         on_time_container.setSpacing(10)
         self.on_time_edit = QLineEdit()
         self.on_time_edit.setPlaceholderText("08:00")
-        self.on_time_edit.setStyleSheet("font-size: 20px; padding: 15px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 10px;")
-        self.on_time_edit.mousePressEvent = lambda e: (QLineEdit.mousePressEvent(self.on_time_edit, e), QTimer.singleShot(200, lambda: self.show_system_keyboard(self.on_time_edit)))
+        self.on_time_edit.setProperty("kind", "field")
+        _install_keyboard_on_click(self, self.on_time_edit)
         on_time_container.addWidget(self.on_time_edit)
         on_time_keyboard_btn = QPushButton("⌨ Tastatur")
-        on_time_keyboard_btn.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px 15px; background: #3498db; color: white; border: none; border-radius: 8px; min-width: 100px;")
-        on_time_keyboard_btn.clicked.connect(lambda: self.show_system_keyboard(self.on_time_edit))
+        on_time_keyboard_btn.setProperty("kind", "keyboard")
+        on_time_keyboard_btn.clicked.connect(partial(self._on_keyboard_btn_clicked, self.on_time_edit))
         on_time_container.addWidget(on_time_keyboard_btn)
         scroll_layout.addLayout(on_time_container)
         
         # Ausschaltzeit
         off_time_label = QLabel("Bildschirm ausschalten um (HH:MM):")
-        off_time_label.setStyleSheet("font-size: 20px; color: #ecf0f1; padding: 10px 0;")
+        off_time_label.setProperty("kind", "field-label")
         scroll_layout.addWidget(off_time_label)
         off_time_container = QHBoxLayout()
         off_time_container.setSpacing(10)
         self.off_time_edit = QLineEdit()
         self.off_time_edit.setPlaceholderText("22:00")
-        self.off_time_edit.setStyleSheet("font-size: 20px; padding: 15px; background: #2c3e50; color: #ecf0f1; border: 2px solid #34495e; border-radius: 10px;")
-        self.off_time_edit.mousePressEvent = lambda e: (QLineEdit.mousePressEvent(self.off_time_edit, e), QTimer.singleShot(200, lambda: self.show_system_keyboard(self.off_time_edit)))
+        self.off_time_edit.setProperty("kind", "field")
+        _install_keyboard_on_click(self, self.off_time_edit)
         off_time_container.addWidget(self.off_time_edit)
         off_time_keyboard_btn = QPushButton("⌨ Tastatur")
-        off_time_keyboard_btn.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px 15px; background: #3498db; color: white; border: none; border-radius: 8px; min-width: 100px;")
-        off_time_keyboard_btn.clicked.connect(lambda: self.show_system_keyboard(self.off_time_edit))
+        off_time_keyboard_btn.setProperty("kind", "keyboard")
+        off_time_keyboard_btn.clicked.connect(partial(self._on_keyboard_btn_clicked, self.off_time_edit))
         off_time_container.addWidget(off_time_keyboard_btn)
         scroll_layout.addLayout(off_time_container)
         
@@ -3323,13 +3919,17 @@ class DisplaySettingsWidget(QWidget):
         
         # Speichern-Button
         save_btn = QPushButton("Einstellungen speichern")
-        save_btn.setStyleSheet("font-size: 22px; font-weight: bold; padding: 20px; background: #2ecc71; color: white; border: none; border-radius: 12px;")
+        save_btn.setProperty("kind", "save")
         save_btn.clicked.connect(self.save_settings)
         button_layout.addWidget(save_btn)
         
         layout.addLayout(button_layout)
         self.setLayout(layout)
     
+    def _on_keyboard_btn_clicked(self, input_field, checked: bool = False):
+        """Tastatur-Button neben einem Eingabefeld"""
+        self.show_system_keyboard(input_field)
+    
     def show_system_keyboard(self, input_field):
         """Zeigt die eigene Touch-Tastatur"""
         logger.info("=== Touch-Tastatur wird angezeigt (Bildschirm-Einstellungen) ===")
@@ -3342,11 +3942,8 @@ class DisplaySettingsWidget(QWidget):
         else:
             self.keyboard_widget.set_input_field(input_field)
         
-        # Aktualisiere Position der Tastatur
-        parent_height = self.height() if self else 600
-        parent_width = self.width() if self else 1024
-        keyboard_height = 250
-        self.keyboard_widget.setGeometry(0, parent_height - keyboard_height - 40, parent_width, keyboard_height)
+        # Aktualisiere Position der Tastatur (falls Parent-Größe sich geändert hat)
+        self.keyboard_widget.update_position()
         
         self.keyboard_widget.show()
         self.keyboard_widget.raise_()
@@ -3358,11 +3955,12 @@ class DisplaySettingsWidget(QWidget):
     
     def load_settings(self):
         """Lädt die aktuellen Einstellungen"""
-        self.dpms_enabled_check.setChecked(self.config.get('display.dpms_enabled', False))
-        self.dpms_standby_spin.setValue(self.config.get('display.dpms_standby_minutes', 0))
-        self.schedule_enabled_check.setChecked(self.config.get('display.schedule_enabled', False))
-        self.on_time_edit.setText(self.config.get('display.schedule_on_time', '08:00'))
-        self.off_time_edit.setText(self.config.get('display.schedule_off_time', '22:00'))
+        cfg = self.config.get_many(self._DEFAULTS)
+        self.dpms_enabled_check.setChecked(cfg['display.dpms_enabled'])
+        self.dpms_standby_spin.setValue(cfg['display.dpms_standby_minutes'])
+        self.schedule_enabled_check.setChecked(cfg['display.schedule_enabled'])
+        self.on_time_edit.setText(cfg['display.schedule_on_time'])
+        self.off_time_edit.setText(cfg['display.schedule_off_time'])
     
     def save_settings(self):
         """Speichert die Einstellungen und wendet sie sofort an"""
@@ -3371,44 +3969,36 @@ class DisplaySettingsWidget(QWidget):
         off_time = self.off_time_edit.text().strip()
         
         # Prüfe Format HH:MM
-        try:
-            if on_time:
-                datetime.strptime(on_time, '%H:%M')
-            if off_time:
-                datetime.strptime(off_time, '%H:%M')
-        except ValueError:
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Warning)
-            msg.setWindowTitle("Fehler")
-            msg.setText("Ungültiges Zeitformat! Bitte verwenden Sie HH:MM (z.B. 08:00)")
-            msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                             "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                             "QPushButton { background-color: #3498db; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                             "QPushButton:hover { background-color: #2980b9; }")
-            msg.exec_()
+        if (on_time and not _HHMM_RE.fullmatch(on_time)) or (off_time and not _HHMM_RE.fullmatch(off_time)):
+            _styled_msgbox(self, QMessageBox.Warning, "Fehler", "Ungültiges Zeitformat! Bitte verwenden Sie HH:MM (z.B. 08:00)").exec_()
             return
         
-        self.config.set('display.dpms_enabled', self.dpms_enabled_check.isChecked())
-        self.config.set('display.dpms_standby_minutes', self.dpms_standby_spin.value())
-        self.config.set('display.schedule_enabled', self.schedule_enabled_check.isChecked())
-        self.config.set('display.schedule_on_time', on_time if on_time else '08:00')
-        self.config.set('display.schedule_off_time', off_time if off_time else '22:00')
+        new_values = {
+            'display.dpms_enabled': self.dpms_enabled_check.isChecked(),
+            'display.dpms_standby_minutes': self.dpms_standby_spin.value(),
+            'display.schedule_enabled': self.schedule_enabled_check.isChecked(),
+            'display.schedule_on_time': on_time if on_time else '08:00',
+            'display.schedule_off_time': off_time if off_time else '22:00',
+        }
+        old_values = self.config.get_many(self._DEFAULTS)
+        changed = {key for key, value in new_values.items() if old_values[key] != value}
+        
+        # Nur bei tatsächlichen Änderungen schreiben und anwenden (xset/Timer sind nicht umsonst)
+        if not changed:
+            _styled_msgbox(self, QMessageBox.Information, "Keine Änderungen", "Die Einstellungen wurden nicht geändert.").exec_()
+            return
         
-        # Einstellungen sofort anwenden
+        self.config.update(new_values)
+        
+        # Kein apply_settings(): es wendet u.a. DPMS und Zeitsteuerung (verzögert) ein zweites
+        # Mal an, und Bildschirm-Einstellungen betreffen weder Slideshow noch Email-Checker
         if self.main_window:
-            self.main_window.apply_settings()
-            self.main_window.apply_dpms_settings()
-            self.main_window.setup_display_schedule()
-        
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Information)
-        msg.setWindowTitle("Erfolg")
-        msg.setText("Einstellungen wurden gespeichert und sofort angewendet.")
-        msg.setStyleSheet("QMessageBox { background-color: #2c3e50; color: #ecf0f1; } "
-                         "QMessageBox QLabel { color: #ecf0f1; font-size: 16px; } "
-                         "QPushButton { background-color: #3498db; color: white; padding: 10px 20px; border-radius: 8px; font-size: 16px; } "
-                         "QPushButton:hover { background-color: #2980b9; }")
-        msg.exec_()
+            if changed & self._DPMS_KEYS:
+                self.main_window.apply_dpms_settings()
+            if changed & self._SCHEDULE_KEYS:
+                self.main_window.setup_display_schedule()
+        
+        _styled_msgbox(self, QMessageBox.Information, "Erfolg", "Einstellungen wurden gespeichert und sofort angewendet.").exec_()
     
     def go_back(self):
         """Geht zurück zum Menü"""
@@ -3422,12 +4012,10 @@ class DisplaySettingsWidget(QWidget):
                 self.main_window.slideshow_widget.show()
             # Zeige Menü wieder an falls vorhanden (prüfe ob Widget noch existiert)
             if hasattr(self.main_window, 'current_menu') and self.main_window.current_menu:
-                try:
-                    # Prüfe ob Widget noch existiert (durch Zugriff auf eine Eigenschaft)
-                    _ = self.main_window.current_menu.isVisible()
+                if _alive(self.main_window.current_menu):
                     self.main_window.current_menu.show()
                     self.main_window.menu_visible = True
-                except RuntimeError:
+                else:
                     # Widget wurde bereits gelöscht, erstelle neues Menü
                     logger.debug("Menü-Widget wurde gelöscht, erstelle neues Menü")
                     self.main_window.current_menu = None
@@ -3436,33 +4024,126 @@ class DisplaySettingsWidget(QWidget):
         except Exception as e:
             logger.error(f"Fehler beim Zurückkehren zum Menü: {e}", exc_info=True)
 
+class _EmailIdleWorker(QObject):
+    """Hält eine IMAP-Sitzung offen und wartet per IDLE auf neue Emails (ein Login statt eines pro Minute)"""
+    images_downloaded = pyqtSignal(object, list)  # EmailHandler, [(Dateipfad, Absender, Betreff, Datum)]
+    
+    # IDLE deutlich vor dem Server-Timeout (29 Minuten laut RFC 2177) erneuern
+    _IDLE_RENEW_SECONDS = 5 * 60
+    # Wartezeit, wenn der Server kein IDLE kann oder die Verbindung fehlschlägt
+    _POLL_SECONDS = 60
+    
+    def __init__(self, handler: EmailHandler, download_dir: Path):
+        super().__init__()
+        self.handler = handler
+        self.download_dir = download_dir
+        self.settings_key = (handler.server, handler.username, handler.password, download_dir)
+        self._stop = threading.Event()
+        # Schützt _idling, damit stop() nur ein laufendes IDLE abbricht (nie einen Download)
+        self._idle_lock = threading.Lock()
+        self._idling = False
+        # Daemon-Thread: ein blockierendes IDLE hält das Beenden der Anwendung nicht auf
+        self._thread = threading.Thread(target=self._run, name='email-idle', daemon=True)
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        """Beendet die Schleife; ein laufendes IDLE wird sofort abgebrochen und die Sitzung abgemeldet"""
+        self._stop.set()
+        with self._idle_lock:
+            if self._idling:
+                self.handler.interrupt()
+    
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if not self.handler.connect():
+                    self._stop.wait(self._POLL_SECONDS)
+                    continue
+                # Ungelesene Emails abholen (auch nach jeder IDLE-Erneuerung, falls eine Meldung verloren ging)
+                downloaded = self.handler.check_for_new_images(self.download_dir)
+                if downloaded:
+                    # Auch nach stop() weitergeben - die Emails sind auf dem Server bereits gelöscht
+                    self.images_downloaded.emit(self.handler, downloaded)
+                if self.handler.supports_idle():
+                    with self._idle_lock:
+                        if self._stop.is_set():
+                            break
+                        self._idling = True
+                    try:
+                        self.handler.wait_for_new_mail(self._IDLE_RENEW_SECONDS)
+                    finally:
+                        with self._idle_lock:
+                            self._idling = False
+                else:
+                    self._stop.wait(self._POLL_SECONDS)
+            except Exception as e:
+                logger.error(f"Fehler beim Email-Check: {e}")
+                self._stop.wait(self._POLL_SECONDS)
+        self.handler.disconnect()
+
+# Stylesheet des Menü-Overlays; Titel und Buttons wählen ihre Regel über die Property "kind"
+_MENU_QSS = """
+    * { background-color: #1a1a2e; }
+    QLabel[kind="title"] { font-size: 28px; font-weight: bold; color: #ffffff; padding: 5px; }
+    QPushButton[kind="close"] {
+        font-size: 18px; font-weight: bold; color: white; background: #e74c3c; border: none;
+        border-radius: 18px; min-width: 45px; min-height: 45px;
+    }
+    QPushButton[kind="wifi"], QPushButton[kind="images"], QPushButton[kind="display"], QPushButton[kind="settings"] {
+        font-size: 22px; font-weight: bold; padding: 18px; background: #3498db; color: white; border: none; border-radius: 12px;
+    }
+    QPushButton[kind="images"] { background: #2ecc71; }
+    QPushButton[kind="display"] { background: #9b59b6; }
+    QPushButton[kind="settings"] { background: #95a5a6; }
+"""
+
 class MainWindow(QMainWindow):
     """Hauptfenster der Anwendung"""
+    # Ergebnis der Netzwerk-Abfragen aus dem Thread-Pool (thread-sicher per Signal)
+    wifi_state_ready = pyqtSignal(dict)
+    
+    # Ab diesem Alter (Sekunden) stößt das Menü eine Aktualisierung des Netzwerkstatus an
+    _wifi_info_ttl = 30.0
+    # IP-Abfrage läuft parallel zur SSID-Abfrage im Pool-Runnable
+    _NET_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='netprobe')
+    
     def __init__(self):
         super().__init__()
         self.config = ConfigManager()
+        cfg = self.config.get_many({
+            'display.width': 1024,
+            'display.height': 600,
+            'slideshow.sort_by': None,
+            'slideshow.shuffle': False,
+            'slideshow.interval_seconds': 10,
+            'slideshow.loop': True,
+            'paths.proxy_images': None,
+            'paths.original_images': None,
+        })
         self.image_processor = ImageProcessor(
-            target_width=self.config.get('display.width', 1024),
-            target_height=self.config.get('display.height', 600)
+            target_width=cfg['display.width'],
+            target_height=cfg['display.height']
         )
         # Bestimme Sortierung (Fallback auf shuffle für Kompatibilität)
-        sort_by = self.config.get('slideshow.sort_by', None)
+        sort_by = cfg['slideshow.sort_by']
         if sort_by is None:
             # Fallback: Verwende shuffle-Einstellung (für alte Configs)
-            if self.config.get('slideshow.shuffle', False):
+            if cfg['slideshow.shuffle']:
                 sort_by = "random"
             else:
                 sort_by = "transfer_time"
         
-        metadata_file = Path(self.config.get('paths.proxy_images')) / 'metadata.json'
+        proxy_dir = Path(cfg['paths.proxy_images'])
         self.slideshow = Slideshow(
-            proxy_dir=Path(self.config.get('paths.proxy_images')),
-            interval_seconds=self.config.get('slideshow.interval_seconds', 10),
-            shuffle=self.config.get('slideshow.shuffle', False),  # Deprecated
-            loop=self.config.get('slideshow.loop', True),
+            proxy_dir=proxy_dir,
+            interval_seconds=cfg['slideshow.interval_seconds'],
+            shuffle=cfg['slideshow.shuffle'],  # Deprecated
+            loop=cfg['slideshow.loop'],
             sort_by=sort_by,
-            original_dir=Path(self.config.get('paths.original_images')),
-            metadata_file=metadata_file
+            original_dir=Path(cfg['paths.original_images']),
+            metadata_file=proxy_dir / 'metadata.json'
         )
         
         self.setup_ui()
@@ -3472,20 +4153,38 @@ class MainWindow(QMainWindow):
         # QR-Code-Umschaltung: True = Web-Interface, False = iOS Shortcut
         self.qr_code_mode_web = True
         
-        # Initialisiere Slideshow SOFORT (nicht verzögert), damit das erste Bild schnell geladen wird
-        # Verwende QTimer.singleShot(0) um es im nächsten Event-Loop-Zyklus auszuführen
-        # Das stellt sicher, dass das Fenster bereits angezeigt wurde
-        QTimer.singleShot(0, self._initialize_slideshow)
+        # Zuletzt ermittelter Netzwerkstatus für das Menü: (Zeitstempel, Status)
+        self._wifi_info_cache = None
+        self._wifi_probe_running = False
+        self._wifi_info_placeholder = False
+        self.wifi_state_ready.connect(self._on_wifi_state_ready)
+        
+        # Zuletzt von der Zeitsteuerung gesetzter Bildschirmzustand (None = unbekannt)
+        self._dpms_is_on = None
+        
+        # apply_settings bündelt Aufrufe kurz hintereinander (z.B. mehrere Änderungen vom Webinterface)
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(80)
+        self._apply_timer.timeout.connect(self._do_apply_settings)
+        
+        # Slideshow wird beim ersten Anzeigen des Fensters initialisiert (siehe showEvent)
+        self._slideshow_initialized = False
         
         # Langwierige Initialisierungen verzögert starten (nachdem Fenster angezeigt wurde)
         QTimer.singleShot(200, self._delayed_initialization)
     
+    def showEvent(self, event):
+        """Initialisiert die Slideshow einmalig, sobald das Fenster angezeigt wird"""
+        super().showEvent(event)
+        if not self._slideshow_initialized:
+            self._slideshow_initialized = True
+            # Erst im nächsten Event-Loop-Zyklus, damit das Fenster bereits gezeichnet ist
+            QTimer.singleShot(0, self._initialize_slideshow)
+    
     def _initialize_slideshow(self):
         """Initialisiert die Slideshow und lädt das erste Bild"""
         try:
-            # Stelle sicher, dass das Fenster angezeigt wurde
-            QApplication.processEvents()
-            
             # Prüfe Bildanzahl - wenn 0, aktualisiere die Liste nochmal (falls Bilder hinzugefügt wurden)
             image_count = self.slideshow_widget.slideshow.get_image_count()
             if image_count == 0:
@@ -3516,19 +4215,9 @@ class MainWindow(QMainWindow):
         self.apply_dpms_settings()  # DPMS-Einstellungen beim Start anwenden
         self.setup_display_schedule()  # Zeitgesteuerte Ein/Ausschaltung einrichten
         
-        # Prüfe ob Bilder vorhanden sind und Slideshow aktualisieren falls nötig
-        # Das ist wichtig, falls Bilder hinzugefügt wurden während die Anwendung bereits lief
-        if hasattr(self, 'slideshow_widget') and self.slideshow_widget:
-            image_count = self.slideshow_widget.slideshow.get_image_count()
-            if image_count == 0:
-                # Keine Bilder beim Start - prüfe ob jetzt welche vorhanden sind
-                logger.info("Keine Bilder beim Start erkannt, prüfe erneut...")
-                self.slideshow_widget.slideshow._refresh_image_list()
-                new_count = self.slideshow_widget.slideshow.get_image_count()
-                if new_count > 0:
-                    logger.info(f"Bilder gefunden nach verzögerter Initialisierung: {new_count} Bilder")
-                    # Lade erstes Bild
-                    QTimer.singleShot(100, lambda: self.slideshow_widget.load_current_image(use_fade=False))
+        # Kein erneutes Einlesen der Bildliste: _initialize_slideshow hat sie beim Start bereits
+        # aktualisiert, neu hinzukommende Bilder meldet der File-Watcher über refresh_requested
+        # (SlideshowWidget.refresh lädt dann das erste Bild)
         
         logger.info("Verzögerte Initialisierungen abgeschlossen")
     
@@ -3538,8 +4227,8 @@ class MainWindow(QMainWindow):
         self.setStyleSheet("background-color: #1a1a2e;")
         self.setAutoFillBackground(True)
         palette = self.palette()
-        palette.setColor(self.backgroundRole(), QColor("#1a1a2e"))
-        palette.setColor(self.foregroundRole(), QColor("#ffffff"))
+        palette.setColor(self.backgroundRole(), _BG_COLOR)
+        palette.setColor(self.foregroundRole(), _FG_COLOR)
         self.setPalette(palette)
         
         # Vollbild-Modus
@@ -3566,7 +4255,7 @@ class MainWindow(QMainWindow):
         self.stacked.setStyleSheet("background-color: #1a1a2e;")
         self.stacked.setAutoFillBackground(True)
         stacked_palette = self.stacked.palette()
-        stacked_palette.setColor(self.stacked.backgroundRole(), QColor("#1a1a2e"))
+        stacked_palette.setColor(self.stacked.backgroundRole(), _BG_COLOR)
         self.stacked.setPalette(stacked_palette)
         self.setCentralWidget(self.stacked)
         
@@ -3602,7 +4291,7 @@ class MainWindow(QMainWindow):
         
         # Overlay-Widget für Menü (nicht transparent)
         menu_widget = QWidget(self)
-        menu_widget.setStyleSheet("background-color: #1a1a2e;")  # Dunkles Blau-Grau
+        menu_widget.setStyleSheet(_MENU_QSS)  # Dunkles Blau-Grau
         menu_layout = QVBoxLayout()
         menu_layout.setContentsMargins(15, 10, 15, 10)  # Reduziertes Padding
         menu_layout.setSpacing(10)  # Reduzierter Abstand
@@ -3611,11 +4300,11 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(0, 0, 0, 0)
         title = QLabel("MENU")
-        title.setStyleSheet("font-size: 28px; font-weight: bold; color: #ffffff; padding: 5px;")
+        title.setProperty("kind", "title")
         header_layout.addWidget(title)
         header_layout.addStretch()
         close_btn = QPushButton("X")
-        close_btn.setStyleSheet("font-size: 18px; font-weight: bold; color: white; background: #e74c3c; border: none; border-radius: 18px; min-width: 45px; min-height: 45px;")
+        close_btn.setProperty("kind", "close")
         close_btn.clicked.connect(lambda: self.close_menu(menu_widget))
         header_layout.addWidget(close_btn)
         menu_layout.addLayout(header_layout)
@@ -3631,25 +4320,25 @@ class MainWindow(QMainWindow):
         
         # WLAN-Einstellungen Button
         wifi_btn = QPushButton("WLAN-Einstellungen")
-        wifi_btn.setStyleSheet("font-size: 22px; font-weight: bold; padding: 18px; background: #3498db; color: white; border: none; border-radius: 12px;")
+        wifi_btn.setProperty("kind", "wifi")
         wifi_btn.clicked.connect(lambda: self.show_wifi_settings(menu_widget))
         button_layout.addWidget(wifi_btn)
         
         # Bildverwaltung Button
         images_btn = QPushButton("Bilder verwalten")
-        images_btn.setStyleSheet("font-size: 22px; font-weight: bold; padding: 18px; background: #2ecc71; color: white; border: none; border-radius: 12px;")
+        images_btn.setProperty("kind", "images")
         images_btn.clicked.connect(lambda: self.show_image_management(menu_widget))
         button_layout.addWidget(images_btn)
         
         # Bildschirm-Einstellungen Button
         display_btn = QPushButton("Bildschirm-Einstellungen")
-        display_btn.setStyleSheet("font-size: 22px; font-weight: bold; padding: 18px; background: #9b59b6; color: white; border: none; border-radius: 12px;")
+        display_btn.setProperty("kind", "display")
         display_btn.clicked.connect(lambda: self.show_display_settings(menu_widget))
         button_layout.addWidget(display_btn)
         
         # Einstellungen Button
         settings_btn = QPushButton("Einstellungen")
-        settings_btn.setStyleSheet("font-size: 22px; font-weight: bold; padding: 18px; background: #95a5a6; color: white; border: none; border-radius: 12px;")
+        settings_btn.setProperty("kind", "settings")
         settings_btn.clicked.connect(lambda: self.show_settings(menu_widget))
         button_layout.addWidget(settings_btn)
         
@@ -3663,46 +4352,98 @@ class MainWindow(QMainWindow):
         self.current_menu = menu_widget
         self.menu_wifi_info_widget = wifi_info_widget  # Speichere Referenz für Updates
     
-    def update_wifi_info_in_menu(self):
+    def update_wifi_info_in_menu(self, force_refresh: bool = True):
         """Aktualisiert das WLAN-Info-Widget im aktuellen Menü"""
         if hasattr(self, 'current_menu') and self.current_menu:
-            try:
-                # Prüfe ob Widget noch existiert
-                _ = self.current_menu.isVisible()
-            except RuntimeError:
+            if not _alive(self.current_menu):
                 # Widget wurde bereits gelöscht
                 logger.debug("Menü-Widget wurde gelöscht, kann WLAN-Info nicht aktualisieren")
                 return
             
-            # Finde das WLAN-Info-Widget im Menü-Layout
             menu_layout = self.current_menu.layout()
-            if menu_layout:
-                # Durchsuche alle Widgets im Layout
-                for i in range(menu_layout.count()):
-                    item = menu_layout.itemAt(i)
-                    if item and item.widget():
-                        widget = item.widget()
-                        # Prüfe ob es das WLAN-Info-Widget ist (hat ObjectName oder ist vom Typ QWidget mit bestimmten Eigenschaften)
-                        if widget.objectName() == 'wifi_info_widget' or (isinstance(widget, QWidget) and widget.styleSheet() and 'WLAN-Verbindung' in str(widget.findChildren(QLabel))):
-                            # Erstelle neues Widget mit aktuellen Daten
-                            new_wifi_info = self.create_wifi_info_widget()
-                            new_wifi_info.setObjectName('wifi_info_widget')
-                            
-                            # Ersetze das alte Widget
-                            menu_layout.removeWidget(widget)
-                            widget.deleteLater()
-                            menu_layout.insertWidget(i, new_wifi_info)
-                            self.menu_wifi_info_widget = new_wifi_info
-                            logger.info("WLAN-Info im Menü aktualisiert")
-                            return
+            if not menu_layout:
+                return
+            
+            # Direkt über die gespeicherte Referenz ersetzen (kein Durchsuchen des Widget-Baums)
+            old = getattr(self, 'menu_wifi_info_widget', None)
+            index = menu_layout.indexOf(old) if _alive(old) else -1
+            # Nach den WLAN-Einstellungen kann sich die Verbindung geändert haben - dann neu ermitteln
+            new_wifi_info = self.create_wifi_info_widget(force_refresh)
+            new_wifi_info.setObjectName('wifi_info_widget')
+            if index < 0:
                 # Falls nicht gefunden, füge es am Anfang hinzu (nach Header)
                 logger.warning("WLAN-Info-Widget nicht gefunden, füge neu hinzu")
-                new_wifi_info = self.create_wifi_info_widget()
-                new_wifi_info.setObjectName('wifi_info_widget')
                 menu_layout.insertWidget(1, new_wifi_info)  # Nach Header (Index 0)
-                self.menu_wifi_info_widget = new_wifi_info
+            else:
+                menu_layout.insertWidget(index, new_wifi_info)
+                menu_layout.removeWidget(old)
+                old.deleteLater()
+                logger.info("WLAN-Info im Menü aktualisiert")
+            self.menu_wifi_info_widget = new_wifi_info
     
-    def create_wifi_info_widget(self):
+    def _cached_wifi_state(self, force_refresh: bool = False) -> Optional[dict]:
+        """
+        Gibt den zuletzt ermittelten Netzwerkstatus zurück (abgefragt wird nur beim Öffnen des Menüs)
+        
+        Ist er älter als _wifi_info_ttl, wird er zusätzlich im Hintergrund neu ermittelt.
+        Bei force_refresh oder ohne bisheriges Ergebnis wird None zurückgegeben;
+        das Menü wird nach Abschluss der Abfrage aktualisiert.
+        """
+        cached = self._wifi_info_cache
+        if force_refresh or not cached:
+            self._refresh_wifi_state()
+            return None
+        if time.monotonic() - cached[0] >= self._wifi_info_ttl:
+            self._refresh_wifi_state()
+        return cached[1]
+    
+    def _refresh_wifi_state(self):
+        """Ermittelt SSID und IP im Thread-Pool (die Abfragen laufen parallel)"""
+        if self._wifi_probe_running:
+            return
+        self._wifi_probe_running = True
+        
+        def probe():
+            # Ohne Ergebnis-Signal bliebe _wifi_probe_running gesetzt - daher immer einen Status senden
+            state = {'ssid': "Nicht verbunden", 'hostname': "Unbekannt", 'ip': "Nicht verbunden"}
+            try:
+                # IP parallel ermitteln, SSID direkt in diesem Runnable (belegt keinen weiteren Pool-Platz untätig)
+                ip_future = MainWindow._NET_PROBE_EXECUTOR.submit(_probe_ip)
+                try:
+                    state['hostname'] = socket.gethostname()
+                except Exception:
+                    pass
+                state['ssid'] = _probe_ssid()
+                state['ip'] = ip_future.result()
+            except Exception as e:
+                logger.error(f"Fehler beim Ermitteln des Netzwerkstatus: {e}")
+            finally:
+                self.wifi_state_ready.emit(state)
+        
+        try:
+            QThreadPool.globalInstance().start(_TaskRunnable(probe))
+        except Exception as e:
+            logger.error(f"Netzwerkstatus-Abfrage konnte nicht gestartet werden: {e}")
+            self._wifi_probe_running = False
+    
+    def _on_wifi_state_ready(self, state: dict):
+        """Übernimmt den neu ermittelten Netzwerkstatus und aktualisiert ein geöffnetes Menü"""
+        self._wifi_probe_running = False
+        try:
+            self._apply_wifi_state(state)
+        except Exception as e:
+            logger.error(f"Fehler beim Aktualisieren der WLAN-Info: {e}", exc_info=True)
+    
+    def _apply_wifi_state(self, state: dict):
+        """Speichert den Netzwerkstatus und baut das WLAN-Widget im Menü bei Bedarf neu auf"""
+        previous = self._wifi_info_cache
+        self._wifi_info_cache = (time.monotonic(), state)
+        # Menü nur neu aufbauen, wenn es Platzhalter zeigt oder sich etwas geändert hat
+        if self._wifi_info_placeholder or previous is None or previous[1] != state:
+            if _alive(getattr(self, 'menu_wifi_info_widget', None)):
+                self.update_wifi_info_in_menu(force_refresh=False)
+    
+    def create_wifi_info_widget(self, force_refresh: bool = False):
         """Erstellt Widget mit WLAN-Verbindungsinfo und QR-Code"""
         widget = QWidget()
         widget.setStyleSheet("background: #2c3e50; border-radius: 12px; padding: 10px; margin: 5px 0; border: 2px solid #34495e;")
@@ -3717,63 +4458,24 @@ class MainWindow(QMainWindow):
         title.setStyleSheet("font-size: 16px; font-weight: bold; color: #ecf0f1; padding: 2px 0;")
         left_layout.addWidget(title)
         
-        # WLAN-SSID
-        try:
-            # Versuche SSID über iwgetid oder nmcli zu bekommen
-            result = subprocess.run(['iwgetid', '-r'], capture_output=True, text=True, timeout=2)
-            if result.returncode == 0 and result.stdout.strip():
-                ssid = result.stdout.strip()
-            else:
-                # Fallback: nmcli (Format: "yes:SSID" oder "nein:")
-                result = subprocess.run(['nmcli', '-t', '-f', 'active,ssid', 'dev', 'wifi'], 
-                                      capture_output=True, text=True, timeout=2)
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    ssid = "Nicht verbunden"
-                    for line in lines:
-                        # Prüfe auf "yes:" (aktiv) oder "ja:" (deutsch)
-                        if line.startswith('yes:') or line.startswith('ja:'):
-                            parts = line.split(':', 1)
-                            if len(parts) > 1 and parts[1]:
-                                ssid = parts[1]
-                                break
-        except Exception as e:
-            # SSID konnte nicht abgerufen werden
-            ssid = "Nicht verbunden"
+        # Netzwerkstatus (gecacht; fehlt er, werden Platzhalter angezeigt, bis die Abfrage fertig ist)
+        state = self._cached_wifi_state(force_refresh)
+        self._wifi_info_placeholder = state is None
+        if state is None:
+            ssid = hostname = ip_text = "Ermittle…"
+        else:
+            ssid = state['ssid']
+            hostname = state['hostname']
+            ip_text = state['ip']
         
         ssid_label = QLabel(f"WLAN: {ssid}")
         ssid_label.setStyleSheet("font-size: 14px; color: #bdc3c7; padding: 1px 0;")
         left_layout.addWidget(ssid_label)
         
-        # Hostname
-        try:
-            hostname = socket.gethostname()
-        except:
-            hostname = "Unbekannt"
-        
         hostname_label = QLabel(f"Hostname: {hostname}")
         hostname_label.setStyleSheet("font-size: 14px; color: #bdc3c7; padding: 1px 0;")
         left_layout.addWidget(hostname_label)
         
-        # IP-Adresse
-        try:
-            # Hole alle IP-Adressen
-            result = subprocess.run(['hostname', '-I'], capture_output=True, text=True, timeout=2)
-            ip_addresses = result.stdout.strip().split()
-            if ip_addresses:
-                ip_text = ip_addresses[0]  # Erste IP verwenden
-            else:
-                ip_text = "Nicht verbunden"
-        except:
-            try:
-                # Fallback: Socket-Methode
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.connect(("8.8.8.8", 80))
-                ip_text = s.getsockname()[0]
-                s.close()
-            except:
-                ip_text = "Nicht verbunden"
-        
         ip_label = QLabel(f"IP: {ip_text}")
         ip_label.setStyleSheet("font-size: 14px; color: #bdc3c7; padding: 1px 0;")
         left_layout.addWidget(ip_label)
@@ -3784,33 +4486,16 @@ class MainWindow(QMainWindow):
         layout.addWidget(left_widget)
         
         # Rechte Hälfte: QR-Code
-        if QRCODE_AVAILABLE and ip_text != "Nicht verbunden":
+        if QRCODE_AVAILABLE and state is not None and ip_text != "Nicht verbunden":
             try:
                 # Erstelle beide QR-Codes
                 port = self.config.get('web.port', 80)
                 web_url = f"http://{ip_text}:{port}"
                 shortcut_url = "https://www.icloud.com/shortcuts/489dca9cfbac49fa8d682db488b964f4"
                 
-                # Funktion zum Erstellen eines QR-Codes
-                def create_qr_code(data):
-                    qr = qrcode.QRCode(version=1, box_size=4, border=2)
-                    qr.add_data(data)
-                    qr.make(fit=True)
-                    img = qr.make_image(fill_color="#ecf0f1", back_color="#2c3e50")
-                    img_bytes = io.BytesIO()
-                    img.save(img_bytes, format='PNG')
-                    img_bytes.seek(0)
-                    qimage = QImage()
-                    qimage.loadFromData(img_bytes.read())
-                    qpixmap = QPixmap.fromImage(qimage)
-                    max_size = 120
-                    if qpixmap.width() > max_size or qpixmap.height() > max_size:
-                        qpixmap = qpixmap.scaled(max_size, max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    return qpixmap
-                
-                # Erstelle beide QR-Codes
-                web_qr_pixmap = create_qr_code(web_url)
-                shortcut_qr_pixmap = create_qr_code(shortcut_url)
+                # Erstelle beide QR-Codes (gecacht, solange sich die URLs nicht ändern)
+                web_qr_pixmap = _qr_pixmap_for(web_url)
+                shortcut_qr_pixmap = _qr_pixmap_for(shortcut_url)
                 
                 # Funktion zum Umschalten des QR-Codes
                 def toggle_qr_code():
@@ -3875,7 +4560,7 @@ class MainWindow(QMainWindow):
             wifi_widget.setAutoFillBackground(True)  # Stelle sicher, dass Hintergrund nicht transparent ist
             # Stelle sicher, dass Palette gesetzt ist
             palette = wifi_widget.palette()
-            palette.setColor(wifi_widget.backgroundRole(), QColor("#1a1a2e"))
+            palette.setColor(wifi_widget.backgroundRole(), _BG_COLOR)
             wifi_widget.setPalette(palette)
             wifi_widget.raise_()  # Nach vorne bringen
             wifi_widget.show()
@@ -3905,8 +4590,8 @@ class MainWindow(QMainWindow):
             image_widget.setStyleSheet("background-color: #1a1a2e;")
             image_widget.setAutoFillBackground(True)
             palette = image_widget.palette()
-            palette.setColor(image_widget.backgroundRole(), QColor("#1a1a2e"))
-            palette.setColor(image_widget.foregroundRole(), QColor("#ffffff"))
+            palette.setColor(image_widget.backgroundRole(), _BG_COLOR)
+            palette.setColor(image_widget.foregroundRole(), _FG_COLOR)
             image_widget.setPalette(palette)
             image_widget.raise_()  # Nach vorne bringen
             image_widget.show()
@@ -3934,8 +4619,8 @@ class MainWindow(QMainWindow):
             display_widget.setStyleSheet("background-color: #1a1a2e;")
             display_widget.setAutoFillBackground(True)
             palette = display_widget.palette()
-            palette.setColor(display_widget.backgroundRole(), QColor("#1a1a2e"))
-            palette.setColor(display_widget.foregroundRole(), QColor("#ffffff"))
+            palette.setColor(display_widget.backgroundRole(), _BG_COLOR)
+            palette.setColor(display_widget.foregroundRole(), _FG_COLOR)
             display_widget.setPalette(palette)
             display_widget.raise_()
             display_widget.show()
@@ -3988,18 +4673,34 @@ class MainWindow(QMainWindow):
         self.menu_timer.stop()
     
     def setup_email_checker(self):
-        """Richtet den Email-Checker ein"""
-        # Stoppe alten Timer, falls vorhanden
-        if hasattr(self, 'email_timer') and self.email_timer:
-            self.email_timer.stop()
-            self.email_timer.deleteLater()
-        
-        # Email-Checker: 1x pro Minute (60000 ms)
-        check_interval = 60 * 1000  # 1 Minute in Millisekunden
-        self.email_timer = QTimer()
-        self.email_timer.timeout.connect(self.check_emails)
-        self.email_timer.start(check_interval)
-        logger.info(f"Email-Checker gestartet mit Intervall: 1 Minute")
+        """Richtet den Email-Checker ein (die IMAP-Sitzung bleibt offen, neue Emails meldet der Server per IDLE)"""
+        cfg = self.config.get_many({
+            'email.imap_server': None,
+            'email.username': None,
+            'email.password': None,
+            'paths.original_images': None,
+        })
+        imap_server = cfg['email.imap_server']
+        username = cfg['email.username']
+        password = cfg['email.password']
+        download_dir = Path(cfg['paths.original_images'])
+        
+        # Laufende Sitzung behalten, solange sich die Zugangsdaten nicht geändert haben
+        worker = getattr(self, 'email_worker', None)
+        if worker is not None:
+            if worker.settings_key == (imap_server, username, password, download_dir):
+                return
+            worker.stop()
+            self.email_worker = None
+        
+        if not all([imap_server, username, password]):
+            logger.info("Email-Checker nicht gestartet (keine Zugangsdaten konfiguriert)")
+            return
+        
+        self.email_worker = _EmailIdleWorker(EmailHandler(imap_server, 993, username, password), download_dir)
+        self.email_worker.images_downloaded.connect(self._process_downloaded_images)
+        self.email_worker.start()
+        logger.info("Email-Checker gestartet (IMAP IDLE)")
     
     def setup_file_watcher(self):
         """Richtet den File-Watcher für automatische Bilderkennung ein"""
@@ -4020,10 +4721,14 @@ class MainWindow(QMainWindow):
             self.file_watcher = None
     
     def apply_settings(self):
+        """Wendet geänderte Einstellungen an (kurz hintereinander folgende Aufrufe werden zu einem Durchlauf gebündelt)"""
+        self._apply_timer.start()
+    
+    def _do_apply_settings(self):
         """Wendet geänderte Einstellungen sofort an"""
         # Verhindere rekursive Aufrufe
         if hasattr(self, '_applying_settings') and self._applying_settings:
-            logger.warning("apply_settings() bereits in Ausführung, überspringe rekursiven Aufruf")
+            logger.warning("_do_apply_settings() bereits in Ausführung, überspringe rekursiven Aufruf")
             return
         
         self._applying_settings = True
@@ -4150,22 +4855,16 @@ class MainWindow(QMainWindow):
             # Konvertiere Minuten in Sekunden für xset
             standby_seconds = standby_minutes * 60 if standby_minutes > 0 else 0
             
-            # Setze DISPLAY-Umgebungsvariable
-            display = os.environ.get('DISPLAY', ':0')
-            env = os.environ.copy()
-            env['DISPLAY'] = display
+            # xset dpms ändert den Bildschirmzustand - die Zeitsteuerung setzt ihn beim nächsten Prüfen neu
+            self._dpms_is_on = None
             
+            # Alle Optionen in einem xset-Aufruf (xset verarbeitet sie der Reihe nach)
             if dpms_enabled and standby_seconds > 0:
                 # Aktiviere DPMS und setze Standby-Zeit
                 # xset dpms <standby> <suspend> <off>
                 # Wir setzen nur Standby, suspend und off bleiben bei 0 (deaktiviert)
-                cmd = ['xset', 'dpms', str(standby_seconds), '0', '0']
-                result = subprocess.run(cmd, env=env, 
-                                      capture_output=True, text=True, timeout=5)
+                result = _xset('dpms', str(standby_seconds), '0', '0', '+dpms')
                 if result.returncode == 0:
-                    # Aktiviere DPMS explizit
-                    subprocess.run(['xset', '+dpms'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
                     logger.info(f"DPMS aktiviert: Bildschirm schaltet nach {standby_minutes} Minuten aus ({standby_seconds}s)")
                 else:
                     logger.warning(f"Fehler beim Aktivieren von DPMS: {result.stderr}")
@@ -4176,23 +4875,11 @@ class MainWindow(QMainWindow):
                 if schedule_enabled:
                     # Wenn Zeitsteuerung aktiv ist, DPMS aktiviert lassen (aber ohne Standby)
                     # Setze Standby auf sehr hohen Wert (24 Stunden), damit nur Zeitsteuerung greift
-                    subprocess.run(['xset', 'dpms', '86400', '0', '0'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    subprocess.run(['xset', '+dpms'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    subprocess.run(['xset', 's', 'off'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    subprocess.run(['xset', 's', 'noblank'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
+                    _xset('dpms', '86400', '0', '0', '+dpms', 's', 'off', 's', 'noblank')
                     logger.info("DPMS aktiviert für Zeitsteuerung (Standby: 24h), X11 Screensaver deaktiviert")
                 else:
                     # Deaktiviere DPMS und X11 Screensaver komplett
-                    subprocess.run(['xset', '-dpms'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    subprocess.run(['xset', 's', 'off'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    subprocess.run(['xset', 's', 'noblank'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
+                    _xset('-dpms', 's', 'off', 's', 'noblank')
                     logger.info("DPMS und X11 Screensaver deaktiviert: Bildschirm bleibt immer an")
         except FileNotFoundError:
             logger.warning("xset nicht gefunden - DPMS kann nicht konfiguriert werden")
@@ -4208,6 +4895,9 @@ class MainWindow(QMainWindow):
                 self.display_schedule_timer.stop()
                 self.display_schedule_timer.deleteLater()
             
+            # Neue Zeiten/Einstellungen: Bildschirmzustand beim nächsten Prüfen in jedem Fall setzen
+            self._dpms_is_on = None
+            
             if schedule_enabled:
                 # Timer, der jede Minute prüft
                 self.display_schedule_timer = QTimer()
@@ -4246,11 +4936,6 @@ class MainWindow(QMainWindow):
             on_time_minutes = on_hour * 60 + on_minute
             off_time_minutes = off_hour * 60 + off_minute
             
-            # Setze DISPLAY-Umgebungsvariable
-            display = os.environ.get('DISPLAY', ':0')
-            env = os.environ.copy()
-            env['DISPLAY'] = display
-            
             # Prüfe ob Bildschirm ein- oder ausgeschaltet werden soll
             if on_time_minutes == off_time_minutes:
                 # Gleiche Zeiten = deaktiviert
@@ -4268,52 +4953,35 @@ class MainWindow(QMainWindow):
                 should_be_on = current_time_minutes >= on_time_minutes or current_time_minutes < off_time_minutes
                 logger.debug(f"Zeitsteuerung über Mitternacht: Einschaltung {on_time_str}, Ausschaltung {off_time_str} (nächster Tag)")
             
-            # Für zeitgesteuerte Ein/Ausschaltung muss DPMS aktiviert sein
-            # Aktiviere DPMS temporär, falls es deaktiviert ist
-            subprocess.run(['xset', '+dpms'], env=env, 
-                         capture_output=True, text=True, timeout=5)
-            
-            # Prüfe aktuellen DPMS-Status, um unnötige Befehle zu vermeiden
-            # Dies verhindert kurze schwarze Bildschirme, wenn der Bildschirm bereits an ist
-            dpms_status = subprocess.run(['xset', 'q'], env=env, 
-                                       capture_output=True, text=True, timeout=5)
-            dpms_enabled = '+dpms' in dpms_status.stdout if dpms_status.returncode == 0 else False
+            # Außerhalb der Einschaltzeit genügt ein Ausschalten beim Wechsel; innerhalb wird "an"
+            # jede Minute bestätigt (ein xset-Aufruf statt xset +dpms, xset q und force),
+            # damit ein zwischenzeitlich abgeschalteter Bildschirm wieder angeht
+            if not should_be_on and self._dpms_is_on is False:
+                return
+            transition = should_be_on != self._dpms_is_on
             
+            # Für zeitgesteuerte Ein/Ausschaltung muss DPMS aktiviert sein (+dpms vor dem force)
             if should_be_on:
-                # Bildschirm sollte an sein
-                # Aktiviere DPMS falls nötig und schalte Bildschirm ein
-                # Auch wenn DPMS deaktiviert war, aktivieren wir es für die Zeitsteuerung
-                subprocess.run(['xset', '+dpms'], env=env, 
-                             capture_output=True, text=True, timeout=5)
-                
                 # Schalte Bildschirm ein
-                result = subprocess.run(['xset', 'dpms', 'force', 'on'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
+                result = _xset('+dpms', 'dpms', 'force', 'on')
                 if result.returncode == 0:
-                    logger.info(f"Bildschirm eingeschaltet (Zeitsteuerung: {on_time_str}-{off_time_str})")
+                    if transition:
+                        logger.info(f"Bildschirm eingeschaltet (Zeitsteuerung: {on_time_str}-{off_time_str})")
                 else:
                     logger.warning(f"Fehler beim Einschalten des Bildschirms: {result.stderr}")
                     # Fallback: Versuche mit xset -dpms und dann wieder +dpms
-                    subprocess.run(['xset', '-dpms'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    subprocess.run(['xset', '+dpms'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    subprocess.run(['xset', 'dpms', 'force', 'on'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
+                    result = _xset('-dpms', '+dpms', 'dpms', 'force', 'on')
                     logger.info(f"Bildschirm eingeschaltet (Fallback-Methode)")
             else:
                 # Bildschirm sollte aus sein
-                if dpms_enabled:
-                    subprocess.run(['xset', 'dpms', 'force', 'off'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
+                result = _xset('+dpms', 'dpms', 'force', 'off')
+                if result.returncode == 0:
                     logger.info(f"Bildschirm ausgeschaltet (Zeitsteuerung: {on_time_str}-{off_time_str})")
                 else:
-                    # DPMS ist deaktiviert, schalte es ein und dann aus
-                    subprocess.run(['xset', '+dpms'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    subprocess.run(['xset', 'dpms', 'force', 'off'], env=env, 
-                                 capture_output=True, text=True, timeout=5)
-                    logger.info(f"Bildschirm ausgeschaltet (Zeitsteuerung: {on_time_str}-{off_time_str})")
+                    logger.warning(f"Fehler beim Ausschalten des Bildschirms: {result.stderr}")
+            
+            # Bei Fehlern nichts merken, damit der nächste Durchlauf es erneut versucht
+            self._dpms_is_on = should_be_on if result.returncode == 0 else None
         except Exception as e:
             logger.error(f"Fehler beim Prüfen der Zeitsteuerung: {e}")
     
@@ -4343,87 +5011,64 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Fehler beim Prüfen der Settings-Queue: {e}")
     
-    def check_emails(self):
-        """Prüft auf neue Emails"""
-        imap_server = self.config.get('email.imap_server')
-        username = self.config.get('email.username')
-        password = self.config.get('email.password')
-        
-        if not all([imap_server, username, password]):
-            return
-        
+    def _process_downloaded_images(self, email_handler: EmailHandler, downloaded: list):
+        """Verarbeitet die vom Email-Checker heruntergeladenen Bilder (im GUI-Thread)"""
         try:
-            email_handler = EmailHandler(imap_server, 993, username, password)
-            if email_handler.connect():
-                download_dir = Path(self.config.get('paths.original_images'))
-                downloaded = email_handler.check_for_new_images(download_dir)
-                
-                # Heruntergeladene Bilder verarbeiten
-                processed_senders = set()
-                proxy_dir = Path(self.config.get('paths.proxy_images'))
-                metadata_file = proxy_dir / 'metadata.json'
-                
-                for image_path, sender, subject, date_str in downloaded:
-                    if self.image_processor.is_supported(image_path):
-                        # Bild verarbeiten
-                        proxy_path = self.image_processor.process_image(image_path, proxy_dir)
-                        logger.info(f"Bild verarbeitet: {image_path}")
-                        
-                        # EXIF-Daten extrahieren und speichern
-                        exif_data = ExifExtractor.extract_all_exif(image_path)
-                        
-                        # Metadaten speichern
-                        proxy_hash = proxy_path.stem
-                        metadata = {}
-                        if metadata_file.exists():
-                            try:
-                                with open(metadata_file, 'r', encoding='utf-8') as f:
-                                    metadata = json.load(f)
-                            except Exception as e:
-                                logger.error(f"Fehler beim Laden der Metadaten: {e}")
-                                metadata = {}
-                        
-                        metadata[proxy_hash] = {
-                            'sender': sender,
-                            'subject': subject,
-                            'date': exif_data.get('date') or date_str,  # EXIF-Datum hat Priorität
-                            'location': exif_data.get('location'),  # Stadt (Land)
-                            'latitude': exif_data.get('latitude'),
-                            'longitude': exif_data.get('longitude'),
-                            'exif_data': exif_data  # Vollständige EXIF-Daten für Sortierung
-                        }
-                        
+            # Heruntergeladene Bilder verarbeiten
+            processed_senders = set()
+            proxy_dir = Path(self.config.get('paths.proxy_images'))
+            metadata_file = proxy_dir / 'metadata.json'
+            
+            for image_path, sender, subject, date_str in downloaded:
+                if self.image_processor.is_supported(image_path):
+                    # Bild verarbeiten
+                    proxy_path = self.image_processor.process_image(image_path, proxy_dir)
+                    logger.info(f"Bild verarbeitet: {image_path}")
+                    
+                    # EXIF-Daten extrahieren und speichern
+                    exif_data = ExifExtractor.extract_all_exif(image_path)
+                    
+                    # Metadaten speichern (über den gemeinsamen Cache, atomar geschrieben)
+                    proxy_hash = proxy_path.stem
+                    entry = {
+                        'sender': sender,
+                        'subject': subject,
+                        'date': exif_data.get('date') or date_str,  # EXIF-Datum hat Priorität
+                        'location': exif_data.get('location'),  # Stadt (Land)
+                        'latitude': exif_data.get('latitude'),
+                        'longitude': exif_data.get('longitude'),
+                        'exif_data': exif_data,  # Vollständige EXIF-Daten für Sortierung
+                        'orig_size': image_path.stat().st_size,  # Für schnelle Original-Suche
+                        'orig_fast_hash': self.image_processor._get_file_hash_fast(image_path),
+                        'original_path': str(image_path.resolve())  # Direktes Löschen ohne Suche
+                    }
+                    
+                    if MetadataCache.for_file(metadata_file).set(proxy_hash, entry):
+                        logger.info(f"Metadaten gespeichert für {proxy_hash}: sender={sender}, subject={subject[:30] if subject else ''}")
                         try:
-                            metadata_file.parent.mkdir(parents=True, exist_ok=True)
-                            with open(metadata_file, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                            logger.info(f"Metadaten gespeichert für {proxy_hash}: sender={sender}, subject={subject[:30] if subject else ''}")
-                            
                             # Playlists aktualisieren
-                            playlist_manager = PlaylistManager(proxy_dir, metadata_file)
+                            playlist_manager = PlaylistManager.for_dir(proxy_dir, metadata_file)
                             playlist_manager.add_image(proxy_hash)
                         except Exception as e:
-                            logger.error(f"Fehler beim Speichern der Metadaten: {e}")
-                        
-                        processed_senders.add(sender)
-                
-                # Automatische Antworten senden
-                if processed_senders and self.config.get('email.auto_reply', False):
-                    reply_message = self.config.get('email.reply_message', 'Bild erfolgreich empfangen und zum Bilderrahmen hinzugefügt!')
-                    for sender in processed_senders:
-                        email_handler.send_reply(
-                            recipient=sender,
-                            subject='Bild empfangen - Picture Frame',
-                            message=reply_message
-                        )
-                
-                if downloaded:
-                    self.slideshow.refresh()
-                    self.slideshow_widget.refresh()
-                
-                email_handler.disconnect()
+                            logger.error(f"Fehler beim Aktualisieren der Playlists: {e}")
+                    
+                    processed_senders.add(sender)
+            
+            # Automatische Antworten senden
+            if processed_senders and self.config.get('email.auto_reply', False):
+                reply_message = self.config.get('email.reply_message', 'Bild erfolgreich empfangen und zum Bilderrahmen hinzugefügt!')
+                for sender in processed_senders:
+                    email_handler.send_reply(
+                        recipient=sender,
+                        subject='Bild empfangen - Picture Frame',
+                        message=reply_message
+                    )
+            
+            if downloaded:
+                self.slideshow.refresh()
+                self.slideshow_widget.refresh()
         except Exception as e:
-            logger.error(f"Fehler beim Email-Check: {e}")
+            logger.error(f"Fehler beim Verarbeiten der Email-Bilder: {e}")
 
 def main():
     """Hauptfunktion"""
@@ -0,0 +1,136 @@
+"""
+Metadaten-Cache für Picture Frame
+Hält metadata.json geparst im Speicher und liest die Datei nur neu, wenn sie sich geändert hat
+"""
+from pathlib import Path
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Prüfe orjson (schnellere JSON-Kodierung, optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logging.info("orjson library nicht verfügbar. Metadaten werden mit json verarbeitet.")
+
+def loads_metadata(data: bytes) -> dict:
+    """Dekodiert den Inhalt einer metadata.json"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+def dumps_metadata(metadata: dict) -> bytes:
+    """Kodiert Metadaten kompakt als UTF-8 (ohne Einrückung)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(metadata)
+    return json.dumps(metadata, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+class MetadataCache:
+    """Gemeinsamer, lazy geladener Cache für eine metadata.json"""
+
+    _instances: Dict[Path, 'MetadataCache'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, metadata_file: Path):
+        self.metadata_file = Path(metadata_file)
+        self._metadata: Dict[str, dict] = {}
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_file(cls, metadata_file: Path) -> 'MetadataCache':
+        """Gibt die gemeinsame Cache-Instanz für eine Metadaten-Datei zurück"""
+        key = Path(metadata_file).resolve()
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls(key)
+                cls._instances[key] = instance
+            return instance
+
+    def _stat_state(self) -> Optional[Tuple[int, int]]:
+        """Liefert (mtime_ns, Größe) der Datei oder None, wenn sie nicht existiert"""
+        try:
+            stat = self.metadata_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _ensure_loaded(self):
+        """Liest die Datei nur neu, wenn sie seit dem letzten Laden verändert wurde (z.B. vom Webinterface)"""
+        state = self._stat_state()
+        if state == self._file_state:
+            return
+        if state is None:
+            self._metadata = {}
+        else:
+            with open(self.metadata_file, 'rb') as f:
+                self._metadata = loads_metadata(f.read())
+        self._file_state = state
+
+    def get(self, image_hash: str) -> dict:
+        """Gibt die Metadaten eines Bildes zurück (leeres Dict, falls nicht vorhanden)"""
+        with self._lock:
+            try:
+                self._ensure_loaded()
+            except Exception as e:
+                logger.error(f"Fehler beim Laden der Metadaten: {e}")
+                return {}
+            return self._metadata.get(image_hash, {})
+
+    def _write(self):
+        """Schreibt die Metadaten atomar (einmal kodiert, ein write, dann os.replace)"""
+        data = dumps_metadata(self._metadata)
+        tmp_file = self.metadata_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        # Ein abgebrochener Schreibvorgang lässt die alte metadata.json unversehrt
+        os.replace(tmp_file, self.metadata_file)
+        self._file_state = self._stat_state()
+    
+    def set(self, image_hash: str, entry: dict) -> bool:
+        """Speichert die Metadaten eines Bildes (atomarer Schreibvorgang, gibt den Erfolg zurück)"""
+        return self.set_many({image_hash: entry})
+    
+    def set_many(self, entries: Dict[str, dict]) -> bool:
+        """Speichert die Metadaten mehrerer Bilder mit einem einzigen Schreibvorgang (gibt den Erfolg zurück)"""
+        with self._lock:
+            try:
+                self._ensure_loaded()
+                self._metadata.update(entries)
+                self._write()
+                return True
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern der Metadaten: {e}")
+                # Beim nächsten Zugriff sicher neu von der Platte lesen
+                self._file_state = None
+                return False
+    
+    def delete(self, image_hash: str) -> bool:
+        """Entfernt die Metadaten eines Bildes; schreibt die Datei nur, wenn der Eintrag existierte"""
+        return self.delete_many([image_hash]) > 0
+    
+    def delete_many(self, image_hashes) -> int:
+        """Entfernt die Metadaten mehrerer Bilder mit einem einzigen Schreibvorgang (gibt die Anzahl zurück)"""
+        with self._lock:
+            try:
+                self._ensure_loaded()
+                removed = 0
+                for image_hash in image_hashes:
+                    if image_hash in self._metadata:
+                        del self._metadata[image_hash]
+                        removed += 1
+                if removed:
+                    self._write()
+                return removed
+            except Exception as e:
+                logger.error(f"Fehler beim Löschen der Metadaten: {e}")
+                # Beim nächsten Zugriff sicher neu von der Platte lesen
+                self._file_state = None
+                return 0
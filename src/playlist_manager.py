@@ -7,20 +7,37 @@ import json
 import logging
 import os
 import random
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from metadata_cache import MetadataCache
+
 logger = logging.getLogger(__name__)
 
 class PlaylistManager:
     """Verwaltet Playlist-Dateien für verschiedene Sortierungen"""
     
+    _instances: Dict[Tuple[Path, Path], 'PlaylistManager'] = {}
+    _instances_lock = threading.Lock()
+    
     def __init__(self, proxy_dir: Path, metadata_file: Path):
         self.proxy_dir = proxy_dir
         self.metadata_file = metadata_file
         self.playlist_dir = proxy_dir / 'playlists'
         self.playlist_dir.mkdir(exist_ok=True)
     
+    @classmethod
+    def for_dir(cls, proxy_dir: Path, metadata_file: Path) -> 'PlaylistManager':
+        """Gibt die gemeinsame Instanz für ein Proxy-Verzeichnis zurück (statt pro Aufruf neu anzulegen)"""
+        key = (Path(proxy_dir).resolve(), Path(metadata_file).resolve())
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls(Path(proxy_dir), Path(metadata_file))
+                cls._instances[key] = instance
+            return instance
+    
     def get_playlist_file(self, sort_by: str) -> Path:
         """Gibt den Pfad zur Playlist-Datei für eine Sortierung zurück"""
         return self.playlist_dir / f"playlist_{sort_by}.json"
@@ -39,18 +56,16 @@ class PlaylistManager:
         elif sort_by == "creation_time":
             # Sortierung nach Erstellungszeit aus EXIF-Metadaten
             try:
-                if self.metadata_file.exists():
-                    with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                        image_metadata = metadata.get(image_hash, {})
-                        
-                        # Prüfe EXIF-Daten
-                        exif_data = image_metadata.get('exif_data', {})
-                        if exif_data and exif_data.get('date'):
-                            try:
-                                return datetime.fromisoformat(exif_data['date']).timestamp()
-                            except (ValueError, TypeError):
-                                pass
+                # Gemeinsamer Metadaten-Cache statt metadata.json pro Bild neu zu parsen
+                image_metadata = MetadataCache.for_file(self.metadata_file).get(image_hash)
+                
+                # Prüfe EXIF-Daten
+                exif_data = image_metadata.get('exif_data', {})
+                if exif_data and exif_data.get('date'):
+                    try:
+                        return datetime.fromisoformat(exif_data['date']).timestamp()
+                    except (ValueError, TypeError):
+                        pass
                 
                 # Fallback: Verwende Datei-Modifikationszeit
                 return os.path.getmtime(image_path) if image_path.exists() else 0
@@ -121,6 +136,13 @@ class PlaylistManager:
     
     def remove_image(self, image_hash: str):
         """Entfernt ein Bild aus allen Playlists"""
+        self.remove_images([image_hash])
+    
+    def remove_images(self, image_hashes):
+        """Entfernt mehrere Bilder aus allen Playlists (jede Playlist wird nur einmal gelesen und geschrieben)"""
+        hashes = set(image_hashes)
+        if not hashes:
+            return
         for sort_type in ["transfer_time", "creation_time", "random"]:
             playlist_file = self.get_playlist_file(sort_type)
             if playlist_file.exists():
@@ -128,8 +150,8 @@ class PlaylistManager:
                     with open(playlist_file, 'r', encoding='utf-8') as f:
                         playlist = json.load(f)
                     
-                    # Entferne Bild aus Playlist
-                    playlist = [item for item in playlist if item.get('hash') != image_hash]
+                    # Entferne Bilder aus Playlist
+                    playlist = [item for item in playlist if item.get('hash') not in hashes]
                     
                     with open(playlist_file, 'w', encoding='utf-8') as f:
                         json.dump(playlist, f, indent=2)
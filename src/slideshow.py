@@ -79,7 +79,7 @@ class Slideshow:
         # Verwende PlaylistManager für schnelles Laden
         try:
             from playlist_manager import PlaylistManager
-            playlist_manager = PlaylistManager(self.proxy_dir, self.metadata_file)
+            playlist_manager = PlaylistManager.for_dir(self.proxy_dir, self.metadata_file)
             
             # Lade Playlist für aktuelle Sortierung
             image_hashes = playlist_manager.get_playlist(self.sort_by)
@@ -182,7 +182,7 @@ class Slideshow:
         # Das verhindert unnötige Speicher-Allokationen
         try:
             from playlist_manager import PlaylistManager
-            playlist_manager = PlaylistManager(self.proxy_dir, self.metadata_file)
+            playlist_manager = PlaylistManager.for_dir(self.proxy_dir, self.metadata_file)
             
             # Lade aktualisierte Playlist
             image_hashes = playlist_manager.get_playlist(self.sort_by)
@@ -8,7 +8,6 @@ import logging
 import shutil
 from werkzeug.utils import secure_filename
 import os
-import json
 from datetime import datetime
 from functools import lru_cache
 from PIL import Image
@@ -17,9 +16,10 @@ import zipfile
 import subprocess
 
 from config_manager import ConfigManager
-from image_processor import ImageProcessor
+from image_processor import ImageProcessor, find_original_file
 from exif_extractor import ExifExtractor
 from playlist_manager import PlaylistManager
+from metadata_cache import MetadataCache
 import threading
 import time
 import queue
@@ -143,15 +143,8 @@ class WebInterface:
                 proxy_dir = Path(self.config.get('paths.proxy_images'))
                 metadata_file = proxy_dir / 'metadata.json'
                 
-                # Lade Metadaten einmal (wird für alle Bilder verwendet)
+                # Neue Metadaten sammeln und einmal für den ganzen Batch speichern
                 metadata = {}
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    except Exception as e:
-                        logger.error(f"Fehler beim Laden der Metadaten: {e}")
-                        metadata = {}
                 
                 # Verarbeite jedes Bild nacheinander (nicht parallel!)
                 for item in batch:
@@ -176,7 +169,10 @@ class WebInterface:
                             'location': exif_data.get('location'),
                             'latitude': exif_data.get('latitude'),
                             'longitude': exif_data.get('longitude'),
-                            'exif_data': exif_data
+                            'exif_data': exif_data,
+                            'orig_size': original_path.stat().st_size,  # Für schnelle Original-Suche
+                            'orig_fast_hash': self.image_processor._get_file_hash_fast(original_path),
+                            'original_path': str(original_path.resolve())  # Direktes Löschen ohne Suche
                         }
                         
                         # Speicherfreigabe nach jedem Bild
@@ -187,18 +183,15 @@ class WebInterface:
                         logger.error(f"Fehler beim Verarbeiten von {original_path}: {e}", exc_info=True)
                         continue
                 
-                # Speichere Metadaten einmal für alle Bilder im Batch
-                try:
+                # Speichere Metadaten einmal für alle Bilder im Batch (gemeinsamer Cache, atomar geschrieben)
+                if metadata:
                     metadata_file.parent.mkdir(parents=True, exist_ok=True)
-                    with open(metadata_file, 'w', encoding='utf-8') as f:
-                        json.dump(metadata, f, indent=2, ensure_ascii=False)
-                    logger.info(f"Metadaten gespeichert für {batch_size} Bilder")
-                except Exception as e:
-                    logger.error(f"Fehler beim Speichern der Metadaten: {e}", exc_info=True)
+                    if MetadataCache.for_file(metadata_file).set_many(metadata):
+                        logger.info(f"Metadaten gespeichert für {len(metadata)} Bilder")
                 
                 # Playlists aktualisieren (einmal für alle neuen Bilder im Batch)
                 try:
-                    playlist_manager = PlaylistManager(proxy_dir, metadata_file)
+                    playlist_manager = PlaylistManager.for_dir(proxy_dir, metadata_file)
                     for item in batch:
                         try:
                             original_path = item['original_path']
@@ -437,43 +430,29 @@ class WebInterface:
                 
                 # Hash des Proxy-Bildes (Dateiname ohne Extension ist der Hash)
                 proxy_hash = proxy_file.stem
+                metadata_file = proxy_dir / 'metadata.json'
+                metadata_cache = MetadataCache.for_file(metadata_file)
                 
                 # Proxy-Datei löschen
-                proxy_file.unlink()
+                proxy_file.unlink(missing_ok=True)
                 logger.info(f"Proxy-Datei gelöscht: {proxy_file.name}")
                 
-                # Original-Datei finden und löschen
-                original_found = False
-                for orig_file in original_dir.rglob("*"):
-                    if orig_file.is_file():
-                        # Prüfe ob Hash übereinstimmt
-                        orig_hash = self.image_processor._get_file_hash(orig_file)
-                        if orig_hash == proxy_hash:
-                            orig_file.unlink()
-                            logger.info(f"Original-Datei gelöscht: {orig_file.name}")
-                            original_found = True
-                            break
-                
-                if not original_found:
+                # Original-Datei finden (über gespeicherten Pfad, sonst Suche) und löschen
+                orig_file = find_original_file(original_dir, proxy_hash, metadata_cache.get(proxy_hash),
+                                               self.image_processor)
+                if orig_file is not None:
+                    orig_file.unlink(missing_ok=True)
+                    logger.info(f"Original-Datei gelöscht: {orig_file.name}")
+                else:
                     logger.warning(f"Original-Datei für {proxy_file.name} nicht gefunden (Hash: {proxy_hash})")
                 
                 # Metadaten löschen
-                metadata_file = proxy_dir / 'metadata.json'
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                        if proxy_hash in metadata:
-                            del metadata[proxy_hash]
-                            with open(metadata_file, 'w', encoding='utf-8') as f:
-                                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                            logger.info(f"Metadaten für {proxy_file.name} gelöscht")
-                    except Exception as e:
-                        logger.error(f"Fehler beim Löschen der Metadaten: {e}")
+                if metadata_cache.delete(proxy_hash):
+                    logger.info(f"Metadaten für {proxy_file.name} gelöscht")
                 
                 # Playlists aktualisieren
                 try:
-                    playlist_manager = PlaylistManager(proxy_dir, metadata_file)
+                    playlist_manager = PlaylistManager.for_dir(proxy_dir, metadata_file)
                     playlist_manager.remove_image(proxy_hash)
                 except Exception as e:
                     logger.warning(f"Fehler beim Aktualisieren der Playlists: {e}")
@@ -484,14 +463,13 @@ class WebInterface:
                 
                 # Thumbnail auch löschen falls vorhanden
                 thumbnail_path = self.thumbnail_dir / secure_filename(filename)
-                if thumbnail_path.exists():
-                    try:
-                        thumbnail_path.unlink()
-                    except Exception:
-                        # Thumbnail konnte nicht gelöscht werden
-                        pass
+                try:
+                    thumbnail_path.unlink(missing_ok=True)
+                except Exception:
+                    # Thumbnail konnte nicht gelöscht werden
+                    pass
                 
-                return jsonify({'success': True, 'proxy_deleted': True, 'original_deleted': original_found})
+                return jsonify({'success': True, 'proxy_deleted': True, 'original_deleted': orig_file is not None})
             except Exception as e:
                 logger.error(f"Fehler beim Löschen: {e}", exc_info=True)
                 return jsonify({'success': False, 'error': str(e)}), 500
@@ -511,6 +489,7 @@ class WebInterface:
                 proxy_dir = Path(self.config.get('paths.proxy_images'))
                 original_dir = Path(self.config.get('paths.original_images'))
                 metadata_file = proxy_dir / 'metadata.json'
+                metadata_cache = MetadataCache.for_file(metadata_file)
                 
                 deleted_count = 0
                 errors = []
@@ -525,49 +504,32 @@ class WebInterface:
                         proxy_hash = proxy_file.stem
                         
                         # Proxy-Datei löschen
-                        proxy_file.unlink()
+                        proxy_file.unlink(missing_ok=True)
                         logger.info(f"Proxy-Datei gelöscht: {proxy_file.name}")
                         
-                        # Original-Datei finden und löschen
-                        original_found = False
-                        for orig_file in original_dir.rglob("*"):
-                            if orig_file.is_file():
-                                try:
-                                    orig_hash = self.image_processor._get_file_hash(orig_file)
-                                    if orig_hash == proxy_hash:
-                                        orig_file.unlink()
-                                        logger.info(f"Original-Datei gelöscht: {orig_file.name}")
-                                        original_found = True
-                                        break
-                                except Exception:
-                                    continue
+                        # Original-Datei finden (über gespeicherten Pfad, sonst Suche) und löschen
+                        orig_file = find_original_file(original_dir, proxy_hash, metadata_cache.get(proxy_hash),
+                                                       self.image_processor)
+                        if orig_file is not None:
+                            orig_file.unlink(missing_ok=True)
+                            logger.info(f"Original-Datei gelöscht: {orig_file.name}")
                         
                         # Metadaten löschen
-                        if metadata_file.exists():
-                            try:
-                                with open(metadata_file, 'r', encoding='utf-8') as f:
-                                    metadata = json.load(f)
-                                if proxy_hash in metadata:
-                                    del metadata[proxy_hash]
-                                    with open(metadata_file, 'w', encoding='utf-8') as f:
-                                        json.dump(metadata, f, indent=2, ensure_ascii=False)
-                            except Exception as e:
-                                logger.warning(f"Fehler beim Löschen der Metadaten: {e}")
+                        metadata_cache.delete(proxy_hash)
                         
                         # Playlists aktualisieren
                         try:
-                            playlist_manager = PlaylistManager(proxy_dir, metadata_file)
+                            playlist_manager = PlaylistManager.for_dir(proxy_dir, metadata_file)
                             playlist_manager.remove_image(proxy_hash)
                         except Exception as e:
                             logger.warning(f"Fehler beim Aktualisieren der Playlists: {e}")
                         
                         # Thumbnail löschen
                         thumbnail_path = self.thumbnail_dir / secure_filename(filename)
-                        if thumbnail_path.exists():
-                            try:
-                                thumbnail_path.unlink()
-                            except Exception:
-                                pass
+                        try:
+                            thumbnail_path.unlink(missing_ok=True)
+                        except Exception:
+                            pass
                         
                         deleted_count += 1
                     except Exception as e:
@@ -789,56 +751,58 @@ class WebInterface:
             try:
                 data = request.json
                 
-                # Validierte Updates
+                # Validierte Updates (gesammelt und mit einem Schreibvorgang gespeichert)
+                updates = {}
                 if 'slideshow' in data:
                     if 'auto_play' in data['slideshow']:
-                        self.config.set('slideshow.auto_play', bool(data['slideshow']['auto_play']))
+                        updates['slideshow.auto_play'] = bool(data['slideshow']['auto_play'])
                     if 'interval_seconds' in data['slideshow']:
-                        self.config.set('slideshow.interval_seconds', int(data['slideshow']['interval_seconds']))
+                        updates['slideshow.interval_seconds'] = int(data['slideshow']['interval_seconds'])
                     if 'transition_duration' in data['slideshow']:
-                        self.config.set('slideshow.transition_duration', float(data['slideshow']['transition_duration']))
+                        updates['slideshow.transition_duration'] = float(data['slideshow']['transition_duration'])
                     if 'sort_by' in data['slideshow']:
                         sort_by = str(data['slideshow']['sort_by'])
                         if sort_by in ['transfer_time', 'creation_time', 'random']:
-                            self.config.set('slideshow.sort_by', sort_by)
+                            updates['slideshow.sort_by'] = sort_by
                             # Für Kompatibilität: shuffle entsprechend setzen
-                            self.config.set('slideshow.shuffle', (sort_by == "random"))
+                            updates['slideshow.shuffle'] = (sort_by == "random")
                     if 'shuffle' in data['slideshow']:
                         # Deprecated: shuffle wird durch sort_by ersetzt
                         shuffle_enabled = bool(data['slideshow']['shuffle'])
-                        self.config.set('slideshow.shuffle', shuffle_enabled)
+                        updates['slideshow.shuffle'] = shuffle_enabled
                         # Wenn sort_by nicht gesetzt ist, setze es basierend auf shuffle
                         if 'sort_by' not in data['slideshow']:
-                            self.config.set('slideshow.sort_by', "random" if shuffle_enabled else "transfer_time")
+                            updates['slideshow.sort_by'] = "random" if shuffle_enabled else "transfer_time"
                     if 'loop' in data['slideshow']:
-                        self.config.set('slideshow.loop', bool(data['slideshow']['loop']))
+                        updates['slideshow.loop'] = bool(data['slideshow']['loop'])
                 
                 if 'email' in data:
                     if 'imap_server' in data['email']:
-                        self.config.set('email.imap_server', data['email']['imap_server'])
+                        updates['email.imap_server'] = data['email']['imap_server']
                     if 'username' in data['email']:
-                        self.config.set('email.username', data['email']['username'])
+                        updates['email.username'] = data['email']['username']
                     if 'password' in data['email']:
-                        self.config.set('email.password', data['email']['password'])
+                        updates['email.password'] = data['email']['password']
                     if 'check_interval_minutes' in data['email']:
-                        self.config.set('email.check_interval_minutes', int(data['email']['check_interval_minutes']))
+                        updates['email.check_interval_minutes'] = int(data['email']['check_interval_minutes'])
                     if 'auto_reply' in data['email']:
-                        self.config.set('email.auto_reply', bool(data['email']['auto_reply']))
+                        updates['email.auto_reply'] = bool(data['email']['auto_reply'])
                     if 'reply_message' in data['email']:
-                        self.config.set('email.reply_message', data['email']['reply_message'])
+                        updates['email.reply_message'] = data['email']['reply_message']
                 
                 if 'display' in data:
                     if 'dpms_enabled' in data['display']:
-                        self.config.set('display.dpms_enabled', bool(data['display']['dpms_enabled']))
+                        updates['display.dpms_enabled'] = bool(data['display']['dpms_enabled'])
                     if 'dpms_standby_minutes' in data['display']:
-                        self.config.set('display.dpms_standby_minutes', int(data['display']['dpms_standby_minutes']))
+                        updates['display.dpms_standby_minutes'] = int(data['display']['dpms_standby_minutes'])
                     if 'schedule_enabled' in data['display']:
-                        self.config.set('display.schedule_enabled', bool(data['display']['schedule_enabled']))
+                        updates['display.schedule_enabled'] = bool(data['display']['schedule_enabled'])
                     if 'schedule_on_time' in data['display']:
-                        self.config.set('display.schedule_on_time', str(data['display']['schedule_on_time']))
+                        updates['display.schedule_on_time'] = str(data['display']['schedule_on_time'])
                     if 'schedule_off_time' in data['display']:
-                        self.config.set('display.schedule_off_time', str(data['display']['schedule_off_time']))
+                        updates['display.schedule_off_time'] = str(data['display']['schedule_off_time'])
                 
+                self.config.update(updates)
                 
                 # Signalisiere, dass Einstellungen aktualisiert wurden (über Queue)
                 if self.settings_queue:
@@ -1267,10 +1231,7 @@ class WebInterface:
                 
                 # Teste Email-Verbindung
                 from email_handler import EmailHandler
-                email_handler = EmailHandler(server=imap_server, port=993, username=username, password=password)
-                
-                if email_handler.connect():
-                    email_handler.disconnect()
+                if EmailHandler.test_login(imap_server, 993, username, password):
                     return jsonify({'success': True, 'message': 'Email-Verbindung erfolgreich'})
                 else:
                     return jsonify({'success': False, 'error': 'Verbindung fehlgeschlagen'}), 400
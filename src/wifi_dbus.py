@@ -0,0 +1,212 @@
+"""
+WLAN-Scan und -Verbindung über die D-Bus-API von NetworkManager
+Spricht NetworkManager direkt an, statt nmcli-Prozesse zu starten
+"""
+import logging
+import subprocess
+import time
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Prüfe D-Bus-Library (python3-dbus)
+try:
+    import dbus
+    DBUS_AVAILABLE = True
+except ImportError:
+    DBUS_AVAILABLE = False
+    logging.info("dbus library nicht verfügbar. WLAN-Scan verwendet nmcli.")
+
+NM_BUS_NAME = 'org.freedesktop.NetworkManager'
+NM_PATH = '/org/freedesktop/NetworkManager'
+NM_DEVICE_IFACE = 'org.freedesktop.NetworkManager.Device'
+NM_WIRELESS_IFACE = 'org.freedesktop.NetworkManager.Device.Wireless'
+NM_AP_IFACE = 'org.freedesktop.NetworkManager.AccessPoint'
+NM_SETTINGS_PATH = '/org/freedesktop/NetworkManager/Settings'
+NM_SETTINGS_IFACE = 'org.freedesktop.NetworkManager.Settings'
+NM_CONNECTION_IFACE = 'org.freedesktop.NetworkManager.Settings.Connection'
+NM_ACTIVE_IFACE = 'org.freedesktop.NetworkManager.Connection.Active'
+DBUS_PROPS_IFACE = 'org.freedesktop.DBus.Properties'
+
+NM_DEVICE_TYPE_WIFI = 2
+NM_802_11_AP_FLAGS_PRIVACY = 0x1
+NM_ACTIVE_CONNECTION_STATE_ACTIVATED = 2
+NM_ACTIVE_CONNECTION_STATE_DEACTIVATED = 4
+
+
+def _security_label(flags: int, wpa_flags: int, rsn_flags: int) -> str:
+    """Leitet eine nmcli-ähnliche Sicherheitsangabe aus den Access-Point-Flags ab"""
+    labels = []
+    if wpa_flags:
+        labels.append("WPA1")
+    if rsn_flags:
+        labels.append("WPA2")
+    if not labels and flags & NM_802_11_AP_FLAGS_PRIVACY:
+        labels.append("WEP")
+    return " ".join(labels)
+
+
+def _request_scan(bus, device_path, timeout: float) -> bool:
+    """Startet einen Rescan und wartet, bis NetworkManager LastScan aktualisiert hat"""
+    device = bus.get_object(NM_BUS_NAME, device_path)
+    props = dbus.Interface(device, DBUS_PROPS_IFACE)
+    last_scan = props.Get(NM_WIRELESS_IFACE, 'LastScan')
+
+    try:
+        dbus.Interface(device, NM_WIRELESS_IFACE).RequestScan({})
+    except dbus.DBusException as e:
+        # Ohne PolicyKit-Berechtigung: Rescan wie bisher über sudo nmcli anstoßen
+        logger.debug(f"RequestScan nicht erlaubt ({e}), versuche sudo nmcli rescan")
+        try:
+            result = subprocess.run(['sudo', '-n', 'nmcli', 'dev', 'wifi', 'rescan'],
+                                    capture_output=True, text=True, timeout=5)
+        except Exception:
+            return False
+        if result.returncode != 0:
+            return False
+
+    # Auf Abschluss des Scans warten (statt fester Wartezeit)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if props.Get(NM_WIRELESS_IFACE, 'LastScan') != last_scan:
+            return True
+        time.sleep(0.2)
+    logger.warning("WLAN-Rescan nicht innerhalb des Timeouts abgeschlossen")
+    return False
+
+
+def scan_access_points(timeout: float = 5.0) -> Optional[List[dict]]:
+    """
+    Scannt über D-Bus nach WLAN-Netzwerken
+
+    Returns:
+        Liste von Dicts mit 'ssid', 'signal' (int, Prozent) und 'security' (wie aus nmcli),
+        oder None, wenn D-Bus/NetworkManager nicht verfügbar ist
+    """
+    if not DBUS_AVAILABLE:
+        return None
+
+    try:
+        bus = dbus.SystemBus()
+        nm = dbus.Interface(bus.get_object(NM_BUS_NAME, NM_PATH), NM_BUS_NAME)
+
+        networks = []
+        wifi_found = False
+        for device_path in nm.GetDevices():
+            device = bus.get_object(NM_BUS_NAME, device_path)
+            props = dbus.Interface(device, DBUS_PROPS_IFACE)
+            if int(props.Get(NM_DEVICE_IFACE, 'DeviceType')) != NM_DEVICE_TYPE_WIFI:
+                continue
+            wifi_found = True
+
+            if _request_scan(bus, device_path, timeout):
+                logger.info("Rescan erfolgreich (D-Bus)")
+            else:
+                logger.warning("Aktiver Scan nicht möglich, verwende gecachte Netzwerkliste")
+
+            for ap_path in dbus.Interface(device, NM_WIRELESS_IFACE).GetAllAccessPoints():
+                try:
+                    ap = dbus.Interface(bus.get_object(NM_BUS_NAME, ap_path), DBUS_PROPS_IFACE).GetAll(NM_AP_IFACE)
+                except dbus.DBusException:
+                    # Access Point ist zwischenzeitlich verschwunden
+                    continue
+                ssid = bytes(bytearray(ap['Ssid'])).decode('utf-8', 'replace')
+                networks.append({
+                    'ssid': ssid or "Verstecktes Netzwerk",
+                    'signal': int(ap['Strength']),
+                    'security': _security_label(int(ap['Flags']), int(ap['WpaFlags']), int(ap['RsnFlags']))
+                })
+
+        if not wifi_found:
+            logger.warning("D-Bus: Kein WLAN-Gerät gefunden")
+            return None
+
+        logger.info(f"D-Bus: {len(networks)} Access Points gefunden")
+        return networks
+    except Exception as e:
+        logger.warning(f"WLAN-Scan über D-Bus fehlgeschlagen, verwende nmcli: {e}")
+        return None
+
+
+def _find_wifi_device(bus, nm) -> Optional[str]:
+    """Gibt den D-Bus-Pfad des ersten WLAN-Geräts zurück"""
+    for device_path in nm.GetDevices():
+        props = dbus.Interface(bus.get_object(NM_BUS_NAME, device_path), DBUS_PROPS_IFACE)
+        if int(props.Get(NM_DEVICE_IFACE, 'DeviceType')) == NM_DEVICE_TYPE_WIFI:
+            return device_path
+    return None
+
+
+def _delete_connections_named(bus, name: str):
+    """Löscht alle gespeicherten Verbindungen mit der angegebenen ID"""
+    settings = dbus.Interface(bus.get_object(NM_BUS_NAME, NM_SETTINGS_PATH), NM_SETTINGS_IFACE)
+    for conn_path in settings.ListConnections():
+        conn = dbus.Interface(bus.get_object(NM_BUS_NAME, conn_path), NM_CONNECTION_IFACE)
+        if conn.GetSettings().get('connection', {}).get('id') == name:
+            conn.Delete()
+
+
+def connect_wifi(ssid: str, password: str, timeout: float = 30.0) -> Optional[Tuple[bool, str]]:
+    """
+    Legt über D-Bus ein WLAN-Profil an und aktiviert es
+
+    Das Profil wird wie bisher mit autoconnect, autoconnect-priority 10
+    und deaktiviertem Power-Management angelegt.
+
+    Returns:
+        (True, "") bei Erfolg, (False, Fehlermeldung) wenn die Aktivierung fehlschlägt,
+        oder None, wenn D-Bus nicht verfügbar/erlaubt ist (dann nmcli verwenden)
+    """
+    if not DBUS_AVAILABLE:
+        return None
+
+    try:
+        bus = dbus.SystemBus()
+        nm = dbus.Interface(bus.get_object(NM_BUS_NAME, NM_PATH), NM_BUS_NAME)
+        device_path = _find_wifi_device(bus, nm)
+        if device_path is None:
+            logger.warning("D-Bus: Kein WLAN-Gerät gefunden")
+            return None
+
+        # Vorhandenes Profil mit gleichem Namen entfernen
+        _delete_connections_named(bus, ssid)
+
+        connection = {
+            'connection': {
+                'id': ssid,
+                'type': '802-11-wireless',
+                'autoconnect': True,
+                'autoconnect-priority': dbus.Int32(10),
+            },
+            '802-11-wireless': {
+                'ssid': dbus.ByteArray(ssid.encode('utf-8')),
+                'mode': 'infrastructure',
+                'powersave': dbus.UInt32(2),
+            },
+            'ipv4': {'method': 'auto'},
+            'ipv6': {'method': 'auto'},
+        }
+        if password and password.strip():
+            connection['802-11-wireless-security'] = {'key-mgmt': 'wpa-psk', 'psk': password}
+
+        _, active_path = nm.AddAndActivateConnection(connection, device_path, dbus.ObjectPath('/'))
+    except Exception as e:
+        # Typischerweise fehlende PolicyKit-Berechtigung - nmcli mit sudo übernimmt
+        logger.warning(f"WLAN-Verbindung über D-Bus nicht möglich, verwende nmcli: {e}")
+        return None
+
+    # Auf Aktivierung warten
+    deadline = time.monotonic() + timeout
+    try:
+        active = dbus.Interface(bus.get_object(NM_BUS_NAME, active_path), DBUS_PROPS_IFACE)
+        while time.monotonic() < deadline:
+            state = int(active.Get(NM_ACTIVE_IFACE, 'State'))
+            if state == NM_ACTIVE_CONNECTION_STATE_ACTIVATED:
+                return True, ""
+            if state == NM_ACTIVE_CONNECTION_STATE_DEACTIVATED:
+                return False, "Verbindung fehlgeschlagen (falsches Passwort?)"
+            time.sleep(0.25)
+    except dbus.DBusException:
+        # Aktive Verbindung ist verschwunden - Aktivierung ist fehlgeschlagen
+        return False, "Verbindung fehlgeschlagen (falsches Passwort?)"
+    return False, "Verbindungs-Timeout. Bitte erneut versuchen."